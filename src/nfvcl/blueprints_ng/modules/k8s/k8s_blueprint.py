@@ -11,8 +11,7 @@ from nfvcl.blueprints_ng.modules.k8s.config.k8s_dayN_configurator import VmK8sDa
 from nfvcl_core.blueprints.blueprint_ng import BlueprintNGState, BlueprintNG
 from nfvcl_core.blueprints.blueprint_type_manager import blueprint_type, day2_function
 from nfvcl_core.utils.k8s.helm_plugin_manager import HelmPluginManager
-from nfvcl_core.utils.k8s.k8s_utils import get_k8s_config_from_file_content
-from nfvcl_core.utils.k8s.kube_api_utils_class import KubeApiUtils
+from nfvcl_core.utils.k8s.k8s_client_cache import k8s_client_cache
 from nfvcl_common.utils.api_utils import HttpRequestType
 from nfvcl_core_models.k8s_management_models import Labels
 from nfvcl_core_models.monitoring.monitoring import BlueprintMonitoringDefinition, GrafanaDashboard
@@ -161,15 +160,18 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
         if create_model.enable_multus:
             self.check_multus_requisites()
 
+        vms_to_create: List[VmResource] = []
         area: K8sAreaDeployment
         for area in create_model.areas:  # In each area we deploy workers and in the core area also the master (there is always a core area containing the master)
             if area.is_master_area:
                 self.state.master_area = area
                 self.state.require_port_security_disabled = create_model.require_port_security_disabled
-                self.deploy_master_node(area, create_model.master_flavors)
+                vms_to_create.append(self.deploy_master_node(area, create_model.master_flavors))
             if len(area.load_balancer_pools_ips) > 0:
                 self.state.load_balancer_ips_area[str(area.area_id)] = area.load_balancer_pools_ips
-            self.deploy_area(area)
+            vms_to_create.extend(self.deploy_area(area))
+        # The VMs of every area are created in parallel
+        self.provider.create_vms(vms_to_create)
 
         # If multus is enabled check that the interfaces have the same name across all nodes
         if create_model.enable_multus:
@@ -276,7 +278,16 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
                 self.state.base_image_url = BASE_IMAGE22_URL
                 self.state.base_image_name = BASE_IMAGE22
 
-    def deploy_master_node(self, area: K8sAreaDeployment, master_flavors: VmResourceFlavor):
+    def deploy_master_node(self, area: K8sAreaDeployment, master_flavors: VmResourceFlavor) -> VmResource:
+        """
+        Define and register the master node, the VM is NOT created.
+        Args:
+            area: The master area
+            master_flavors: The flavor of the master VM
+
+        Returns:
+            The master VM to be created
+        """
         # Defining Master node. Should be executed only once.
         self.state.vm_master = VmResource(
             area=area.area_id,
@@ -291,15 +302,23 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
         )
         # Registering master node
         self.register_resource(self.state.vm_master)
-        # Creating the VM
-        self.provider.create_vm(self.state.vm_master)
         # Creating the configurator for the master
         self.state.day_0_master_configurator = VmK8sDay0Configurator(vm_resource=self.state.vm_master, vm_number=0)
         self.state.day_2_master_configurator = VmK8sDay2Configurator(vm_resource=self.state.vm_master)
         self.register_resource(self.state.day_0_master_configurator)
         self.register_resource(self.state.day_2_master_configurator)
+        return self.state.vm_master
 
-    def deploy_area(self, area: K8sAreaDeployment):
+    def deploy_area(self, area: K8sAreaDeployment) -> List[VmResource]:
+        """
+        Define and register the workers of the area, the VMs are NOT created.
+        Args:
+            area: The area in which the workers are deployed
+
+        Returns:
+            The worker VMs to be created
+        """
+        area_workers: List[VmResource] = []
         for worker_replica_num in range(0, area.worker_replicas):
             # Workers of area X
             worker_number = self.state.reserve_worker_number()
@@ -315,10 +334,9 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
                 require_port_security_disabled=self.state.require_port_security_disabled
             )
             self.state.vm_workers.append(vm)
-            # Registering master node
+            # Registering worker node
             self.register_resource(vm)
-            # Creating the VM
-            self.provider.create_vm(vm)
+            area_workers.append(vm)
 
             configurator = VmK8sDay0Configurator(vm_resource=vm, vm_number=worker_number)
             self.state.day_0_workers_configurators.append(configurator)
@@ -333,6 +351,7 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
                     self.state.attached_networks.append(additional_network)
         if area not in self.state.area_list:
             self.state.area_list.append(area)
+        return area_workers
 
     def setup_load_balancer_pool(self):
         """
@@ -394,7 +413,8 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
             configurator.configure_worker(self.state.master_key_add_worker, self.state.master_credentials)
             if self.state.containerd_mirrors:
                 configurator.configure_mirrors(self.state.containerd_mirrors)
-            self.provider.configure_vm(configurator)
+        # Workers are joined to the cluster in parallel
+        self.provider.configure_vms(self.state.day_0_workers_configurators_tobe_exec)
 
         self.state.day_0_workers_configurators_tobe_exec = []
 
@@ -402,8 +422,7 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
         """
         Internal .maas domain is SOMETIMES not resolved by the internal K8S DNS. This function fixes the problem.
         """
-        client_config = get_k8s_config_from_file_content(self.state.master_credentials)
-        kube_utils = KubeApiUtils(client_config)
+        kube_utils = k8s_client_cache.get_kube_api_utils(self.state.master_credentials, self.id)
         # Get the Core DNS configmap
         config_map = kube_utils.get_config_map("kube-system", "coredns")
         # Extract data
@@ -419,8 +438,7 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
         """
         Label each node with the area it belongs to. Used to constrain deployments to run on specific areas(or workers)
         """
-        k8s_config = get_k8s_config_from_file_content(self.state.master_credentials)
-        kube_utils = KubeApiUtils(k8s_config)
+        kube_utils = k8s_client_cache.get_kube_api_utils(self.state.master_credentials, self.id)
         for vm in self.state.vm_workers:
             area = vm.area
             labels = Labels(labels={"area": str(area)})
@@ -434,8 +452,7 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
         Suppose that there is NO plugin installed.
         """
         self.logger.info(f"Starting default plugin installation on {self.id} K8S cluster")
-        client_config = get_k8s_config_from_file_content(self.state.master_credentials)
-        kube_utils = KubeApiUtils(client_config)
+        kube_utils = k8s_client_cache.get_kube_api_utils(self.state.master_credentials, self.id)
         # It builds plugin list
         plug_list: List[K8sPluginName] = []
 
@@ -466,10 +483,12 @@ class K8sBlueprint(BlueprintNG[K8sBlueprintNGState, K8sCreateModel]):
         Args:
             model: The request containing information about workers to be added and in witch area
         """
+        vms_to_create: List[VmResource] = []
         area: K8sAreaDeployment
         for area in model.areas:
             # THERE ARE NO MASTER AREAS in the request -> THERE IS A CONSTRAINT IN THE REQUEST MODEL
-            self.deploy_area(area)
+            vms_to_create.extend(self.deploy_area(area))
+        self.provider.create_vms(vms_to_create)
 
         self.day0conf(configure_master=False)
 
@@ -170,11 +170,10 @@ class SdCoreUPFBlueprintNG(Generic5GUPFVMBlueprintNG[SdCoreUPFBlueprintNGState,
         for slice in self.state.current_config.slices:
             for dnnslice in slice.dnn_list:
                 dnns_to_deploy.append(dnnslice.dnn)
-        for dnn in set(dnns_to_deploy):
-            if dnn not in self.state.currently_deployed_dnns:
-                deployed_info = self.deploy_upf_vm(dnn)
-                self.state.upf_list.append(deployed_info)
-                self.state.currently_deployed_dnns[dnn] = deployed_info
+        dnns_to_add = [dnn for dnn in set(dnns_to_deploy) if dnn not in self.state.currently_deployed_dnns]
+        for dnn, deployed_info in zip(dnns_to_add, self.deploy_upf_vms(dnns_to_add)):
+            self.state.upf_list.append(deployed_info)
+            self.state.currently_deployed_dnns[dnn] = deployed_info
         dnn_to_undeploy = set(self.state.currently_deployed_dnns) - set(dnns_to_deploy)
         for dnn in set(dnn_to_undeploy):
             deployed_info = self.undeploy_upf_vm(dnn)
@@ -182,6 +181,31 @@ class SdCoreUPFBlueprintNG(Generic5GUPFVMBlueprintNG[SdCoreUPFBlueprintNGState,
             del self.state.currently_deployed_dnns[dnn]
 
     def deploy_upf_vm(self, dnn: str) -> DeployedUPFInfo:
+        return self.deploy_upf_vms([dnn])[0]
+
+    def deploy_upf_vms(self, dnns: List[str]) -> List[DeployedUPFInfo]:
+        """
+        Deploy a UPF VM for every DNN, the VMs are created and configured in parallel
+        Args:
+            dnns: The DNNs for which a UPF is deployed
+
+        Returns:
+            The info of the deployed UPFs, in the same order as the DNNs
+        """
+        upf_vms = [self._define_upf_vm(dnn) for dnn in dnns]
+        self.provider.create_vms(upf_vms)
+
+        upf_vm_configurators = [self._define_upf_vm_configurator(upf_vm, dnn) for upf_vm, dnn in zip(upf_vms, dnns)]
+        self.provider.configure_vms(upf_vm_configurators)
+
+        deployed_infos: List[DeployedUPFInfo] = []
+        for upf_vm, upf_vm_configurator, dnn in zip(upf_vms, upf_vm_configurators, dnns):
+            self.state.vm_resources[upf_vm.id] = upf_vm
+            self.state.vm_configurators[upf_vm_configurator.id] = upf_vm_configurator
+            deployed_infos.append(self._get_deployed_upf_info(upf_vm, upf_vm_configurator, dnn))
+        return deployed_infos
+
+    def _define_upf_vm(self, dnn: str) -> VmResource:
         upf_vm = VmResource(
             area=self.state.current_config.area_id,
             name=f"{self.id}_{self.state.current_config.area_id}_SDCORE_UPF_{dnn}",
@@ -194,8 +218,9 @@ class SdCoreUPFBlueprintNG(Generic5GUPFVMBlueprintNG[SdCoreUPFBlueprintNGState,
             require_port_security_disabled=True
         )
         self.register_resource(upf_vm)
-        self.provider.create_vm(upf_vm)
+        return upf_vm
 
+    def _define_upf_vm_configurator(self, upf_vm: VmResource, dnn: str) -> SDCoreUPFConfigurator:
         upf_vm_configurator = SDCoreUPFConfigurator(vm_resource=upf_vm, configuration=SDCoreUPFConfiguration(
             upf_mode="dpdk",
             n3_nic_name=upf_vm.network_interfaces[self.state.current_config.networks.n3.net_name][0].fixed.interface_name,
@@ -213,11 +238,9 @@ class SdCoreUPFBlueprintNG(Generic5GUPFVMBlueprintNG[SdCoreUPFBlueprintNGState,
             ue_ip_pool_cidr=self.get_dnn_ip_pool(dnn)
         ))
         self.register_resource(upf_vm_configurator)
-        self.provider.configure_vm(upf_vm_configurator)
-
-        self.state.vm_resources[upf_vm.id] = upf_vm
-        self.state.vm_configurators[upf_vm_configurator.id] = upf_vm_configurator
+        return upf_vm_configurator
 
+    def _get_deployed_upf_info(self, upf_vm: VmResource, upf_vm_configurator: SDCoreUPFConfigurator, dnn: str) -> DeployedUPFInfo:
         return DeployedUPFInfo(
             area=self.state.current_config.area_id,
             served_slices=self.get_slices_for_dnn(dnn),
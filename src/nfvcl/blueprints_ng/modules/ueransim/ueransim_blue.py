@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from pydantic import Field
 
@@ -133,10 +133,9 @@ class UeransimBlueprintNG(BlueprintNG[UeransimBlueprintNGState, UeransimBlueprin
     def create(self, create_model: UeransimBlueprintRequestInstance):
         super().create(create_model)
         self.logger.info("Starting creation of UERANSIM blueprint")
-        for area in create_model.areas:
-            self._create_gnb(str(area.id))
-            for ue in area.ues:
-                self._create_ue(str(area.id), ue)
+        # The GnBs of every area are created first, the UEs need the address of the GnB of their area
+        self._create_gnbs([str(area.id) for area in create_model.areas])
+        self._create_ues([(str(area.id), ue) for area in create_model.areas for ue in area.ues])
 
     def destroy(self):
         for area in self.state.areas.keys():
@@ -159,7 +158,20 @@ class UeransimBlueprintNG(BlueprintNG[UeransimBlueprintNGState, UeransimBlueprin
             self.logger.warning(f"Error deleting PDU: {str(e)}")
 
     def _create_gnb(self, area_id: str):
-        if area_id not in self.state.areas:
+        self._create_gnbs([area_id])
+
+    def _create_gnbs(self, area_ids: List[str]):
+        """
+        Create the GnB of every area, the VMs are created in parallel
+        Args:
+            area_ids: The areas in which a GnB is created
+        """
+        for area_id in area_ids:
+            if area_id in self.state.areas:
+                raise BlueprintNGException(f"GnB already exists in area {area_id}")
+
+        gnbs: List[Tuple[str, VmResource, Optional[NetResource]]] = []
+        for area_id in area_ids:
             network = None
             if self.create_config.config.network_endpoints.radio is None:
                 radio_network_name = f"radio_{self.id}_{area_id}"
@@ -183,15 +195,29 @@ class UeransimBlueprintNG(BlueprintNG[UeransimBlueprintNGState, UeransimBlueprin
             )
 
             self.register_resource(vm_gnb)
-            self.provider.create_vm(vm_gnb)
+            gnbs.append((area_id, vm_gnb, network))
+
+        self.provider.create_vms([vm_gnb for _, vm_gnb, _ in gnbs])
+
+        for area_id, vm_gnb, network in gnbs:
             self.state.areas[area_id] = BlueUeransimArea(vm_gnb=vm_gnb, ues=[], radio_net=network)
             self.add_gnb_to_topology(int(area_id))
-        else:
-            raise BlueprintNGException(f"GnB already exists in area {area_id}")
 
     def _create_ue(self, area_id: str, ue: UeransimUe):
-        if area_id in self.state.areas:
-            blue_ueransim_area = self.state.areas[area_id]
+        self._create_ues([(area_id, ue)])
+
+    def _create_ues(self, ues: List[Tuple[str, UeransimUe]]):
+        """
+        Create and configure the UEs, the VMs are created and configured in parallel
+        Args:
+            ues: The UEs to be created, each one with the area of the GnB it connects to
+        """
+        for area_id, ue in ues:
+            if area_id not in self.state.areas:
+                raise BlueprintNGException(f"Gnb in area {area_id} not found")
+
+        vms_ue: List[VmResource] = []
+        for area_id, ue in ues:
             if self.create_config.config.network_endpoints.radio is None:
                 radio_network_name = f"radio_{self.id}_{area_id}"
             else:
@@ -207,9 +233,14 @@ class UeransimBlueprintNG(BlueprintNG[UeransimBlueprintNGState, UeransimBlueprin
                 additional_networks=[radio_network_name]
             )
             self.register_resource(vm_ue)
+            vms_ue.append(vm_ue)
 
-            self.provider.create_vm(vm_ue)
+        self.provider.create_vms(vms_ue)
 
+        vm_ue_configurators: List[UeransimUEConfigurator] = []
+        for (area_id, ue), vm_ue in zip(ues, vms_ue):
+            blue_ueransim_area = self.state.areas[area_id]
+            radio_network_name = vm_ue.additional_networks[0]
             vm_ue_configurator = UeransimUEConfigurator(
                 vm_resource=vm_ue,
                 sims=[],
@@ -219,12 +250,12 @@ class UeransimBlueprintNG(BlueprintNG[UeransimBlueprintNGState, UeransimBlueprin
                 vm_ue_configurator.sims.append(sim)
 
             self.register_resource(vm_ue_configurator)
-            self.provider.configure_vm(vm_ue_configurator)
-            blue_ueransim_area.ues.append(BlueUeransimUe(vm_ue=vm_ue, vm_ue_configurator=vm_ue_configurator, ue_id=str(ue.id)))
+            vm_ue_configurators.append(vm_ue_configurator)
 
-            self.state.areas[area_id] = blue_ueransim_area
-        else:
-            raise BlueprintNGException(f"Gnb in area {area_id} not found")
+        self.provider.configure_vms(vm_ue_configurators)
+
+        for (area_id, ue), vm_ue, vm_ue_configurator in zip(ues, vms_ue, vm_ue_configurators):
+            self.state.areas[area_id].ues.append(BlueUeransimUe(vm_ue=vm_ue, vm_ue_configurator=vm_ue_configurator, ue_id=str(ue.id)))
 
     def _delete_gnb(self, area_id: str):
         self.logger.info(f"Trying to delete GnB in area {area_id}")
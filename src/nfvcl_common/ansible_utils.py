@@ -1,10 +1,31 @@
 import tempfile
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 import ansible_runner
 from ansible_runner import Runner
+from pydantic import Field
 
+from nfvcl_common.base_model import NFVCLBaseModel
 from nfvcl_common.utils.log import create_logger
+from nfvcl_common.utils.ssh_utils import ssh_connection_manager
+
+# Maximum number of hosts configured in parallel by a single ansible-runner invocation
+MAX_ANSIBLE_FORKS = 20
+
+
+class AnsibleHost(NFVCLBaseModel):
+    host: str = Field(description="The address of the host, also used as inventory name")
+    username: str
+    password: str
+    become_password: Optional[str] = Field(default=None)
+
+
+class AnsibleHostResult(NFVCLBaseModel):
+    host: str
+    failed: bool = Field(default=False, description="True if a task failed or the host was unreachable")
+    unreachable: bool = Field(default=False)
+    fact_cache: dict = Field(default_factory=dict)
+
 
 def create_ansible_inventory(host: str, username: str, password: str, become_password: Optional[str] = None):
     str_list: List[str] = [f"ansible_host='{host}'", f"ansible_user='{username}'", f"ansible_password='{password}'"]
@@ -16,13 +37,48 @@ def create_ansible_inventory(host: str, username: str, password: str, become_pas
 
     return f"{host} {' '.join(str_list)}"
 
-def run_ansible_playbook(host: str, username: str, password: str, playbook: str, logger=create_logger("Ansible Configurator"), become_password: Optional[str] = None) -> (Runner, dict):
+def run_ansible_playbook(host: str, username: str, password: str, playbook: str, logger=create_logger("Ansible Configurator"), become_password: Optional[str] = None) -> Tuple[Runner, dict]:
+    ansible_runner_result, fact_caches = _run_ansible(
+        [AnsibleHost(host=host, username=username, password=password, become_password=become_password)],
+        playbook,
+        logger
+    )
+    return ansible_runner_result, fact_caches[host]
+
+
+def run_ansible_playbook_batch(hosts: List[AnsibleHost], playbook: str, logger=create_logger("Ansible Configurator"), forks: Optional[int] = None) -> Dict[str, AnsibleHostResult]:
+    """
+    Run the same playbook on multiple hosts with a single ansible-runner invocation (multi-host inventory)
+    Args:
+        hosts: The hosts on which the playbook is executed, the playbook should target 'all'
+        playbook: The playbook content
+        logger: The logger used for the ansible output
+        forks: The number of hosts configured in parallel, by default every host up to MAX_ANSIBLE_FORKS
+
+    Returns:
+        The result of every host (failure and fact cache), indexed by host address
+    """
+    if forks is None:
+        forks = min(len(hosts), MAX_ANSIBLE_FORKS)
+    ansible_runner_result, fact_caches = _run_ansible(hosts, playbook, logger, forks=forks)
+
+    # 'stats' is None if ansible-runner failed before running the playbook
+    stats = ansible_runner_result.stats or {}
+    results: Dict[str, AnsibleHostResult] = {}
+    for ansible_host in hosts:
+        unreachable = ansible_host.host in stats.get("dark", {})
+        failed = unreachable or ansible_host.host in stats.get("failures", {}) or ansible_runner_result.stats is None
+        results[ansible_host.host] = AnsibleHostResult(host=ansible_host.host, failed=failed, unreachable=unreachable, fact_cache=fact_caches[ansible_host.host])
+    return results
+
+
+def _run_ansible(hosts: List[AnsibleHost], playbook: str, logger, forks: Optional[int] = None) -> Tuple[Runner, Dict[str, dict]]:
     tmp_playbook = tempfile.NamedTemporaryFile(mode="w")
     tmp_inventory = tempfile.NamedTemporaryFile(mode="w")
     tmp_private_data_dir = tempfile.TemporaryDirectory()
 
     # Write the inventory and playbook to files
-    tmp_inventory.write(create_ansible_inventory(host, username, password, become_password=become_password))
+    tmp_inventory.write("\n".join(create_ansible_inventory(ansible_host.host, ansible_host.username, ansible_host.password, become_password=ansible_host.become_password) for ansible_host in hosts))
     tmp_playbook.write(playbook)
     tmp_playbook.flush()
     tmp_inventory.flush()
@@ -45,15 +101,18 @@ def run_ansible_playbook(host: str, username: str, password: str, playbook: str,
         private_data_dir=tmp_private_data_dir.name,
         status_handler=my_status_handler,
         event_handler=my_event_handler,
-        quiet=True
+        quiet=True,
+        forks=forks,
+        # The SSH connections are shared with the following runs on the same hosts
+        envvars=ssh_connection_manager.ansible_envvars()
     )
 
-    # Save the fact cache to a variable before deleting tmp_private_data_dir
-    fact_cache = ansible_runner_result.get_fact_cache(host)
+    # Save the fact caches to a variable before deleting tmp_private_data_dir
+    fact_caches = {ansible_host.host: ansible_runner_result.get_fact_cache(ansible_host.host) for ansible_host in hosts}
 
     # Close the tmp files, this will delete them
     tmp_playbook.close()
     tmp_inventory.close()
     tmp_private_data_dir.cleanup()
 
-    return ansible_runner_result, fact_cache
+    return ansible_runner_result, fact_caches
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import requests
+from pydantic import Field
+
+from nfvcl_common.base_model import NFVCLBaseModel
+from nfvcl_common.utils.file_utils import create_tmp_folder
+from nfvcl_common.utils.log import create_logger
+
+logger = create_logger('Image digest cache')
+
+# Size of the chunks read from the image while computing the digest
+IMAGE_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+class ImageDigestCacheEntry(NFVCLBaseModel):
+    url: str
+    algorithm: str
+    digest: str
+    etag: Optional[str] = Field(default=None)
+    last_modified: Optional[str] = Field(default=None)
+    size: int = Field(default=0, description="The number of bytes hashed")
+    computed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class ImageDigestCache:
+    """
+    Cache of the digests of the remote images, indexed by (image URL, algorithm).
+
+    A cached digest is valid while the ETag/Last-Modified returned by the server do not change, images whose server does
+    not return any of them are hashed every time. Images are hashed in streaming, so the memory usage does not depend on
+    the image size, and the same image is never hashed by two threads at the same time.
+    The cache is saved in the tmp folder and loaded on the first use.
+    """
+
+    def __init__(self, file_name: str = "image_digests.json"):
+        self.file_name = file_name
+        self._entries: Optional[Dict[str, ImageDigestCacheEntry]] = None
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+
+    def get_digest(self, url: str, algorithm: str = "sha512") -> str:
+        """
+        Get the digest of the remote image, the image is downloaded and hashed only if the cached digest is missing or
+        if the image changed on the server.
+        Args:
+            url: The URL of the image
+            algorithm: The hash algorithm (a name accepted by hashlib)
+
+        Returns:
+            The hex digest of the image
+        """
+        key = f"{algorithm}:{url}"
+        with self._lock:
+            url_lock = self._url_locks.setdefault(key, threading.Lock())
+
+        with url_lock:
+            cached = self._get_entries().get(key)
+            if cached is not None:
+                etag, last_modified = self._get_validators(url)
+                if (etag or last_modified) and etag == cached.etag and last_modified == cached.last_modified:
+                    logger.debug(f"Using cached {algorithm} digest of {url}")
+                    return cached.digest
+
+            entry = self._compute_digest(url, algorithm)
+            with self._lock:
+                self._get_entries_locked()[key] = entry
+                self._save()
+            return entry.digest
+
+    def _get_validators(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=30)
+        except requests.RequestException as e:
+            logger.warning(f"Unable to check if the image {url} has changed: {str(e)}")
+            return None, None
+        if response.status_code != 200:
+            return None, None
+        return response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    def _compute_digest(self, url: str, algorithm: str) -> ImageDigestCacheEntry:
+        logger.debug(f"Downloading {url} image on NFVCL machine to compute its {algorithm} digest...")
+        file_hash = hashlib.new(algorithm)
+        size = 0
+        with requests.get(url, stream=True, timeout=30) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to download file. Status code: {response.status_code}")
+                raise ValueError("The URL is not valid")
+            for chunk in response.iter_content(chunk_size=IMAGE_DIGEST_CHUNK_SIZE):
+                file_hash.update(chunk)
+                size += len(chunk)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        logger.debug(f"Downloading of {url} finished, {size} bytes hashed")
+        return ImageDigestCacheEntry(url=url, algorithm=algorithm, digest=file_hash.hexdigest(), etag=etag, last_modified=last_modified, size=size)
+
+    def _get_entries(self) -> Dict[str, ImageDigestCacheEntry]:
+        with self._lock:
+            return self._get_entries_locked()
+
+    def _get_entries_locked(self) -> Dict[str, ImageDigestCacheEntry]:
+        if self._entries is None:
+            self._entries = {}
+            path = self._get_path()
+            if path.exists():
+                try:
+                    for key, entry in json.loads(path.read_text()).items():
+                        self._entries[key] = ImageDigestCacheEntry.model_validate(entry)
+                except (ValueError, OSError) as e:
+                    logger.warning(f"Unable to load the image digest cache from {path}: {str(e)}")
+        return self._entries
+
+    def _save(self):
+        """
+        Write the cache to the tmp folder, the caller holds the lock
+        """
+        path = self._get_path()
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps({key: entry.model_dump(mode="json") for key, entry in self._get_entries_locked().items()}))
+            # Atomic replace, a crash while writing does not corrupt the cache
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Unable to save the image digest cache to {path}: {str(e)}")
+
+    def _get_path(self) -> Path:
+        return Path(create_tmp_folder("image_cache"), self.file_name)
+
+
+image_digest_cache = ImageDigestCache()
@@ -15,6 +15,7 @@ class NFVCLPublicModel(NFVCLBaseModel):
     method: str = Field()
     section: NFVCLPublicSectionModel = Field()
     sync: bool = Field(default=False)
+    read_only: bool = Field(default=False)
     summary: Optional[str] = Field(default=None)
     description: Optional[str] = Field(default=None)
 
@@ -22,11 +23,19 @@ class NFVCLPublicModel(NFVCLBaseModel):
 class NFVCLPublic:
     order: int = 0
 
-    def __init__(self, path: str, method: str, section: NFVCLPublicSectionModel, sync: bool = False, doc_by: Optional[Callable] = None, summary: Optional[str] = None, description: Optional[str] = None):
+    def __init__(self, path: str, method: str, section: NFVCLPublicSectionModel, sync: bool = False, read_only: bool = False, doc_by: Optional[Callable] = None, summary: Optional[str] = None, description: Optional[str] = None):
+        """
+        Args:
+            read_only: The method only reads the in-memory snapshots kept by the managers, it is executed inline in the caller
+                thread without going through the TaskManager. Read-only methods are always sync.
+        """
+        if read_only and not sync:
+            raise ValueError(f"Read-only public method '{path}' must be sync")
         self.path = path
         self.method = method
         self.section = section
         self.sync = sync
+        self.read_only = read_only
         self.doc_override = doc_by.__doc__ if doc_by else None
         self.summary = summary
         self.description = description
@@ -34,7 +43,7 @@ class NFVCLPublic:
     def __call__(self, func):
         if self.doc_override:
             func.__doc__ = self.doc_override
-        func.nfvcl_public = NFVCLPublicModel(path=self.path, method=self.method, section=self.section, sync=self.sync, summary=self.summary, description=self.description)
+        func.nfvcl_public = NFVCLPublicModel(path=self.path, method=self.method, section=self.section, sync=self.sync, read_only=self.read_only, summary=self.summary, description=self.description)
         func.order = NFVCLPublic.order
         NFVCLPublic.order += 1
         return func
@@ -1,13 +1,21 @@
+import subprocess
+import threading
+import time
 from logging import Logger
+from typing import Dict, Tuple, Optional
 
 import paramiko
 from paramiko.client import SSHClient
 from paramiko.sftp_client import SFTPClient
 
+from nfvcl_common.utils.file_utils import create_tmp_folder
 from nfvcl_common.utils.log import create_logger
 
 logger: Logger = create_logger('SSH utils')
 
+# Seconds for which an idle connection (OpenSSH master used by Ansible or paramiko transport) is kept open
+SSH_CONNECTION_PERSIST = 300
+
 
 def create_ssh_client(server, port, user, password) -> SSHClient:
     """
@@ -79,3 +87,148 @@ def sftp_delete_file(client: SFTPClient, destination_file_path: str):
     """
     logger.debug(f"Deleting file '{destination_file_path}' on remote server")
     client.remove(destination_file_path)
+
+
+class SSHConnectionManager:
+    """
+    Keep the SSH connections to the hosts open, so that repeated operations on the same host skip the handshake and
+    the authentication.
+
+    The readiness and status probes reuse warm paramiko transports, Ansible reuses a multiplexed OpenSSH master
+    connection (ControlMaster/ControlPersist) whose socket is kept in a tmp folder shared by every ansible-runner
+    invocation.
+    """
+
+    def __init__(self, persist: int = SSH_CONNECTION_PERSIST):
+        self.persist = persist
+        self._clients: Dict[Tuple[str, int, str], Tuple[SSHClient, float]] = {}
+        self._lock = threading.Lock()
+        self._control_path_dir: Optional[str] = None
+        self._eviction_timer: Optional[threading.Timer] = None
+
+    def get_client(self, host: str, port: int, user: str, password: str, timeout: Optional[float] = None, verify: bool = False) -> SSHClient:
+        """
+        Get a connected SSH client for the host, an already open connection is reused if still alive
+        Args:
+            host: The IP of the server
+            port: The port of the SSH server
+            user: Username to be used when authenticate
+            password: The password of the user
+            timeout: The connection timeout in seconds, also used for the round trip when verify is True
+            verify: If True, an already open connection is reused only if the server answers to a channel request,
+                otherwise only the state of the transport is checked (a dead host may not be noticed until the TCP
+                connection times out)
+
+        Returns:
+            The connected SSHClient, it must NOT be closed by the caller
+        """
+        key = (host, port, user)
+        self._evict_idle()
+        with self._lock:
+            cached = self._clients.pop(key, None)
+        if cached is not None:
+            client = cached[0]
+            if self._is_alive(client, round_trip_timeout=(timeout or 10) if verify else None):
+                with self._lock:
+                    self._clients[key] = (client, time.monotonic())
+                return client
+            client.close()
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(host, port, username=user, password=password, allow_agent=False, look_for_keys=False, timeout=timeout)
+        except Exception:
+            client.close()
+            raise
+        client.get_transport().set_keepalive(30)
+        with self._lock:
+            previous = self._clients.get(key)
+            self._clients[key] = (client, time.monotonic())
+            self._schedule_eviction()
+        if previous is not None:
+            previous[0].close()
+        return client
+
+    def release(self, host: str, user: Optional[str] = None, port: int = 22):
+        """
+        Close every connection to the host, to be called when the host is destroyed (its IP may be reused)
+        Args:
+            host: The IP of the server
+            user: The user of the OpenSSH master connection to be closed, if None only the paramiko connections are closed
+            port: The port of the SSH server
+        """
+        with self._lock:
+            keys = [key for key in self._clients.keys() if key[0] == host]
+            clients = [self._clients.pop(key)[0] for key in keys]
+        for client in clients:
+            client.close()
+        if user is not None and self._control_path_dir is not None:
+            try:
+                subprocess.run(
+                    ["ssh", "-o", f"ControlPath={self._control_path_dir}/%C", "-O", "exit", "-p", str(port), f"{user}@{host}"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
+                )
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.debug(f"Unable to stop the SSH master connection to {host}: {e}")
+
+    def ansible_envvars(self) -> Dict[str, str]:
+        """
+        Get the environment variables making Ansible share the multiplexed OpenSSH connections between the runs
+        """
+        if self._control_path_dir is None:
+            self._control_path_dir = str(create_tmp_folder("ssh_cp"))
+        return {
+            "ANSIBLE_SSH_ARGS": f"-C -o ControlMaster=auto -o ControlPersist={self.persist}s -o ServerAliveInterval=10 -o ServerAliveCountMax=3",
+            "ANSIBLE_SSH_CONTROL_PATH_DIR": self._control_path_dir,
+            # %C is the hash of the connection parameters (local host, host, port, user), '%%' is the escape of Ansible
+            "ANSIBLE_SSH_CONTROL_PATH": "%(directory)s/%%C"
+        }
+
+    def _is_alive(self, client: SSHClient, round_trip_timeout: Optional[float] = None) -> bool:
+        """
+        Check if the connection is still usable
+        Args:
+            client: The client to be checked
+            round_trip_timeout: If given, a session channel is opened and closed to check that the server is answering,
+                otherwise a message is only queued on the transport (it fails only if the connection is already closed)
+        """
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            if round_trip_timeout is not None:
+                transport.open_session(timeout=round_trip_timeout).close()
+            else:
+                transport.send_ignore()
+            return True
+        except (EOFError, OSError, paramiko.SSHException):
+            return False
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        with self._lock:
+            idle_keys = [key for key, (_, last_used) in self._clients.items() if now - last_used > self.persist]
+            idle_clients = [self._clients.pop(key)[0] for key in idle_keys]
+        for client in idle_clients:
+            client.close()
+
+    def _schedule_eviction(self):
+        """
+        Start the timer closing the idle connections, if not already running. Must be called holding the lock.
+        """
+        if self._eviction_timer is None:
+            self._eviction_timer = threading.Timer(self.persist, self._timed_eviction)
+            self._eviction_timer.daemon = True
+            self._eviction_timer.start()
+
+    def _timed_eviction(self):
+        self._evict_idle()
+        with self._lock:
+            self._eviction_timer = None
+            # The timer is stopped when there are no more connections
+            if len(self._clients) > 0:
+                self._schedule_eviction()
+
+
+ssh_connection_manager = SSHConnectionManager()
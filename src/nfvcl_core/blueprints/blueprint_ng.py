@@ -391,8 +391,8 @@ class BlueprintNG(Generic[StateTypeVar, CreateConfigTypeVar]):
 
             self.base_model.monitoring_state.prometheus_targets.append(prometheus_target)
 
-            # Save del target in the blueprint state
-            self.provider.topology_manager.add_prometheus_target(prometheus_id, prometheus_target)
+        # Save the targets in the topology
+        self.provider.topology_manager.add_prometheus_targets(prometheus_id, monitoring_definition.prometheus_targets)
 
         if grafana_id:
             grafana_server = self.provider.topology_manager.get_grafana(grafana_id)
@@ -400,13 +400,16 @@ class BlueprintNG(Generic[StateTypeVar, CreateConfigTypeVar]):
 
         # TODO maybe we should move this in the provider?
         from nfvcl_core.managers.getters import get_monitoring_manager
-        get_monitoring_manager().sync_prometheus_targets_to_server(prometheus_id)
+        # Uploads requested by other blueprints in the meantime are coalesced, the result is awaited before returning
+        prometheus_sync = get_monitoring_manager().schedule_prometheus_targets_sync(prometheus_id)
 
         if grafana_id:
             get_monitoring_manager().sync_grafana_folders_to_server(grafana_server.id)
             self.base_model.monitoring_state.grafana_folder_id = grafana_server.root_folder.find_folder_by_blueprint_id(self.id).uid
 
-        if grafana_id:
+        if grafana_id and monitoring_definition.grafana_dashboards:
+            datasource_uid = get_monitoring_manager().get_grafana_datasource_uid(grafana_id, prometheus_id)
+            dashboards = []
             for grafana_dashboard in monitoring_definition.grafana_dashboards:
                 with open(grafana_dashboard.path, 'r', encoding='utf-8') as f:
                     try:
@@ -415,13 +418,15 @@ class BlueprintNG(Generic[StateTypeVar, CreateConfigTypeVar]):
                             dashboard["id"] = None
                         if "uid" in dashboard:
                             dashboard["uid"] = None
-                        replace_all_datasources(dashboard, get_monitoring_manager().get_grafana_datasource_uid(grafana_id, prometheus_id))
+                        replace_all_datasources(dashboard, datasource_uid)
                         update_queries_in_panels(dashboard.get("panels", []), f'"blueprint" = "{self.id}"')
-                        get_monitoring_manager().add_grafana_dashboard(grafana_id, dashboard, grafana_server.root_folder.find_folder_by_blueprint_id(self.id).uid)
+                        dashboards.append(dashboard)
                     except json.JSONDecodeError as e:
                         print(f"Error decoding {grafana_dashboard.path}: {e}")
+            get_monitoring_manager().add_grafana_dashboards(grafana_id, dashboards, grafana_server.root_folder.find_folder_by_blueprint_id(self.id).uid)
 
         self.to_db()
+        prometheus_sync.result()
 
         if request.recursive:
             # If recursive is set, enable monitoring on all children blueprints
@@ -445,7 +450,7 @@ class BlueprintNG(Generic[StateTypeVar, CreateConfigTypeVar]):
             except ValueError as e:
                 self.logger.error(f"Could not remove targets from prometheus server {prometheus_server.id}: {e}")
             from nfvcl_core.managers.getters import get_monitoring_manager
-            get_monitoring_manager().sync_prometheus_targets_to_server(prometheus_server.id)
+            prometheus_sync = get_monitoring_manager().schedule_prometheus_targets_sync(prometheus_server.id)
 
             if self.base_model.monitoring_state.grafana_server_id and self.base_model.parent_blue_id is None:
                 grafana_server = self.provider.topology_manager.delete_grafana_folder(self.base_model.monitoring_state.grafana_server_id, self.base_model.monitoring_state.grafana_folder_id)
@@ -453,6 +458,7 @@ class BlueprintNG(Generic[StateTypeVar, CreateConfigTypeVar]):
 
             self.base_model.monitoring_state = None
             self.to_db()
+            prometheus_sync.result()
         else:
             self.logger.warning("Monitoring is not enabled for this blueprint, nothing to disable, disabling for children...")
 
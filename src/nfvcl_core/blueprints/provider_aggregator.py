@@ -1,7 +1,10 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import wraps
-from typing import Dict, Optional, List, Any, Tuple, Set, Callable
+from typing import Dict, Optional, List, Any, Tuple, Set, Callable, Sequence
 
 from nfvcl_common.utils.blue_utils import get_class_path_str_from_obj
+from nfvcl_common.utils.log import create_logger
 from nfvcl_core.managers.topology_manager import TopologyManager
 from nfvcl_core.managers.vim_clients_manager import VimClientsManager
 from nfvcl_core_models.network.ipam_models import SerializableIPv4Address
@@ -63,6 +66,12 @@ class ProvidersAggregator:
         self.vim_clients_manager: VimClientsManager = vim_clients_manager
         self.persistence_function = persistence_function
         self.performance_manager = performance_manager
+        self.logger = create_logger(self.__class__.__name__, blueprintid=blueprint_id)
+
+        # Providers can be used by multiple threads during the batch operations (create_vms, configure_vms)
+        self._providers_lock = threading.RLock()
+        # Held by the persistence function and by the virtualization providers while changing their data (data_lock)
+        self._persistence_lock = threading.RLock()
 
         self.virt_providers_impl: Dict[int, VirtualizationProviderInterface] = {}
         self.k8s_providers_impl: Dict[int, K8SProviderInterface] = {}
@@ -115,29 +124,45 @@ class ProvidersAggregator:
             )
         return provider_data_aggregate
 
+    def _persist(self):
+        """
+        Call the persistence function, the calls coming from providers running in parallel are serialized
+        """
+        with self._persistence_lock:
+            self.persistence_function()
+
+    def _get_persistence_function(self) -> Optional[Callable[[], None]]:
+        return self._persist if self.persistence_function else None
+
     def get_virt_provider(self, area: int) -> VirtualizationProviderInterface:
         vim = self.topology_manager.get_topology().get_vim_by_area(area)
-        if area not in self.virt_providers_impl:
-            ProviderClass: type[VirtualizationProviderInterface] = vim_type_to_provider_mapping[vim.vim_type]
-            self.virt_providers_impl[area] = ProviderClass(area, self.blueprint_id, vim_client=self.vim_clients_manager.get_vim_client(self, vim.vim_type, vim.name), persistence_function=self.persistence_function)
-        return self.virt_providers_impl[area]
+        with self._providers_lock:
+            if area not in self.virt_providers_impl:
+                ProviderClass: type[VirtualizationProviderInterface] = vim_type_to_provider_mapping[vim.vim_type]
+                self.virt_providers_impl[area] = ProviderClass(area, self.blueprint_id, vim_client=self.vim_clients_manager.get_vim_client(self, vim.vim_type, vim.name), persistence_function=self._get_persistence_function())
+                # The provider data and the resources are changed by parallel calls while the persistence function dumps them
+                self.virt_providers_impl[area].data_lock = self._persistence_lock
+            return self.virt_providers_impl[area]
 
     def get_k8s_provider(self, area: int):
-        if area not in self.k8s_providers_impl:
-            self.k8s_providers_impl[area] = K8SProviderNative(area, self.blueprint_id, topology_manager=self.topology_manager, persistence_function=self.persistence_function)
-        return self.k8s_providers_impl[area]
+        with self._providers_lock:
+            if area not in self.k8s_providers_impl:
+                self.k8s_providers_impl[area] = K8SProviderNative(area, self.blueprint_id, topology_manager=self.topology_manager, persistence_function=self._get_persistence_function())
+            return self.k8s_providers_impl[area]
 
     def get_pdu_provider(self):
         # The area is -1 because there is only one PDUProvider
-        if not self.pdu_provider_impl:
-            self.pdu_provider_impl = PDUProvider(area=-1, blueprint_id=self.blueprint_id, topology_manager=self.topology_manager, pdu_manager=self.pdu_manager, persistence_function=self.persistence_function)
-        return self.pdu_provider_impl
+        with self._providers_lock:
+            if not self.pdu_provider_impl:
+                self.pdu_provider_impl = PDUProvider(area=-1, blueprint_id=self.blueprint_id, topology_manager=self.topology_manager, pdu_manager=self.pdu_manager, persistence_function=self._get_persistence_function())
+            return self.pdu_provider_impl
 
     def get_blueprint_provider(self):
         # The area is -1 because there is only one BlueprintProvider
-        if not self.blueprint_provider_impl:
-            self.blueprint_provider_impl = BlueprintProvider(area=-1, blueprint_id=self.blueprint_id, blueprint_manager=self.blueprint_manager, persistence_function=self.persistence_function)
-        return self.blueprint_provider_impl
+        with self._providers_lock:
+            if not self.blueprint_provider_impl:
+                self.blueprint_provider_impl = BlueprintProvider(area=-1, blueprint_id=self.blueprint_id, blueprint_manager=self.blueprint_manager, persistence_function=self._get_persistence_function())
+            return self.blueprint_provider_impl
 
     def get_vim_info(self):
         pass
@@ -146,6 +171,113 @@ class ProvidersAggregator:
     def create_vm(self, vm_resource: VmResource):
         return self.get_virt_provider(vm_resource.area).create_vm(vm_resource)
 
+    def _run_on_vims(self, function: Callable[[Any], Any], items: List[Any], areas: List[int]) -> List[Any]:
+        """
+        Run the function on every item in parallel, the number of concurrent calls on the same VIM is limited by the
+        semaphore of the VIM (shared by every blueprint).
+        Every call is awaited before returning, if any call failed the first exception (in items order) is raised.
+
+        Args:
+            function: The function to be called with every item
+            items: The items on which the function is called
+            areas: The area of every item, used to get the VIM
+
+        Returns:
+            The results of the calls, in the same order as the items
+        """
+        if len(items) == 0:
+            return []
+        semaphores: Dict[int, threading.BoundedSemaphore] = {}
+        for area in set(areas):
+            # The providers are created here, before starting the threads
+            vim_name = self.get_virt_provider(area).get_vim_info().name
+            semaphores[area] = self.vim_clients_manager.get_operation_semaphore(vim_name)
+
+        def run(item: Any, item_area: int) -> Any:
+            with semaphores[item_area]:
+                return function(item)
+
+        if len(items) == 1:
+            return [run(items[0], areas[0])]
+
+        with ThreadPoolExecutor(max_workers=len(items), thread_name_prefix=f"Provider-{self.blueprint_id}") as executor:
+            futures = [executor.submit(run, item, area) for item, area in zip(items, areas)]
+            wait(futures)
+
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if len(errors) > 0:
+            for error in errors[1:]:
+                self.logger.error(f"Parallel provider call failed: {str(error)}")
+            raise errors[0]
+        return [future.result() for future in futures]
+
+    def create_vms(self, vm_resources: List[VmResource]) -> List[Any]:
+        """
+        Create the VMs in parallel, limiting the number of concurrent creations on the same VIM.
+        Every creation is awaited (even if some fail) before returning.
+
+        Args:
+            vm_resources: The VMs to be created
+
+        Returns:
+            The results of the creations, in the same order as the VMs
+        """
+        return self._run_on_vims(self.create_vm, vm_resources, [vm_resource.area for vm_resource in vm_resources])
+
+    def configure_vms(self, vm_resource_configurations: Sequence[VmResourceConfiguration]) -> List[dict]:
+        """
+        Apply the configurations, the configurations of the VMs in the same area that the provider can apply together
+        are given together to the provider (e.g. a single Ansible run for the VMs sharing the same playbook). The other
+        configurations and the areas are configured in parallel.
+        Every configuration is awaited (even if some fail) before returning.
+
+        Args:
+            vm_resource_configurations: The configurations to be applied, they should target different VMs
+
+        Returns:
+            The results (facts) of the configurations, in the same order as the configurations
+        """
+        # Every item is either a single configuration or the list of configurations of an area to be applied together
+        items: List[VmResourceConfiguration | List[VmResourceConfiguration]] = []
+        item_indexes: List[List[int]] = []
+        areas: List[int] = []
+        # area -> (configurations applied together, their indexes)
+        batch_of_area: Dict[int, Tuple[List[VmResourceConfiguration], List[int]]] = {}
+        for idx, vm_resource_configuration in enumerate(vm_resource_configurations):
+            area = vm_resource_configuration.vm_resource.area
+            if self.get_virt_provider(area).can_configure_together(vm_resource_configuration):
+                if area not in batch_of_area:
+                    batch_of_area[area] = ([], [])
+                    items.append(batch_of_area[area][0])
+                    item_indexes.append(batch_of_area[area][1])
+                    areas.append(area)
+                batch_of_area[area][0].append(vm_resource_configuration)
+                batch_of_area[area][1].append(idx)
+            else:
+                items.append(vm_resource_configuration)
+                item_indexes.append([idx])
+                areas.append(area)
+
+        def configure(item: VmResourceConfiguration | List[VmResourceConfiguration]) -> List[dict]:
+            if isinstance(item, list):
+                return self.configure_vms_batch(item)
+            return [self.configure_vm(item)]
+
+        item_results = self._run_on_vims(configure, items, areas)
+
+        results: Dict[int, dict] = {}  # configuration index -> result
+        for indexes, configuration_results in zip(item_indexes, item_results):
+            for idx, result in zip(indexes, configuration_results):
+                results[idx] = result
+        return [results[idx] for idx in range(len(vm_resource_configurations))]
+
+    @register_performance(params_to_info=[(0, 1, "vim", lambda x, y: x.get_virt_provider(y[0].vm_resource.area).get_vim_info().name), (1, "vm_names", lambda x: ", ".join(configuration.vm_resource.name for configuration in x))])
+    def configure_vms_batch(self, vm_resource_configurations: Sequence[VmResourceConfiguration]) -> List[dict]:
+        """
+        Apply the configurations of VMs in the same area with a single provider call
+        """
+        return self.get_virt_provider(vm_resource_configurations[0].vm_resource.area).configure_vms(vm_resource_configurations)
+
     @register_performance(params_to_info=[(0, 1, "vim", lambda x, y: x.get_virt_provider(y.area).get_vim_info().name), (1, "vm_name", lambda x: x.name)])
     def attach_nets(self, vm_resource: VmResource, nets_name: List[str]):
         """
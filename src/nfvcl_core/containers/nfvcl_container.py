@@ -1,6 +1,7 @@
 from dependency_injector import containers, providers
 
 from nfvcl_core.database.provider_repository import ProviderDataRepository
+from nfvcl_core.database.proxmox_vmid_repository import ProxmoxVmidRepository
 from nfvcl_core.database.snapshot_repository import SnapshotRepository
 from nfvcl_core.managers.blueprint_manager import BlueprintManager
 from nfvcl_core.managers.event_manager import EventManager
@@ -29,12 +30,14 @@ class NFVCLContainer(containers.DeclarativeContainer):
         port=config.mongodb.port,
         db=config.mongodb.db,
         username=config.mongodb.username,
-        password=config.mongodb.password
+        password=config.mongodb.password,
+        write_behind_ms=config.mongodb.write_behind_ms
     )
 
     task_manager = providers.Singleton(
         TaskManager,
-        worker_count=config.nfvcl.workers
+        worker_count=config.nfvcl.workers,
+        read_worker_count=config.nfvcl.read_workers
     )
 
     event_manager = providers.Singleton(
@@ -75,6 +78,11 @@ class NFVCLContainer(containers.DeclarativeContainer):
         persistence_manager=persistence_manager
     )
 
+    proxmox_vmid_repository = providers.Singleton(
+        ProxmoxVmidRepository,
+        persistence_manager=persistence_manager
+    )
+
     topology_manager = providers.Singleton(
         TopologyManager,
         topology_repository=topology_repository
@@ -82,7 +90,9 @@ class NFVCLContainer(containers.DeclarativeContainer):
 
     vim_clients_manager = providers.Singleton(
         VimClientsManager,
-        topology_manager=topology_manager
+        topology_manager=topology_manager,
+        proxmox_vmid_repository=proxmox_vmid_repository,
+        max_parallel_operations=config.nfvcl.vim_parallel_operations
     )
 
     monitoring_manager = providers.Singleton(
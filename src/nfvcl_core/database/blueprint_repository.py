@@ -8,10 +8,8 @@ class BlueprintRepository(DatabaseRepository[BlueprintNGBaseModel]):
         super().__init__(persistence_manager, "blueprints", data_type = BlueprintNGBaseModel)
 
     def save_blueprint(self, blueprint: BlueprintNGBaseModel):
-        if self.collection.find_one({'id': blueprint.id}):
-            self.collection.update_one({'id': blueprint.id}, {'$set': blueprint.model_dump()})
-        else:
-            self.collection.insert_one(blueprint.model_dump())
+        self.save_incremental('id', blueprint.model_dump(), replaced_fields=blueprint.pop_assigned_fields())
 
     def delete_blueprint(self, blueprint_id: str):
+        self.forget_persisted(blueprint_id)
         self.collection.delete_one({'id': blueprint_id})
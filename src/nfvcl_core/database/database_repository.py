@@ -1,9 +1,12 @@
-from typing import TypeVar, List
+import threading
+from typing import TypeVar, List, Dict, Any, Iterable, Optional, Tuple, Set
 
 from pydantic import BaseModel
+from pymongo import ReplaceOne, UpdateOne
 from typing_extensions import Generic
 
 from nfvcl_common.utils.log import create_logger
+from nfvcl_core.database.document_diff import compute_document_update
 from nfvcl_core.managers.persistence_manager import PersistenceManager
 
 T = TypeVar('T', bound=BaseModel)
@@ -14,6 +17,14 @@ class DatabaseRepository(Generic[T]):
         self.logger.debug(f"{self.__class__.__name__} created")
         self.data_type = data_type
         self.collection = persistence_manager.get_collection(collection_name)
+        # Last document written for each key by 'save_incremental', used to compute the differences
+        self._persisted_documents: Dict[Any, dict] = {}
+        # Documents waiting to be written, with the key field and the fields known to be reassigned
+        self._pending_documents: Dict[Any, Tuple[str, dict, Set[str]]] = {}
+        self._persistence_lock = threading.RLock()
+        self._write_behind_window = persistence_manager.write_behind_window
+        self._flush_timer: Optional[threading.Timer] = None
+        persistence_manager.register_repository(self)
 
     def find_one(self, query: dict) -> T:
         return self.data_type.model_validate(self.collection.find_one(query, projection={'_id': False}))
@@ -44,4 +55,128 @@ class DatabaseRepository(Generic[T]):
         return self.collection.delete_one(data.model_dump())
 
     def delete_all(self):
+        self.forget_all_persisted()
         return self.collection.delete_many({})
+
+    def save_incremental(self, key_field: str, document: dict, replaced_fields: Iterable[str] = ()):
+        """
+        Save a document identified by the value of 'key_field', writing only the differences with the last saved version.
+        The first save of a document replaces it as a whole (upsert), following ones are translated in $set/$unset/$push
+        operations. If the document is not found anymore in the collection it is written again as a whole.
+
+        When write-behind is enabled in the PersistenceManager the document is queued: saves of the same key received
+        within the window are coalesced and written together with a single bulk write, see 'flush'.
+
+        Args:
+            key_field: The field that uniquely identifies the document in the collection
+            document: The document to be saved
+            replaced_fields: Top level fields known to be changed, they are written without comparing them
+        """
+        key = document[key_field]
+        with self._persistence_lock:
+            pending = self._pending_documents.get(key)
+            replaced_fields = set(replaced_fields)
+            if pending is not None:
+                replaced_fields |= pending[2]
+            self._pending_documents[key] = (key_field, document, replaced_fields)
+
+            if self._write_behind_window > 0:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self._write_behind_window, self._timed_flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            else:
+                self._flush_locked([key])
+
+    def flush(self, key: Optional[Any] = None):
+        """
+        Write the queued documents to the database
+
+        Args:
+            key: If given, only the document with this key is written, otherwise every queued document
+        """
+        with self._persistence_lock:
+            if key is None:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                self._flush_locked(list(self._pending_documents.keys()))
+            elif key in self._pending_documents:
+                self._flush_locked([key])
+
+    def _timed_flush(self):
+        with self._persistence_lock:
+            self._flush_timer = None
+            try:
+                self._flush_locked(list(self._pending_documents.keys()))
+            except Exception as e:
+                self.logger.error(f"Error writing queued documents: {e}", exc_info=e)
+
+    def _flush_locked(self, keys: List[Any]):
+        """
+        Write the queued documents with the given keys using a single bulk write.
+        Must be called holding the persistence lock.
+        """
+        if len(keys) == 0:
+            return
+        flushed = {key: self._pending_documents.pop(key) for key in keys}
+        operations = []
+        # Keys written with UpdateOne, grouped by key field, they fail if the document has been removed
+        updated_keys: Dict[str, List[Any]] = {}
+        for key, (key_field, document, replaced_fields) in flushed.items():
+            previous = self._persisted_documents.get(key)
+            if previous is None:
+                operations.append(ReplaceOne({key_field: key}, document, upsert=True))
+            else:
+                update = compute_document_update(previous, document, replaced_fields)
+                if update:
+                    operations.append(UpdateOne({key_field: key}, update))
+                    updated_keys.setdefault(key_field, []).append(key)
+
+        if operations:
+            try:
+                result = self.collection.bulk_write(operations, ordered=False)
+            except Exception:
+                # Put the documents back in the queue, they will be written by the next flush
+                for key, pending in flushed.items():
+                    self._pending_documents.setdefault(key, pending)
+                raise
+            if result.matched_count + result.upserted_count < len(operations):
+                # Some documents have been removed from the collection behind our back, write only those as a whole
+                missing_keys = []
+                for key_field, keys_of_field in updated_keys.items():
+                    found = {element[key_field] for element in self.collection.find({key_field: {'$in': keys_of_field}}, projection={'_id': False, key_field: True})}
+                    missing_keys.extend(key for key in keys_of_field if key not in found)
+                if missing_keys:
+                    self.logger.warning(f"{len(missing_keys)} documents not found, writing them as a whole")
+                    self.collection.bulk_write([ReplaceOne({flushed[key][0]: key}, flushed[key][1], upsert=True) for key in missing_keys], ordered=False)
+
+        for key, (key_field, document, replaced_fields) in flushed.items():
+            self._persisted_documents[key] = document
+
+    def get_saved_document(self, key: Any) -> Optional[dict]:
+        """
+        Get the last version of a document given to 'save_incremental', even if it is still queued
+
+        Returns:
+            The document, None if it has not been saved yet by this repository
+        """
+        with self._persistence_lock:
+            pending = self._pending_documents.get(key)
+            if pending is not None:
+                return pending[1]
+            return self._persisted_documents.get(key)
+
+    def forget_persisted(self, key: Any):
+        """
+        Discard the queued and the last saved version of a document, the next save will write it as a whole.
+        Must be called before deleting the document from the collection, otherwise a queued write could recreate it.
+        """
+        with self._persistence_lock:
+            self._pending_documents.pop(key, None)
+            self._persisted_documents.pop(key, None)
+
+    def forget_all_persisted(self):
+        with self._persistence_lock:
+            self._pending_documents.clear()
+            self._persisted_documents.clear()
@@ -0,0 +1,75 @@
+from typing import Any, Dict, Iterable
+
+
+def _is_path_safe(key: Any) -> bool:
+    """
+    Check if a dictionary key can be used as a component of a MongoDB dotted path
+    """
+    return isinstance(key, str) and len(key) > 0 and "." not in key and not key.startswith("$")
+
+
+def _diff_value(path: str, old: Any, new: Any, set_ops: Dict[str, Any], unset_ops: Dict[str, Any], push_ops: Dict[str, Any]):
+    # Removed keys are unset by path too, so the keys of both versions must be valid path components
+    if isinstance(old, dict) and isinstance(new, dict) and all(_is_path_safe(key) for key in [*old.keys(), *new.keys()]):
+        _diff_dict(f"{path}.", old, new, set_ops, unset_ops, push_ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        if len(new) > len(old) and new[:len(old)] == old:
+            # Append only list (e.g. call history), push the new elements
+            push_ops[path] = {"$each": new[len(old):]}
+        elif len(new) == len(old):
+            for idx, (old_item, new_item) in enumerate(zip(old, new)):
+                if old_item != new_item:
+                    _diff_value(f"{path}.{idx}", old_item, new_item, set_ops, unset_ops, push_ops)
+        else:
+            set_ops[path] = new
+    else:
+        set_ops[path] = new
+
+
+def _diff_dict(prefix: str, old: dict, new: dict, set_ops: Dict[str, Any], unset_ops: Dict[str, Any], push_ops: Dict[str, Any], skip: Iterable[str] = ()):
+    for key in old.keys():
+        if key not in new and key not in skip:
+            unset_ops[f"{prefix}{key}"] = ""
+    for key, new_value in new.items():
+        if key in skip:
+            continue
+        if key not in old:
+            set_ops[f"{prefix}{key}"] = new_value
+        elif old[key] != new_value:
+            _diff_value(f"{prefix}{key}", old[key], new_value, set_ops, unset_ops, push_ops)
+
+
+def compute_document_update(old: dict, new: dict, replaced_fields: Iterable[str] = ()) -> dict:
+    """
+    Compute the MongoDB update operators that transform the 'old' document into the 'new' one.
+    Only the changed sub-documents are written, lists that only had elements appended are extended with '$push'.
+
+    Args:
+        old: The document as it is currently stored in the database
+        new: The document to be stored
+        replaced_fields: Top level fields known to be changed, they are set as a whole without comparing them
+
+    Returns:
+        The update document to be given to 'update_one', empty if the documents are equal
+    """
+    set_ops: Dict[str, Any] = {}
+    unset_ops: Dict[str, Any] = {}
+    push_ops: Dict[str, Any] = {}
+
+    replaced_fields = set(replaced_fields)
+    for field in replaced_fields:
+        if field in new:
+            set_ops[field] = new[field]
+        elif field in old:
+            unset_ops[field] = ""
+
+    _diff_dict("", old, new, set_ops, unset_ops, push_ops, skip=replaced_fields)
+
+    update = {}
+    if set_ops:
+        update["$set"] = set_ops
+    if unset_ops:
+        update["$unset"] = unset_ops
+    if push_ops:
+        update["$push"] = push_ops
+    return update
@@ -2,12 +2,13 @@ from typing import Optional, List
 
 from nfvcl_core.database.database_repository import DatabaseRepository
 from nfvcl_core.managers.persistence_manager import PersistenceManager
-from nfvcl_core_models.performance import BlueprintPerformance
+from nfvcl_core_models.performance import BlueprintPerformance, BlueprintPerformanceOperation, BlueprintPerformanceHistoryOperation
 
 
 class PerformanceRepository(DatabaseRepository[BlueprintPerformance]):
     def __init__(self, persistence_manager: PersistenceManager):
         super().__init__(persistence_manager, "performances", data_type=BlueprintPerformance)
+        self.history_collection = persistence_manager.get_collection("performances_history")
 
     def find_by_blueprint_id(self, blueprint_id: str) -> Optional[BlueprintPerformance]:
         try:
@@ -22,8 +23,25 @@ class PerformanceRepository(DatabaseRepository[BlueprintPerformance]):
         return self.get_all()
 
     def update_blueprint_performance(self, blueprint_performance: BlueprintPerformance) -> BlueprintPerformance:
-        self.collection.update_one({ "blueprint_id": blueprint_performance.blueprint_id }, { "$set": blueprint_performance.model_dump()}, upsert=True)
+        self.save_incremental('blueprint_id', blueprint_performance.model_dump())
         return blueprint_performance
 
+    def archive_operations(self, blueprint_id: str, operations: List[BlueprintPerformanceOperation]):
+        """
+        Move operations to the history collection
+        Args:
+            blueprint_id: The blueprint to which the operations belong
+            operations: The operations to be archived
+        """
+        if len(operations) > 0:
+            self.history_collection.insert_many([BlueprintPerformanceHistoryOperation(blueprint_id=blueprint_id, **operation.model_dump()).model_dump() for operation in operations])
+
+    def get_archived_operations(self, blueprint_id: str) -> List[BlueprintPerformanceHistoryOperation]:
+        """
+        Get the archived operations of a blueprint, the oldest ones may have been discarded
+        """
+        return [BlueprintPerformanceHistoryOperation.model_validate(element) for element in self.history_collection.find({'blueprint_id': blueprint_id}, projection={'_id': False})]
+
     def delete_by_blueprint_id(self, blueprint_id: str):
+        self.forget_persisted(blueprint_id)
         self.collection.delete_one({'blueprint_id': blueprint_id})
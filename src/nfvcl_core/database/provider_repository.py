@@ -10,10 +10,7 @@ class ProviderDataRepository(DatabaseRepository[ProviderDataAggregate]):
         super().__init__(persistence_manager, "providers", data_type = ProviderDataAggregate)
 
     def save_provider_data(self, provider_data: ProviderDataAggregate):
-        if self.collection.find_one({'blueprint_id': provider_data.blueprint_id}):
-            self.collection.update_one({'blueprint_id': provider_data.blueprint_id}, {'$set': provider_data.model_dump()})
-        else:
-            self.collection.insert_one(provider_data.model_dump())
+        self.save_incremental('blueprint_id', provider_data.model_dump())
 
     def find_by_blueprint_id(self, blueprint_id: str) -> Optional[ProviderDataAggregate]:
         try:
@@ -22,4 +19,5 @@ class ProviderDataRepository(DatabaseRepository[ProviderDataAggregate]):
             return None
 
     def delete_by_blueprint_id(self, blueprint_id: str):
+        self.forget_persisted(blueprint_id)
         return self.collection.delete_one({'blueprint_id': blueprint_id})
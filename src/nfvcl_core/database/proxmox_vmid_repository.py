@@ -0,0 +1,20 @@
+from typing import Set
+
+from nfvcl_core.database.database_repository import DatabaseRepository
+from nfvcl_core.managers.persistence_manager import PersistenceManager
+from nfvcl_core_models.vim.vim_models import ProxmoxVmidReservations
+
+
+class ProxmoxVmidRepository(DatabaseRepository[ProxmoxVmidReservations]):
+    def __init__(self, persistence_manager: PersistenceManager):
+        super().__init__(persistence_manager, "proxmox-vmids", data_type=ProxmoxVmidReservations)
+
+    def get_reserved_vmids(self, vim_name: str) -> Set[int]:
+        reservations = self.find_one_safe({'vim_name': vim_name})
+        return set(reservations.vmids) if reservations else set()
+
+    def reserve_vmid(self, vim_name: str, vmid: int):
+        self.collection.update_one({'vim_name': vim_name}, {'$addToSet': {'vmids': vmid}}, upsert=True)
+
+    def release_vmid(self, vim_name: str, vmid: int):
+        self.collection.update_one({'vim_name': vim_name}, {'$pull': {'vmids': vmid}})
@@ -1,3 +1,5 @@
+from typing import Optional, Iterable
+
 from nfvcl_core.database.database_repository import DatabaseRepository
 from nfvcl_core.managers.persistence_manager import PersistenceManager
 from nfvcl_core_models.topology_models import TopologyModel
@@ -11,8 +13,51 @@ class TopologyRepository(DatabaseRepository[TopologyModel]):
         elements = self.get_all()
         return elements[0] if elements else None
 
-    def save_topology(self, topology: TopologyModel) -> None:
-        if self.collection.find_one({'id': topology.id}):
-            self.collection.update_one({'id': topology.id}, {'$set': topology.model_dump()})
+    def save_topology(self, topology: TopologyModel, sections: Optional[Iterable[str]] = None) -> None:
+        """
+        Save the topology, only the changed parts of the document are written to the database
+        Args:
+            topology: The topology to be saved
+            sections: The topology fields that have been changed, if given only they are serialized. If not given, or if
+                the topology has not been saved yet, the whole topology is serialized.
+        """
+        saved_document = self.get_saved_document(topology.id) if sections is not None else None
+        if saved_document is None:
+            document = topology.model_dump()
         else:
-            self.collection.insert_one(topology.model_dump())
+            document = {**saved_document, **topology.model_dump(include=set(sections))}
+        self.save_incremental('id', document)
+
+    def save_k8s_deployed_blueprints(self, topology: TopologyModel, cluster_name: str) -> None:
+        """
+        Save only the list of the blueprints deployed on a k8s cluster, without serializing the rest of the topology
+        Args:
+            topology: The topology containing the cluster
+            cluster_name: The name of the k8s cluster
+        """
+        deployed_blueprints = list(topology.get_k8s_cluster(cluster_name).deployed_blueprints)
+        with self._persistence_lock:
+            # Queued writes of the topology must reach the database before this one
+            self.flush(topology.id)
+            saved_document = self._persisted_documents.get(topology.id)
+            saved_clusters = saved_document.get("kubernetes", []) if saved_document is not None else []
+            cluster_index = next((idx for idx, cluster in enumerate(saved_clusters) if cluster.get("name") == cluster_name), None)
+            if cluster_index is None:
+                self.save_topology(topology, sections=["kubernetes"])
+                return
+
+            result = self.collection.update_one(
+                {'id': topology.id},
+                {'$set': {'kubernetes.$[cluster].deployed_blueprints': deployed_blueprints}},
+                array_filters=[{'cluster.name': cluster_name}]
+            )
+            if result.matched_count == 0:
+                self.logger.warning(f"Topology {topology.id} not found, writing it as a whole")
+                self.forget_persisted(topology.id)
+                self.save_topology(topology)
+                return
+
+            # Keep the last saved version aligned with the database, without modifying the previous one in place
+            clusters = list(saved_clusters)
+            clusters[cluster_index] = {**saved_clusters[cluster_index], "deployed_blueprints": deployed_blueprints}
+            self._persisted_documents[topology.id] = {**saved_document, "kubernetes": clusters}
@@ -36,6 +36,19 @@ from nfvcl_common.utils.util import generate_blueprint_id
 BLUEPRINTS_MODULE_FOLDER: str = "nfvcl.blueprints_ng.modules"
 
 
+class BlueprintSummarySnapshot:
+    """
+    Read-only summary of a blueprint, taken when the blueprint is created, when its status changes and at the end of
+    every operation on it.
+    """
+    def __init__(self, blueprint: BlueprintNG):
+        self.blue_type: str = blueprint.base_model.type
+        self.parent_blue_id: Optional[str] = blueprint.base_model.parent_blue_id
+        self.children_blue_ids: List[str] = list(blueprint.base_model.children_blue_ids)
+        self.summary: dict = blueprint.to_dict(detailed=False)
+        self.summary["status"] = blueprint.base_model.status.model_copy()
+
+
 class BlueprintManager(GenericManager):
     """
     This class is responsible for managing blueprints.
@@ -56,6 +69,7 @@ class BlueprintManager(GenericManager):
         self._performance_manager = performance_manager
         self._event_manager = event_manager
         self._vim_clients_manager = vim_clients_manager
+        self._summary_snapshots: Dict[str, BlueprintSummarySnapshot] = {}
 
     def load(self):
         """
@@ -77,6 +91,21 @@ class BlueprintManager(GenericManager):
         self.blueprint_dict[blueprint.id] = blueprint
         self._blueprint_repository.save_blueprint(blueprint.base_model)
         self._provider_repository.save_provider_data(blueprint.provider.get_provider_data_aggregate())
+        # Saves in the middle of an operation do not refresh the summary, it is taken again by flush_blueprint
+        if blueprint.id not in self._summary_snapshots:
+            self._summary_snapshots[blueprint.id] = BlueprintSummarySnapshot(blueprint)
+
+    def flush_blueprint(self, blueprint_id: str) -> None:
+        """
+        Write the queued saves of the blueprint to the database, called at the end of every operation on the blueprint
+        Args:
+            blueprint_id: The ID of the blueprint to be flushed
+        """
+        self._blueprint_repository.flush(blueprint_id)
+        self._provider_repository.flush(blueprint_id)
+        blueprint = self.blueprint_dict.get(blueprint_id)
+        if blueprint is not None:
+            self._summary_snapshots[blueprint_id] = BlueprintSummarySnapshot(blueprint)
 
     def destroy_blueprint(self, blueprint: BlueprintNG) -> None:
         """
@@ -85,6 +114,7 @@ class BlueprintManager(GenericManager):
             blueprint: The blueprint to be destroyed
         """
         self.blueprint_dict.pop(blueprint.id)
+        self._summary_snapshots.pop(blueprint.id, None)
         self._blueprint_repository.delete_blueprint(blueprint.id)
         self._provider_repository.delete_by_blueprint_id(blueprint.id)
 
@@ -154,6 +184,7 @@ class BlueprintManager(GenericManager):
             )
             blueprint_instance.provider = provider
             self.blueprint_dict[item['id']] = blueprint_instance
+            self._summary_snapshots[item['id']] = BlueprintSummarySnapshot(blueprint_instance)
 
     def create_blueprint(self, path: str, msg: Any, parent_id: str | None = None, pre_work_callback: Optional[Callable[[PreWorkCallbackResponse], None]] = None) -> str:
         """
@@ -205,9 +236,11 @@ class BlueprintManager(GenericManager):
                 except Exception as e:
                     self.logger.error(f"Error during the creation of blueprint {blue_id}. Error: {e}")
                     self.set_blueprint_status(blue_id, BlueprintNGStatus.error_state(str(e)))
-                    self._performance_manager.set_error(blue_id, True)
+                    self.flush_blueprint(blue_id)
+                    self._performance_manager.end_operation(performance_operation_id, error=True)
                     raise e
                 self.set_blueprint_status(blue_id, BlueprintNGStatus.idle())
+                self.flush_blueprint(blue_id)
                 duration = self._performance_manager.end_operation(performance_operation_id)
                 self._event_manager.fire_event(NFVCLEventTopics.BLUEPRINT_TOPIC, BlueEventType.BLUE_CREATED, data=created_blue.base_model)
                 self.logger.success(f"Blueprint {blue_id} created successfully in {duration / 1000} seconds")
@@ -257,11 +290,13 @@ class BlueprintManager(GenericManager):
             except Exception as e:
                 self.logger.error(f"Error during the update of blueprint {blueprint_id}. Error: {e}")
                 self.set_blueprint_status(blueprint.id, BlueprintNGStatus.error_state(str(e)))
-                self._performance_manager.set_error(blueprint.id, True)
+                self.flush_blueprint(blueprint.id)
+                self._performance_manager.end_operation(performance_operation_id, error=True)
                 raise e
             self._performance_manager.end_operation(performance_operation_id)
 
             self.set_blueprint_status(blueprint.id, BlueprintNGStatus.idle())
+            self.flush_blueprint(blueprint.id)
             # EVENT FIRE
             self._event_manager.fire_event(NFVCLEventTopics.BLUEPRINT_TOPIC, BlueEventType.BLUE_UPDATED, data=blueprint.base_model)
         return result
@@ -309,8 +344,10 @@ class BlueprintManager(GenericManager):
             performance_operation_id = self._performance_manager.start_operation(blueprint_id, BlueprintPerformanceType.CROSS_BLUEPRINT_FUNCTION_CALL, function_name)
             call_msg = RegisteredBlueprintCall(function_name=function_name, extra={"args": f"{args}", "kwargs": f"{kwargs}"})
             blueprint.base_model.day_2_call_history.append(call_msg)
-            result = getattr(blueprint, function_name)(*args, **kwargs)
-            self._performance_manager.end_operation(performance_operation_id)
+            try:
+                result = getattr(blueprint, function_name)(*args, **kwargs)
+            finally:
+                self._performance_manager.end_operation(performance_operation_id)
         return result
 
     def delete_blueprint(self, blueprint_id: str, force_deletion: Optional[bool] = False, pre_work_callback: Optional[Callable[[PreWorkCallbackResponse], None]] = None) -> str:
@@ -342,6 +379,7 @@ class BlueprintManager(GenericManager):
                 self.set_blueprint_status(blueprint_id, BlueprintNGStatus.destroying(blueprint_id))
                 blueprint_instance.destroy()
                 self.blueprint_dict.pop(blueprint_id)
+                self._summary_snapshots.pop(blueprint_id, None)
                 self._blueprint_repository.delete_blueprint(blueprint_id)
                 self._provider_repository.delete_by_blueprint_id(blueprint_id)
             except Exception as e:
@@ -349,12 +387,14 @@ class BlueprintManager(GenericManager):
                     self.logger.warning("Force deletion is enabled! Blue will be destroyed without ensuring that resources are deleted from remote VIMs or K8S Clusters")
                     self.logger.error(f"Error during deletion of blueprint {blueprint_id}. Error: {e}")
                     self.blueprint_dict.pop(blueprint_id)
+                    self._summary_snapshots.pop(blueprint_id, None)
                     self._blueprint_repository.delete_blueprint(blueprint_id)
                     self._provider_repository.delete_by_blueprint_id(blueprint_id)
                 else:
                     self.logger.error(f"Error during deletion of blueprint {blueprint_id}. Error: {e}")
                     self.set_blueprint_status(blueprint_id, BlueprintNGStatus.error_state(str(e)))
-                    self._performance_manager.set_error(blueprint_id, True)
+                    self.flush_blueprint(blueprint_id)
+                    self._performance_manager.end_operation(performance_operation_id, error=True)
                     raise e
             self._performance_manager.end_operation(performance_operation_id)
             self.logger.success(f"Blueprint {blueprint_id} deleted successfully")
@@ -386,6 +426,7 @@ class BlueprintManager(GenericManager):
         blueprint = self.get_blueprint_instance(blueprint_id)
         blueprint.base_model.protected = protect
         blueprint.to_db()
+        self.flush_blueprint(blueprint_id)
         return self.get_blueprint_summary_by_id(blueprint_id, detailed=False)
 
     def get_blueprint_summary_by_id(self, blueprint_id: str, detailed: bool = False) -> dict:
@@ -423,6 +464,49 @@ class BlueprintManager(GenericManager):
         else:
             return [blueprint.to_dict(detailed=detailed) for blueprint in blue_list]
 
+    def _snapshot_to_dict(self, snapshots: Dict[str, BlueprintSummarySnapshot], snapshot: BlueprintSummarySnapshot, include_childrens: bool) -> dict:
+        dict_to_ret = dict(snapshot.summary)
+        if include_childrens:
+            dict_to_ret["childrens"] = []
+            for children_id in snapshot.children_blue_ids:
+                children_snapshot = snapshots.get(children_id)
+                if children_snapshot is None:
+                    self.logger.warning(f"The children blueprint {children_id} has not been found. Could be deleted before, skipping...")
+                    continue
+                dict_to_ret["childrens"].append(self._snapshot_to_dict(snapshots, children_snapshot, include_childrens))
+        return dict_to_ret
+
+    def get_blueprint_summary_by_id_snapshot(self, blueprint_id: str) -> dict:
+        """
+        Retrieves the blueprint summary from the read-only snapshots, this can be called from any thread without going through the TaskManager.
+        Args:
+            blueprint_id: The blueprint to be retrieved.
+
+        Returns:
+            The summary of the blueprint as of its last save
+        """
+        snapshot = self._summary_snapshots.get(blueprint_id)
+        if snapshot is None:
+            raise NFVCLCoreException(f"Blueprint {blueprint_id} not found")
+        return dict(snapshot.summary)
+
+    def get_blueprint_summary_list_snapshot(self, blue_type: Optional[str], tree: bool = False) -> List[dict]:
+        """
+        Retrieves the summary of all the blueprints from the read-only snapshots, this can be called from any thread without going through the TaskManager.
+        Args:
+            blue_type: The optional filter to be used to filter results on a type basis (e.g., 'vyos').
+            tree: If true, return the tree structure of the blueprints.
+
+        Returns:
+            The summary of all blueprints that satisfy the given filter, as of their last save.
+        """
+        snapshots = dict(self._summary_snapshots)
+        filtered = [snapshot for snapshot in snapshots.values() if not blue_type or snapshot.blue_type == blue_type]
+        if tree:
+            return [self._snapshot_to_dict(snapshots, snapshot, include_childrens=True) for snapshot in filtered if snapshot.parent_blue_id is None]
+        else:
+            return [self._snapshot_to_dict(snapshots, snapshot, include_childrens=False) for snapshot in filtered]
+
     def get_vm_target_by_ip(self, ipv4: str) -> VmResource | None:
         """
         Check if there is a VM, belonging to any Blueprint, that have the required IP as interface
@@ -565,4 +649,5 @@ class BlueprintManager(GenericManager):
         blueprint = self.get_blueprint_instance(blueprint_id)
         blueprint.base_model.status = status
         blueprint.to_db()
+        self._summary_snapshots[blueprint_id] = BlueprintSummarySnapshot(blueprint)
         self._event_manager.fire_event(NFVCLEventTopics.BLUEPRINT_TOPIC, BlueEventType.BLUE_STATUS_CHANGED, data=blueprint.base_model)
@@ -1,5 +1,5 @@
 from time import sleep
-from typing import List
+from typing import List, Dict
 
 from kubernetes.client import V1PodList, V1Namespace, ApiException, V1ServiceAccountList, V1NamespaceList, \
     V1RoleBinding, V1ClusterRoleBinding, V1ServiceAccount, V1Secret, V1SecretList, V1ResourceQuota, V1NodeList, V1Node, \
@@ -12,12 +12,12 @@ from nfvcl_core.managers.generic_manager import GenericManager
 from nfvcl_common.utils.blue_utils import yaml
 from nfvcl_core.managers.topology_manager import TopologyManager
 from nfvcl_core.utils.k8s.helm_plugin_manager import HelmPluginManager
-from nfvcl_core.utils.k8s.k8s_utils import get_k8s_config_from_file_content
+from nfvcl_core.utils.k8s.k8s_client_cache import k8s_client_cache
 from nfvcl_core.utils.k8s.kube_api_utils_class import KubeApiUtils
 from nfvcl_core_models.custom_types import NFVCLCoreException
 from nfvcl_core_models.k8s_management_models import Labels
 from nfvcl_core_models.plugin_k8s_model import K8sPluginName, K8sPluginsToInstall, K8sLoadBalancerPoolArea, \
-    K8sPluginAdditionalData, K8sMonitoringConfig
+    K8sPluginAdditionalData, K8sMonitoringConfig, K8sPluginInstallReport
 from nfvcl_core_models.response_model import OssCompliantResponse, OssStatus
 from nfvcl_core_models.topology_k8s_model import TopologyK8sModel, K8sQuota
 
@@ -28,7 +28,7 @@ class KubernetesManager(GenericManager):
         self._topology_manager = topology_manager
         self._blueprint_manager = blueprint_manager
         self._event_manager = event_manager
-        self._k8s_api_utils_cache = {}
+        self._helm_plugin_managers: Dict[str, HelmPluginManager] = {}
 
     def get_k8s_api_utils(self, cluster_id: str) -> KubeApiUtils:
         """
@@ -40,12 +40,25 @@ class KubernetesManager(GenericManager):
         Returns:
             An instance of KubeApiUtils for the specified cluster.
         """
-        if cluster_id not in self._k8s_api_utils_cache:
-            cluster: TopologyK8sModel = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
-            k8s_config = get_k8s_config_from_file_content(cluster.credentials)
-            self._k8s_api_utils_cache[cluster_id] = KubeApiUtils(kube_client_config=k8s_config)
+        cluster: TopologyK8sModel = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
+        return k8s_client_cache.get_kube_api_utils(cluster.credentials, cluster_id)
+
+    def get_helm_plugin_manager(self, cluster_id: str) -> HelmPluginManager:
+        """
+        Get the HelmPluginManager for the specified cluster, it is created again only if the cluster credentials change.
+
+        Args:
+            cluster_id: The ID of the Kubernetes cluster.
 
-        return self._k8s_api_utils_cache[cluster_id]
+        Returns:
+            The HelmPluginManager of the cluster.
+        """
+        cluster: TopologyK8sModel = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
+        helm_plugin_manager = self._helm_plugin_managers.get(cluster_id)
+        if helm_plugin_manager is None or helm_plugin_manager.k8s_credential_file != cluster.credentials:
+            helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
+            self._helm_plugin_managers[cluster_id] = helm_plugin_manager
+        return helm_plugin_manager
 
     def get_k8s_installed_plugins(self, cluster_id: str) -> List[K8sPluginName]:
         """
@@ -60,14 +73,13 @@ class KubernetesManager(GenericManager):
             A list of installed plugins
         """
         try:
-            cluster: TopologyK8sModel = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
-            helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
+            helm_plugin_manager = self.get_helm_plugin_manager(cluster_id)
             return helm_plugin_manager.get_installed_plugins()
         except ValueError as val_err:
             self.logger.error(val_err)
             raise NFVCLCoreException(message=str(val_err), http_equivalent_code=404)
 
-    def install_plugins(self, cluster_id: str, plug_to_install_list: K8sPluginsToInstall):
+    def install_plugins(self, cluster_id: str, plug_to_install_list: K8sPluginsToInstall) -> K8sPluginInstallReport:
         """
         Install a plugin to a target k8s cluster
 
@@ -76,10 +88,10 @@ class KubernetesManager(GenericManager):
 
             plug_to_install_list: The list of enabled plugins to be installed together with data to fill plugin file
             templates.
-        """
-        # Getting k8s cluster from topology
-        cluster = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
 
+        Returns:
+            The installation report, with the outcome and the time spent for every plugin
+        """
         lb_pool: K8sLoadBalancerPoolArea = plug_to_install_list.load_balancer_pool
         k8s_api = self.get_k8s_api_utils(cluster_id)
         pod_network_cidr = k8s_api.get_cidr_info()
@@ -87,10 +99,11 @@ class KubernetesManager(GenericManager):
         # Create additional data for plugins (lbpool and cidr)
         template_fill_data = K8sPluginAdditionalData(areas=[lb_pool] if lb_pool else None, pod_network_cidr=pod_network_cidr)
 
-        helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
-        helm_plugin_manager.install_plugins(plug_to_install_list.plugin_list, template_fill_data)
+        helm_plugin_manager = self.get_helm_plugin_manager(cluster_id)
+        report = helm_plugin_manager.install_plugins(plug_to_install_list.plugin_list, template_fill_data)
 
-        self.logger.success(f"Plugins {plug_to_install_list.plugin_list} have been installed")
+        self.logger.success(f"Plugins {plug_to_install_list.plugin_list} have been installed in {report.duration:.1f}s")
+        return report
 
     def retrieve_monitoring_data(self, cluster_id: str, loki_id: str, prometheus_id: str):
         """
@@ -139,7 +152,7 @@ class KubernetesManager(GenericManager):
                     k8smonitoring_node_exporter_label=config.node_exporter_label,
                     k8smonitoring_cluster_id=cluster_id
                 )
-                helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
+                helm_plugin_manager = self.get_helm_plugin_manager(cluster_id)
                 config = helm_plugin_manager.install_k8s_monitoring(template_fill_data)
                 self._topology_manager.add_edit_k8s_cluster_monitoring_metrics(cluster_id, config)
                 self.logger.success(f"Plugins {[K8sPluginName.K8S_MONITORING]} have been installed")
@@ -161,7 +174,7 @@ class KubernetesManager(GenericManager):
             cluster, loki, prometheus = self.retrieve_monitoring_data(cluster_id, loki_id, prometheus_id)
             if cluster and (loki or prometheus):
                 template_fill_data = K8sPluginAdditionalData(loki=loki, prometheus=prometheus, k8smonitoring_config=metrics)
-                helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
+                helm_plugin_manager = self.get_helm_plugin_manager(cluster_id)
                 config = helm_plugin_manager.add_metrics_destination(template_fill_data)
                 if config == tmp:
                     self.logger.warning("Destination already exits")
@@ -192,7 +205,7 @@ class KubernetesManager(GenericManager):
             cluster, loki, prometheus = self.retrieve_monitoring_data(cluster_id, loki_id, prometheus_id)
             if cluster and (loki or prometheus):
                 template_fill_data = K8sPluginAdditionalData(loki=loki, prometheus=prometheus, k8smonitoring_config=metrics)
-                helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
+                helm_plugin_manager = self.get_helm_plugin_manager(cluster_id)
                 config = helm_plugin_manager.del_metrics_destination(template_fill_data)
                 if config == metrics:
                     self.logger.warning("Destination not exits")
@@ -213,9 +226,7 @@ class KubernetesManager(GenericManager):
             cluster_id: The target k8s cluster
             namespace: Namespace to be uninstalled
         """
-        cluster = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
-
-        helm_plugin_manager = HelmPluginManager(cluster.credentials, cluster_id)
+        helm_plugin_manager = self.get_helm_plugin_manager(cluster_id)
         helm_plugin_manager.uninstall_plugin(namespace.lower(), wait=wait)
         self.logger.success(f"Plugin at namespace {namespace.lower()} have been uninstalled")
 
@@ -391,10 +402,6 @@ class KubernetesManager(GenericManager):
             A user list (V1ServiceAccountList)
         """
 
-        # Get k8s cluster and k8s config for client
-        cluster: TopologyK8sModel = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
-        k8s_config = get_k8s_config_from_file_content(cluster.credentials)
-
         try:
             k8s_api = self.get_k8s_api_utils(cluster_id)
             user_accounts: V1ServiceAccountList = k8s_api.get_service_accounts(namespace=namespace, username=username)
@@ -419,10 +426,6 @@ class KubernetesManager(GenericManager):
             A role list (V1ClusterRoleList)
         """
 
-        # Get k8s cluster and k8s config for client
-        cluster: TopologyK8sModel = self._topology_manager.get_k8s_cluster_by_id(cluster_id)
-        k8s_config = get_k8s_config_from_file_content(cluster.credentials)
-
         try:
             k8s_api = self.get_k8s_api_utils(cluster_id)
             role_list: V1RoleList = k8s_api.get_roles(rolename=rolename, namespace=namespace)
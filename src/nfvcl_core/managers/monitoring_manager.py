@@ -1,62 +1,197 @@
-from typing import Dict
+import shlex
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
 
+import yaml
 from grafana_client import GrafanaApi
 from grafana_client.client import GrafanaClientError
+from paramiko.client import SSHClient
 
-from nfvcl_common.ansible_builder import AnsiblePlaybookBuilder
+from nfvcl_common.utils.ssh_utils import ssh_connection_manager
 from nfvcl_core.managers.generic_manager import GenericManager
-from nfvcl_common.ansible_utils import run_ansible_playbook
 from nfvcl_core.managers.topology_manager import TopologyManager
 from nfvcl_core_models.custom_types import NFVCLCoreException
-from nfvcl_core_models.monitoring.grafana_model import GrafanaFolderModel, GrafanaDashboardModel
+from nfvcl_core_models.monitoring.grafana_model import GrafanaFolderModel, GrafanaDashboardModel, GrafanaServerModel
+from nfvcl_core_models.monitoring.prometheus_model import PrometheusServerModel
+
+# Seconds for which the uploads of the Prometheus targets are delayed, to coalesce the changes in a single upload
+PROMETHEUS_SYNC_DEBOUNCE = 0.5
+# Permissions of the uploaded sd_file, the same given by the Ansible copy used before
+PROMETHEUS_SD_FILE_MODE = 0o777
+# Seconds after which the sudo command moving the sd_file is considered failed
+PROMETHEUS_SUDO_TIMEOUT = 30
 
 
 class MonitoringManager(GenericManager):
     def __init__(self, topology_manager: TopologyManager):
         super().__init__()
         self._topology_manager = topology_manager
-
-    def sync_prometheus_targets_to_server(self, prometheus_server_id: str):
+        # Grafana clients are reused to keep the HTTP connections open, server ID -> (connection parameters, client)
+        self._grafana_clients: Dict[str, Tuple[Tuple, GrafanaApi]] = {}
+        # (server ID, datasource name) -> datasource UID
+        self._grafana_datasource_uids: Dict[Tuple[str, str], str] = {}
+        self._grafana_lock = threading.Lock()
+        # Debounced uploads of the Prometheus sd_file, server ID -> (timer, future completed by the upload)
+        self._prometheus_sync_timers: Dict[str, Tuple[threading.Timer, Future]] = {}
+        self._prometheus_sync_lock = threading.Lock()
+        self._prometheus_upload_locks: Dict[str, threading.Lock] = {}
+        # Server ID -> (address, SSH port, location, content) of the last sd_file uploaded
+        self._prometheus_uploaded: Dict[str, Tuple[str, int, str, str]] = {}
+
+    def _get_grafana_client(self, grafana_server: GrafanaServerModel) -> GrafanaApi:
+        """
+        Get the client of a Grafana server, the client is created again if the server address or credentials changed
+        """
+        connection = (grafana_server.ip, grafana_server.port, grafana_server.user, grafana_server.password)
+        with self._grafana_lock:
+            cached = self._grafana_clients.get(grafana_server.id)
+            if cached is not None and cached[0] == connection:
+                return cached[1]
+            grafana_client = GrafanaApi.from_url(
+                url=f"http://{grafana_server.ip}:{grafana_server.port}",
+                credential=(grafana_server.user, grafana_server.password),
+            )
+            self._grafana_clients[grafana_server.id] = (connection, grafana_client)
+            # The cached datasources may belong to a different server
+            for key in [key for key in self._grafana_datasource_uids.keys() if key[0] == grafana_server.id]:
+                del self._grafana_datasource_uids[key]
+            return grafana_client
+
+    def sync_prometheus_targets_to_server(self, prometheus_server_id: str) -> PrometheusServerModel:
+        """
+        Upload the sd_file with the targets to the Prometheus server immediately, a pending debounced upload is canceled
+        and its waiters get the result of this upload
+        Args:
+            prometheus_server_id: The ID of the Prometheus server
+
+        Returns:
+            The Prometheus server
+        """
         prometheus_server = self._topology_manager.get_prometheus(prometheus_server_id)
         if not prometheus_server:
             raise NFVCLCoreException(f"Prometheus server with ID '{prometheus_server_id}' not found in topology")
 
-        playbook_builder = AnsiblePlaybookBuilder(
-            name=f"Upload Prometheus targets file to {prometheus_server_id}",
-        )
+        with self._prometheus_sync_lock:
+            pending = self._prometheus_sync_timers.pop(prometheus_server_id, None)
+        if pending is not None:
+            pending[0].cancel()
 
-        playbook_builder.add_copy_task(prometheus_server.dump_sd_file(), prometheus_server.sd_file_location)
-
-        # Execute the playbook
         try:
-            result, fact_cache = run_ansible_playbook(
-                host=prometheus_server.ip,
-                username=prometheus_server.user,
-                password=prometheus_server.password,
-                playbook=playbook_builder.build(),
-                logger=self.logger
-            )
-
-            if result.status == "successful":
-                self.logger.info(f"Successfully uploaded Prometheus targets file to {prometheus_server.ip}")
-            else:
-                self.logger.error(f"Failed to upload Prometheus targets file. Status: {result.status}")
-
-            return result, fact_cache
-
+            self._upload_prometheus_sd_file(prometheus_server, force=True)
         except Exception as e:
-            self.logger.error(f"Error executing Ansible playbook: {str(e)}")
+            if pending is not None:
+                pending[1].set_exception(e)
             raise
+        if pending is not None:
+            pending[1].set_result(None)
+        return prometheus_server
+
+    def schedule_prometheus_targets_sync(self, prometheus_server_id: str) -> Future:
+        """
+        Upload the sd_file with the targets to the Prometheus server after PROMETHEUS_SYNC_DEBOUNCE seconds, the
+        requests received in the meantime are coalesced in a single upload of the latest targets
+        Args:
+            prometheus_server_id: The ID of the Prometheus server
+
+        Returns:
+            A future completed when the upload is done, shared by the coalesced requests. Its result raises the
+            exception of a failed upload.
+        """
+        if not self._topology_manager.get_prometheus(prometheus_server_id):
+            raise NFVCLCoreException(f"Prometheus server with ID '{prometheus_server_id}' not found in topology")
+
+        with self._prometheus_sync_lock:
+            pending = self._prometheus_sync_timers.get(prometheus_server_id)
+            if pending is not None:
+                return pending[1]
+            timer = threading.Timer(PROMETHEUS_SYNC_DEBOUNCE, self._timed_prometheus_sync, args=(prometheus_server_id,))
+            timer.daemon = True
+            future = Future()
+            self._prometheus_sync_timers[prometheus_server_id] = (timer, future)
+            timer.start()
+            return future
+
+    def _timed_prometheus_sync(self, prometheus_server_id: str):
+        with self._prometheus_sync_lock:
+            pending = self._prometheus_sync_timers.pop(prometheus_server_id, None)
+        if pending is None:
+            # Replaced by an immediate upload
+            return
+        try:
+            # Executed outside the workers, the snapshot is the only safe way to read the topology
+            prometheus_server = self._topology_manager.get_topology_snapshot().find_prom_srv(prometheus_server_id)
+            self._upload_prometheus_sd_file(prometheus_server)
+        except Exception as e:
+            self.logger.error(f"Error uploading Prometheus targets file to {prometheus_server_id}: {str(e)}")
+            pending[1].set_exception(e)
+            return
+        pending[1].set_result(None)
+
+    def _upload_prometheus_sd_file(self, prometheus_server: PrometheusServerModel, force: bool = False):
+        """
+        Upload the sd_file using the SFTP subsystem of a reused SSH connection, the file is replaced atomically.
+        If the user cannot write the location, the file is staged in the home of the user and moved with sudo.
+        Args:
+            prometheus_server: The Prometheus server
+            force: Upload the file even if the content did not change since the last upload
+        """
+        content = yaml.dump(prometheus_server.serialize_for_prometheus())
+        uploaded = (prometheus_server.ip, prometheus_server.ssh_port, prometheus_server.sd_file_location, content)
+        with self._prometheus_sync_lock:
+            upload_lock = self._prometheus_upload_locks.setdefault(prometheus_server.id, threading.Lock())
+
+        with upload_lock:
+            if not force and self._prometheus_uploaded.get(prometheus_server.id) == uploaded:
+                self.logger.debug(f"Prometheus targets file of {prometheus_server.id} not changed, skipping upload")
+                return
+            try:
+                ssh_client = ssh_connection_manager.get_client(prometheus_server.ip, prometheus_server.ssh_port, prometheus_server.user, prometheus_server.password)
+                tmp_location = f"{prometheus_server.sd_file_location}.tmp"
+                with ssh_client.open_sftp() as sftp:
+                    try:
+                        with sftp.open(tmp_location, "w") as sd_file:
+                            sd_file.write(content)
+                        sftp.chmod(tmp_location, PROMETHEUS_SD_FILE_MODE)
+                        # Prometheus watches the file, it must never read a partially written one
+                        sftp.posix_rename(tmp_location, prometheus_server.sd_file_location)
+                        privileged = False
+                    except PermissionError:
+                        staging_location = f".nfvcl_sd_file_{prometheus_server.id}.tmp"
+                        with sftp.open(staging_location, "w") as sd_file:
+                            sd_file.write(content)
+                        privileged = True
+                if privileged:
+                    self._move_prometheus_sd_file_privileged(ssh_client, prometheus_server, staging_location, tmp_location)
+            except Exception as e:
+                self.logger.error(f"Failed to upload Prometheus targets file to {prometheus_server.ip}: {str(e)}")
+                raise
+            self._prometheus_uploaded[prometheus_server.id] = uploaded
+            self.logger.info(f"Successfully uploaded Prometheus targets file to {prometheus_server.ip}")
+
+    def _move_prometheus_sd_file_privileged(self, ssh_client: SSHClient, prometheus_server: PrometheusServerModel, staging_location: str, tmp_location: str):
+        """
+        Move the staged sd_file to its location with sudo, on the same SSH connection. The password of the user is given
+        to sudo, it is ignored if sudo does not require it.
+        """
+        destination = prometheus_server.sd_file_location
+        script = (f"cp {shlex.quote(staging_location)} {shlex.quote(tmp_location)} && chmod {PROMETHEUS_SD_FILE_MODE:o} {shlex.quote(tmp_location)} "
+                  f"&& mv -f {shlex.quote(tmp_location)} {shlex.quote(destination)}; status=$?; rm -f {shlex.quote(staging_location)}; exit $status")
+        stdin, stdout, stderr = ssh_client.exec_command(f"sudo -S -p '' sh -c {shlex.quote(script)}", timeout=PROMETHEUS_SUDO_TIMEOUT)
+        stdin.write(f"{prometheus_server.password}\n")
+        stdin.flush()
+        # Without more input a second password prompt fails instead of waiting
+        stdin.channel.shutdown_write()
+        exit_status = stdout.channel.recv_exit_status()
+        if exit_status != 0:
+            raise NFVCLCoreException(f"Unable to write {destination} with sudo on {prometheus_server.ip}: {stderr.read().decode(errors='replace').strip()}")
 
     def sync_grafana_folders_to_server(self, grafana_server_id: str):
         grafana_server = self._topology_manager.get_grafana(grafana_server_id)
         if not grafana_server:
             raise NFVCLCoreException(f"Grafana server with ID '{grafana_server_id}' not found in topology")
 
-        grafana_client = GrafanaApi.from_url(
-            url=f"http://{grafana_server.ip}:{grafana_server.port}",
-            credential=(grafana_server.user, grafana_server.password),
-        )
+        grafana_client = self._get_grafana_client(grafana_server)
 
         # Create folders recursively
         def rec(folder_model: GrafanaFolderModel, parent_uid=None):
@@ -79,22 +214,24 @@ class MonitoringManager(GenericManager):
                 self.logger.debug(f"Folder with UID {folder['uid']} exists on Grafana but not in topology. Removing it.")
                 grafana_client.folder.delete_folder(folder["uid"])
 
-        self._topology_manager.save_to_db()
+        self._topology_manager.save_to_db("grafana_srv")
 
     def get_grafana_datasource_uid(self, grafana_server_id: str, datasource_name: str) -> str:
         grafana_server = self._topology_manager.get_grafana(grafana_server_id)
         if not grafana_server:
             raise NFVCLCoreException(f"Grafana server with ID '{grafana_server_id}' not found in topology")
 
-        grafana_client = GrafanaApi.from_url(
-            url=f"http://{grafana_server.ip}:{grafana_server.port}",
-            credential=(grafana_server.user, grafana_server.password),
-        )
+        grafana_client = self._get_grafana_client(grafana_server)
+
+        cached_uid = self._grafana_datasource_uids.get((grafana_server_id, datasource_name))
+        if cached_uid is not None:
+            return cached_uid
 
         datasource = grafana_client.datasource.get_datasource_by_name(datasource_name)
         if datasource is None:
             raise NFVCLCoreException(f"Datasource '{datasource_name}' not found in Grafana server '{grafana_server_id}'")
 
+        self._grafana_datasource_uids[(grafana_server_id, datasource_name)] = datasource["uid"]
         return datasource["uid"]
 
     def add_grafana_datasource(self, grafana_server_id: str, datasource: Dict[str, str]):
@@ -102,10 +239,7 @@ class MonitoringManager(GenericManager):
         if not grafana_server:
             raise NFVCLCoreException(f"Grafana server with ID '{grafana_server_id}' not found in topology")
 
-        grafana_client = GrafanaApi.from_url(
-            url=f"http://{grafana_server.ip}:{grafana_server.port}",
-            credential=(grafana_server.user, grafana_server.password),
-        )
+        grafana_client = self._get_grafana_client(grafana_server)
         try:
             grafana_client.datasource.get_datasource_by_name(datasource["name"])
             existing_datasource = True
@@ -156,32 +290,44 @@ class MonitoringManager(GenericManager):
         self.add_grafana_datasource(grafana_server_id, datasource)
 
     def add_grafana_dashboard(self, grafana_server_id: str, dashboard: Dict, folder_uid: str = "0"):
+        self.add_grafana_dashboards(grafana_server_id, [dashboard], folder_uid)
+
+    def add_grafana_dashboards(self, grafana_server_id: str, dashboards: List[Dict], folder_uid: str = "0"):
+        """
+        Import the dashboards in a folder of a Grafana server, the topology is saved once after all the imports
+        Args:
+            grafana_server_id: The ID of the Grafana server
+            dashboards: The dashboards to be imported (Grafana JSON model)
+            folder_uid: The UID of the destination folder
+        """
         grafana_server = self._topology_manager.get_grafana(grafana_server_id)
         if not grafana_server:
             raise NFVCLCoreException(f"Grafana server with ID '{grafana_server_id}' not found in topology")
 
-        grafana_client = GrafanaApi.from_url(
-            url=f"http://{grafana_server.ip}:{grafana_server.port}",
-            credential=(grafana_server.user, grafana_server.password),
-        )
+        grafana_client = self._get_grafana_client(grafana_server)
 
+        imported = 0
         try:
-            payload = {
-                "dashboard": dashboard,
-                "folderUid": folder_uid,
-                "overwrite": True
-            }
-            result = grafana_client.dashboard.update_dashboard(payload)
-
-            if result.get("status") == "success":
-                self.logger.info(f"Dashboard '{dashboard["title"]}' imported into folder with uid '{folder_uid}'")
-                grafana_server.root_folder.find_folder_by_uid(folder_uid).dashboards.append(
-                    GrafanaDashboardModel(uid=result["uid"], name=dashboard["title"])
-                )
-                self._topology_manager.save_to_db()
-            else:
-                self.logger.error("Failed to import dashboard:", result)
+            for dashboard in dashboards:
+                payload = {
+                    "dashboard": dashboard,
+                    "folderUid": folder_uid,
+                    "overwrite": True
+                }
+                result = grafana_client.dashboard.update_dashboard(payload)
+
+                if result.get("status") == "success":
+                    self.logger.info(f"Dashboard '{dashboard["title"]}' imported into folder with uid '{folder_uid}'")
+                    grafana_server.root_folder.find_folder_by_uid(folder_uid).dashboards.append(
+                        GrafanaDashboardModel(uid=result["uid"], name=dashboard["title"])
+                    )
+                    imported += 1
+                else:
+                    self.logger.error("Failed to import dashboard:", result)
 
         except Exception as e:
             self.logger.error(f"Error adding/updating Grafana dashboard: {str(e)}")
             raise NFVCLCoreException(f"Failed to add/update Grafana dashboard: {str(e)}")
+        finally:
+            if imported > 0:
+                self._topology_manager.save_to_db("grafana_srv")
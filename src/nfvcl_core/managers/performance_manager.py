@@ -1,12 +1,12 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List
 
 from nfvcl_core.database.blueprint_repository import BlueprintRepository
 from nfvcl_core.database.performance_repository import PerformanceRepository
 from nfvcl_core.managers.generic_manager import GenericManager
 from nfvcl_core_models.performance import BlueprintPerformanceType, BlueprintPerformance, BlueprintPerformanceOperation, \
-    BlueprintPerformanceProviderCall
+    BlueprintPerformanceProviderCall, BlueprintPerformanceHistoryOperation, MAX_PERFORMANCE_OPERATIONS
 
 
 class PerformanceManager(GenericManager):
@@ -16,15 +16,18 @@ class PerformanceManager(GenericManager):
     performance_dict: Dict[str, BlueprintPerformance]
     pending_operations: Dict[str, str] # blueprint_id: operation_id
     operations: Dict[str, BlueprintPerformanceOperation]
+    operations_blueprint: Dict[str, str] # operation_id: blueprint_id
     provider_calls: Dict[str, BlueprintPerformanceProviderCall]
 
-    def __init__(self, performance_repository: PerformanceRepository, blueprint_repository: BlueprintRepository):
+    def __init__(self, performance_repository: PerformanceRepository, blueprint_repository: BlueprintRepository, max_operations: int = MAX_PERFORMANCE_OPERATIONS):
         super().__init__()
         self._performance_repository = performance_repository
         self._blueprint_repository = blueprint_repository
+        self.max_operations = max_operations
         self.performance_dict = {}
         self.pending_operations = {}
         self.operations = {}
+        self.operations_blueprint = {}
         self.provider_calls = {}
 
     def load(self):
@@ -42,12 +45,22 @@ class PerformanceManager(GenericManager):
             else:
                 self.logger.warning(f"Unable to load performances for blueprint {blueprint_to_load['id']}")
 
-    def _persist_to_db(self):
+    def _persist_to_db(self, blueprint_id: str):
         """
-        Persist the collected metrics to the mongo db
-        """
-        for blueid in self.performance_dict.keys():
-            self._performance_repository.update_blueprint_performance(self.performance_dict[blueid])
+        Persist the collected metrics of a blueprint to the mongo db, the oldest completed operations exceeding
+        'max_operations' are moved to the history collection
+        Args:
+            blueprint_id: The blueprint of which the metrics are persisted
+        """
+        blueprint_performance = self.performance_dict[blueprint_id]
+        exceeding = len(blueprint_performance.operations) - self.max_operations
+        if exceeding > 0:
+            to_archive = [operation for operation in blueprint_performance.operations[:exceeding] if operation.end is not None]
+            self._performance_repository.archive_operations(blueprint_id, to_archive)
+            archived_ids = set(operation.id for operation in to_archive)
+            blueprint_performance.operations = [operation for operation in blueprint_performance.operations if operation.id not in archived_ids]
+        self._performance_repository.update_blueprint_performance(blueprint_performance)
+        self._performance_repository.flush(blueprint_id)
 
     def get_blue_performance(self, blueprint_id: str) -> BlueprintPerformance:
         """
@@ -62,6 +75,16 @@ class PerformanceManager(GenericManager):
             return BlueprintPerformance.model_validate(element)
         raise ValueError(f"No performance metrics found for blueprint '{blueprint_id}'")
 
+    def get_archived_operations(self, blueprint_id: str) -> List[BlueprintPerformanceHistoryOperation]:
+        """
+        Get the operations of the blueprint that have been moved to the history collection
+        Args:
+            blueprint_id: Blueprint id
+
+        Returns: The archived operations, the oldest ones may have been discarded
+        """
+        return self._performance_repository.get_archived_operations(blueprint_id)
+
     def get_all_performaces(self) -> List[BlueprintPerformance]:
         """
         Get all the performance metrics for all blueprints, even the one that has been deleted.
@@ -107,6 +130,7 @@ class PerformanceManager(GenericManager):
         blueprint_operation = BlueprintPerformanceOperation(id=op_id, op_name=op_name, type=operation_type, start=datetime.now(timezone.utc))
         self.performance_dict[blueprint_id].operations.append(blueprint_operation)
         self.operations[op_id] = blueprint_operation
+        self.operations_blueprint[op_id] = blueprint_id
         if blueprint_id in self.pending_operations:
             #raise Exception("Multiple operation pending")
             self.logger.error("Multiple operation pending, replacing with newer one")
@@ -125,27 +149,29 @@ class PerformanceManager(GenericManager):
         else:
             self.logger.warning("Skipping operation performance for unknown blueprint")
 
-    def _find_operation(self, operation_id: str) -> Tuple[BlueprintPerformanceOperation, str]:
-        for blueprint_performance in self.performance_dict.values():
-            for blueprint_operation in blueprint_performance.operations:
-                if blueprint_operation.id == operation_id:
-                    return blueprint_operation, blueprint_performance.blueprint_id
-        return None, None
-
-    def end_operation(self, operation_id: str) -> int:
+    def end_operation(self, operation_id: Optional[str], error: bool = False) -> int:
         """
-        Log the end of an operation on a blueprint
+        Log the end of an operation on a blueprint, also when it failed
         Args:
             operation_id: The operation id
+            error: True if the operation failed, the error flag of the blueprint performance is set
+
+        Returns: The duration of the operation in milliseconds, 0 if the operation is unknown
         """
-        operation, blueprint_id = self._find_operation(operation_id)
-        if operation is None:
+        operation = self.operations.pop(operation_id, None) if operation_id is not None else None
+        blueprint_id = self.operations_blueprint.pop(operation_id, None) if operation_id is not None else None
+        if operation is None or blueprint_id is None or blueprint_id not in self.performance_dict:
             self.logger.warning("Skipping operation performance for unknown operation or blueprint")
-            return
+            return 0
+        if error:
+            self.performance_dict[blueprint_id].error = True
         operation.end = datetime.now(timezone.utc)
         operation.duration = round((operation.end - operation.start).total_seconds() * 1000)
-        del self.pending_operations[blueprint_id]
-        self._persist_to_db()
+        for provider_call in operation.provider_calls:
+            self.provider_calls.pop(provider_call.id, None)
+        if self.pending_operations.get(blueprint_id) == operation_id:
+            del self.pending_operations[blueprint_id]
+        self._persist_to_db(blueprint_id)
         return operation.duration
 
     def start_provider_call(self, operation_id: Optional[str], method_name: str, info: Dict[str, str]) -> Optional[str]:
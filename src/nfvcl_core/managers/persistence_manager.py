@@ -1,9 +1,10 @@
+import atexit
 import importlib
 import inspect
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Any
 
 from pymongo import MongoClient
 from pymongo.synchronous.collection import Collection
@@ -14,8 +15,17 @@ from nfvcl_core.managers.generic_manager import GenericManager
 
 
 class PersistenceManager(GenericManager):
-    def __init__(self, host: str, port: int, db: str, username: str = None, password: str = None, migration_base_class: Optional[type] = Migration):
+    def __init__(self, host: str, port: int, db: str, username: str = None, password: str = None, migration_base_class: Optional[type] = Migration, write_behind_ms: int = 0):
+        """
+        Args:
+            write_behind_ms: If greater than 0, repositories queue incremental saves and write them to the database with
+                a single bulk write at most after this number of milliseconds (see DatabaseRepository.save_incremental)
+        """
         super().__init__()
+        self.write_behind_window: float = write_behind_ms / 1000
+        self._repositories: List[Any] = []
+        if self.write_behind_window > 0:
+            atexit.register(self.flush)
 
         if username is not None and password is not None:
             uri = f"mongodb://{username}:{password}@{host}:{port}/"
@@ -33,6 +43,22 @@ class PersistenceManager(GenericManager):
     def get_collection(self, collection_name: str) -> Collection:
         return self.mongo_database[collection_name]
 
+    def register_repository(self, repository: Any):
+        """
+        Register a repository to be flushed by 'flush'
+        """
+        self._repositories.append(repository)
+
+    def flush(self):
+        """
+        Write the documents queued by every repository to the database
+        """
+        for repository in self._repositories:
+            try:
+                repository.flush()
+            except Exception as e:
+                self.logger.error(f"Error flushing {repository.__class__.__name__}: {e}", exc_info=e)
+
     def run_migrations(self):
         """
         Run migrations for the database
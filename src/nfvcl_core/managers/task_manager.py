@@ -1,9 +1,11 @@
-from queue import Queue
-from threading import Thread
-from typing import Dict, Optional
+import asyncio
+import time
+from collections import deque
+from threading import Thread, Condition, Event, Lock
+from typing import Dict, Optional, Deque, List, Set, Callable
 
 from nfvcl_core.managers.generic_manager import GenericManager
-from nfvcl_core_models.task import NFVCLTask, NFVCLTaskResult
+from nfvcl_core_models.task import NFVCLTask, NFVCLTaskResult, NFVCLTaskLane, NFVCLTaskLaneMetrics, NFVCLTaskSchedulerMetrics
 
 
 class TaskHistoryElement:
@@ -11,34 +13,221 @@ class TaskHistoryElement:
         self.task_id = task_id
         self.task = task
         self.result = result
+        # Set when the result is available
+        self.completed = Event()
+        self._done_callbacks: List[Callable[[], None]] = []
+        self._done_lock = Lock()
+
+    @property
+    def started(self) -> bool:
+        return self.task.start_time is not None
+
+    def complete(self, result: NFVCLTaskResult):
+        """
+        Store the result of the task and notify the waiters
+        """
+        with self._done_lock:
+            self.result = result
+            self.completed.set()
+            callbacks = self._done_callbacks
+            self._done_callbacks = []
+        for callback in callbacks:
+            callback()
+
+    def add_done_callback(self, callback: Callable[[], None]):
+        """
+        Call a function (from the worker thread) when the task is completed, immediately if it is already completed
+        """
+        with self._done_lock:
+            if not self.completed.is_set():
+                self._done_callbacks.append(callback)
+                return
+        callback()
+
+    def remove_done_callback(self, callback: Callable[[], None]):
+        with self._done_lock:
+            if callback in self._done_callbacks:
+                self._done_callbacks.remove(callback)
+
+
+class _LaneStats:
+    def __init__(self):
+        self.running = 0
+        self.started = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.wait_time_last = 0.0
+
 
 class TaskManager(GenericManager):
-    def __init__(self, worker_count: int):
+    """
+    Schedule NFVCL tasks on a pool of worker threads.
+
+    Tasks are split in lanes (read-only, day-2, day-0/deletion) that are served in priority order.
+    A number of workers are reserved to the read-only lane, so that getters are never stuck behind long
+    deployments, and day-0 tasks can never occupy every general purpose worker.
+    Tasks with the same serialization key (the blueprint ID) are executed one at a time in submission order;
+    tasks waiting for their key do not hold a worker thread.
+    """
+    LANE_PRIORITY: List[NFVCLTaskLane] = [NFVCLTaskLane.READ, NFVCLTaskLane.DAY2, NFVCLTaskLane.DAY0]
+
+    def __init__(self, worker_count: int, read_worker_count: int = 1):
         super().__init__()
-        self.queue: Queue = Queue()
         self.worker_count = worker_count
+        self.read_worker_count = read_worker_count
+        # Keep at least a general purpose worker available for day-2 operations
+        self.max_day0_running = max(1, worker_count - 1)
         self.worker_list = []
         self.task_history: Dict[str, TaskHistoryElement] = {}
+
+        self._condition = Condition()
+        self._lanes: Dict[NFVCLTaskLane, Deque[NFVCLTask]] = {lane: deque() for lane in NFVCLTaskLane}
+        self._lane_stats: Dict[NFVCLTaskLane, _LaneStats] = {lane: _LaneStats() for lane in NFVCLTaskLane}
+        # Tasks waiting for each serialization key, in submission order
+        self._pending_keys: Dict[str, Deque[NFVCLTask]] = {}
+        self._running_keys: Set[str] = set()
+        self._busy_workers = 0
+        self._running = True
+
         self.start_workers()
 
     def start_workers(self):
         for i in range(0, self.worker_count):
-            thread = Thread(target=self.worker, daemon=True, name=f"Worker-{i}")
+            thread = Thread(target=self.worker, args=(self.LANE_PRIORITY,), daemon=True, name=f"Worker-{i}")
+            self.worker_list.append(thread)
+            thread.start()
+        for i in range(0, self.read_worker_count):
+            thread = Thread(target=self.worker, args=([NFVCLTaskLane.READ],), daemon=True, name=f"ReadWorker-{i}")
             self.worker_list.append(thread)
             thread.start()
 
     def stop_workers(self):
-        # TODO: Implement
-        pass
+        """
+        Stop the workers once the running tasks are completed, queued tasks are discarded
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
 
     def add_task(self, task: NFVCLTask) -> str:
-        self.queue.put(task)
+        with self._condition:
+            task.enqueue_time = time.perf_counter()
+            self.task_history[task.task_id] = TaskHistoryElement(task_id=task.task_id, task=task)
+            self._lanes[task.lane].append(task)
+            if task.serialization_key is not None:
+                self._pending_keys.setdefault(task.serialization_key, deque()).append(task)
+            self._condition.notify_all()
         return task.task_id
 
-    def worker(self):
+    async def wait_task_async(self, task_id: str, timeout: float) -> Optional[TaskHistoryElement]:
+        """
+        Wait for the completion of a task from an event loop, no thread is blocked while waiting
+        Args:
+            task_id: The ID of the task
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            The history element of the task (the task may be still running if the timeout expired), None if the task does not exist
+        """
+        history_element = self.task_history.get(task_id)
+        if history_element is None or history_element.completed.is_set():
+            return history_element
+
+        loop = asyncio.get_running_loop()
+        completed = loop.create_future()
+
+        def wake_up():
+            loop.call_soon_threadsafe(lambda: completed.done() or completed.set_result(None))
+
+        history_element.add_done_callback(wake_up)
+        try:
+            await asyncio.wait_for(completed, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            history_element.remove_done_callback(wake_up)
+        return history_element
+
+    def _is_eligible(self, task: NFVCLTask) -> bool:
+        if task.lane == NFVCLTaskLane.DAY0 and self._lane_stats[NFVCLTaskLane.DAY0].running >= self.max_day0_running:
+            return False
+        if task.serialization_key is None:
+            return True
+        if task.serialization_key in self._running_keys:
+            return False
+        # Only the oldest task of a key can be started, this keeps the order between lanes
+        return self._pending_keys[task.serialization_key][0] is task
+
+    def _next_task(self, lanes: List[NFVCLTaskLane]) -> Optional[NFVCLTask]:
+        """
+        Pop the first task that can be executed, lanes are scanned in the given order.
+        Must be called holding the condition lock.
+        """
+        for lane in lanes:
+            for task in self._lanes[lane]:
+                if self._is_eligible(task):
+                    self._lanes[lane].remove(task)
+                    return task
+        return None
+
+    def _start_task(self, task: NFVCLTask):
+        task.start_time = time.perf_counter()
+        wait_time = task.start_time - task.enqueue_time
+        stats = self._lane_stats[task.lane]
+        stats.running += 1
+        stats.started += 1
+        stats.wait_time_total += wait_time
+        stats.wait_time_max = max(stats.wait_time_max, wait_time)
+        stats.wait_time_last = wait_time
+        if task.serialization_key is not None:
+            self._pending_keys[task.serialization_key].popleft()
+            self._running_keys.add(task.serialization_key)
+        self._busy_workers += 1
+
+    def _end_task(self, task: NFVCLTask):
+        with self._condition:
+            self._lane_stats[task.lane].running -= 1
+            if task.serialization_key is not None:
+                self._running_keys.discard(task.serialization_key)
+                if len(self._pending_keys[task.serialization_key]) == 0:
+                    del self._pending_keys[task.serialization_key]
+            self._busy_workers -= 1
+            self._condition.notify_all()
+
+    def get_metrics(self) -> NFVCLTaskSchedulerMetrics:
+        """
+        Get queue depth and wait time metrics of every scheduling lane
+        """
+        with self._condition:
+            metrics = NFVCLTaskSchedulerMetrics(
+                worker_count=self.worker_count,
+                read_worker_count=self.read_worker_count,
+                busy_workers=self._busy_workers,
+                blocked_keys=len(self._running_keys)
+            )
+            for lane in NFVCLTaskLane:
+                stats = self._lane_stats[lane]
+                metrics.lanes[lane] = NFVCLTaskLaneMetrics(
+                    queued=len(self._lanes[lane]),
+                    running=stats.running,
+                    started=stats.started,
+                    wait_time_avg_ms=(stats.wait_time_total / stats.started) * 1000 if stats.started > 0 else 0.0,
+                    wait_time_max_ms=stats.wait_time_max * 1000,
+                    wait_time_last_ms=stats.wait_time_last * 1000
+                )
+        return metrics
+
+    def worker(self, lanes: List[NFVCLTaskLane]):
         while True:
-            task: NFVCLTask = self.queue.get()
-            self.task_history[task.task_id] = TaskHistoryElement(task_id=task.task_id, task=task)
+            with self._condition:
+                task = self._next_task(lanes)
+                while task is None and self._running:
+                    self._condition.wait()
+                    task = self._next_task(lanes)
+                if not self._running:
+                    return
+                self._start_task(task)
+
             self.logger.spam(f'Working on {task}')
             excep = None
             try:
@@ -49,10 +238,17 @@ class TaskManager(GenericManager):
                 excep = e
 
             self.logger.spam(f'Finished {task}')
-            self.queue.task_done()
-
-            task_result = NFVCLTaskResult(task.task_id, returnof, excep is not None, excep)
-            self.task_history[task.task_id].result = task_result
+            # The serialization key is released only after the result has been delivered, so the next task with the
+            # same key is never reported running before the previous one is completed
+            try:
+                task_result = NFVCLTaskResult(task.task_id, returnof, excep is not None, excep)
+                self.task_history[task.task_id].complete(task_result)
 
-            if task.callback_function:
-                task.callback_function(task_result)
+                if task.callback_function:
+                    try:
+                        task.callback_function(task_result)
+                    except Exception as e:
+                        # The worker must survive the errors of the callbacks
+                        self.logger.error(f'Error in the callback of {task}: {e}', exc_info=e)
+            finally:
+                self._end_task(task)
@@ -1,8 +1,11 @@
+import copy
 from typing import Optional, List, Union, Callable
 from functools import wraps
 
 from nfvcl_core.database.topology_repository import TopologyRepository
 from nfvcl_core.managers.generic_manager import GenericManager
+from nfvcl_core.utils.k8s.helm_executor import close_helm_executors
+from nfvcl_core.utils.k8s.k8s_client_cache import k8s_client_cache
 from nfvcl_core_models.custom_types import NFVCLCoreException
 from nfvcl_core_models.monitoring.grafana_model import GrafanaServerModel, GrafanaDashboardModel, GrafanaFolderModel
 from nfvcl_core_models.monitoring.k8s_monitoring import K8sMonitoring
@@ -14,7 +17,7 @@ from nfvcl_core_models.network.network_models import NetworkModel, RouterModel,
 from nfvcl_core_models.pre_work import PreWorkCallbackResponse, run_pre_work_callback
 from nfvcl_core_models.response_model import OssCompliantResponse, OssStatus
 from nfvcl_core_models.topology_k8s_model import TopologyK8sModel
-from nfvcl_core_models.topology_models import TopologyModel
+from nfvcl_core_models.topology_models import TopologyModel, TopoK8SNotFoundException
 from nfvcl_core_models.vim.vim_models import VimModel
 
 
@@ -33,19 +36,59 @@ class TopologyManager(GenericManager):
         super().__init__()
         self._topology_repository = topology_repository
         self._topology: Optional[TopologyModel] = self._topology_repository.get_topology()
+        # Read-only copy of the topology as of the last completed mutation, served to read-only requests
+        self._topology_snapshot: Optional[TopologyModel] = None
+        self._publish_snapshot()
 
-    def save_to_db(self):
-        self._topology_repository.save_topology(self._topology)
+    def _publish_snapshot(self, *sections: str):
+        """
+        Replace the read-only snapshot with a copy of the current topology.
+        The reference is swapped atomically, readers always get a complete topology even if a worker is modifying the live one.
+
+        Args:
+            *sections: The topology fields that have been changed, if given only they are copied while the other ones
+                are shared with the previous snapshot. If not given, the whole topology is copied.
+        """
+        if self._topology is None:
+            self._topology_snapshot = None
+        elif sections and self._topology_snapshot is not None:
+            self._topology_snapshot = self._topology_snapshot.model_copy(update={section: copy.deepcopy(getattr(self._topology, section)) for section in sections})
+        else:
+            self._topology_snapshot = self._topology.model_copy(deep=True)
+
+    def save_to_db(self, *sections: str):
+        """
+        Save the topology to the database and publish the new read-only snapshot
+
+        Args:
+            *sections: The topology fields (e.g. 'networks', 'kubernetes') that have been changed, only these are
+                serialized and written. If not given, the whole topology is saved.
+        """
+        self._topology_repository.save_topology(self._topology, sections=sections if sections else None)
+        self._publish_snapshot(*sections)
 
     def get_topology(self) -> TopologyModel:
         if self._topology:
             return self._topology
         raise NFVCLCoreException("Topology has not been initialized yet.", http_equivalent_code=404)
 
+    def get_topology_snapshot(self) -> TopologyModel:
+        """
+        Get the read-only snapshot of the topology, this can be called from any thread without going through the TaskManager.
+
+        Warnings:
+            The returned object MUST NOT be modified.
+        """
+        snapshot = self._topology_snapshot
+        if snapshot:
+            return snapshot
+        raise NFVCLCoreException("Topology has not been initialized yet.", http_equivalent_code=404)
+
     def create_topology(self, topology: TopologyModel) -> TopologyModel:
         self.logger.debug(topology)
         self._topology = topology
         self._topology_repository.save_topology(topology)
+        self._publish_snapshot()
         return topology
 
     @require_topology
@@ -53,6 +96,7 @@ class TopologyManager(GenericManager):
         old_topology = self._topology
         self._topology_repository.delete_all()
         self._topology = None
+        self._publish_snapshot()
         return old_topology
 
     @require_topology
@@ -79,18 +123,18 @@ class TopologyManager(GenericManager):
                 raise NFVCLCoreException("Some of the areas are already assigned to a VIM")
 
         self._topology.add_vim(vim)
-        self.save_to_db()
+        self.save_to_db("vims")
         return vim
 
     @require_topology
     def delete_vim(self, vim_id: str) -> None:
         self._topology.del_vim(vim_id)
-        self.save_to_db()
+        self.save_to_db("vims")
 
     @require_topology
     def update_vim(self, vim: VimModel) -> VimModel:
         self._topology.upd_vim(vim)
-        self.save_to_db()
+        self.save_to_db("vims")
         return vim
 
     ############################ Network ########################################
@@ -102,13 +146,13 @@ class TopologyManager(GenericManager):
     @require_topology
     def create_network(self, network: NetworkModel) -> NetworkModel:
         self._topology.add_network(network)
-        self.save_to_db()
+        self.save_to_db("networks")
         return network
 
     @require_topology
     def update_network(self, network: NetworkModel) -> NetworkModel:
         self._topology.upd_network(network)
-        self.save_to_db()
+        self.save_to_db("networks")
         return network
 
     @require_topology
@@ -129,7 +173,7 @@ class TopologyManager(GenericManager):
         """
         network = self._topology.get_network(network_id)
         added_pool = network.add_allocation_pool(allocation_pool)
-        self.save_to_db()
+        self.save_to_db("networks")
         return added_pool
 
     @require_topology
@@ -148,7 +192,7 @@ class TopologyManager(GenericManager):
         """
         network = self._topology.get_network(network_id)
         removed_pool = network.remove_allocation_pool(allocation_pool_name)
-        self.save_to_db()
+        self.save_to_db("networks")
         return removed_pool
 
     def reserve_range_to_k8s_cluster(self, network_name: str, reserved_range_k8s: IPv4ReservedRangeRequest) -> List[IPv4ReservedRange]:
@@ -172,7 +216,7 @@ class TopologyManager(GenericManager):
         # Adding to the K8s cluster the id of the reserved range
         k8s_network.ip_pools.extend([res_range.name for res_range in reserved_networks])
 
-        self.save_to_db()
+        self.save_to_db("networks", "kubernetes")
         return reserved_networks
 
     def release_range_from_k8s_cluster(self, network_name: str, reserved_range_name: str, k8s_cluster_id: str) -> IPv4ReservedRange:
@@ -205,7 +249,7 @@ class TopologyManager(GenericManager):
             k8s_cluster = self._topology.get_k8s_cluster(k8s_cluster_id)
             k8s_cluster.release_ip_pool(removed_range.name)
 
-            self.save_to_db()
+            self.save_to_db("networks", "kubernetes")
             return removed_range
         except ValueError as e:
             raise NFVCLCoreException(str(e), http_equivalent_code=404)  # Not found
@@ -219,7 +263,7 @@ class TopologyManager(GenericManager):
 
     def delete_network(self, network_id: str) -> None:
         self._topology.delete_network(network_id)
-        self.save_to_db()
+        self.save_to_db("networks")
 
     ############################ Router ########################################
 
@@ -230,13 +274,13 @@ class TopologyManager(GenericManager):
     @require_topology
     def create_router(self, router: RouterModel) -> RouterModel:
         self._topology.add_router(router)
-        self.save_to_db()
+        self.save_to_db("routers")
         return router
 
     @require_topology
     def delete_router(self, router_id: str) -> None:
         self._topology.delete_router(router_id)
-        self.save_to_db()
+        self.save_to_db("routers")
 
     ############################ PDUs ########################################
 
@@ -262,7 +306,7 @@ class TopologyManager(GenericManager):
             pdu: The PDU to be inserted in the topology
         """
         self._topology.add_pdu(pdu)
-        self.save_to_db()
+        self.save_to_db("pdus")
         return pdu
 
     @require_topology
@@ -277,7 +321,7 @@ class TopologyManager(GenericManager):
             raise NFVCLCoreException(f"PDU {pdu_id} is locked by {self._topology.get_pdu(pdu_id).locked_by}")
 
         self._topology.del_pdu(pdu_id)
-        self.save_to_db()
+        self.save_to_db("pdus")
 
     @require_topology
     def get_pdus(self) -> List[PduModel]:
@@ -306,16 +350,16 @@ class TopologyManager(GenericManager):
     @require_topology
     def add_edit_k8s_cluster_monitoring_metrics(self, cluster_id: str, config: K8sMonitoring):
         self._topology.add_edit_monitoring_metrics(cluster_id, config)
-        self.save_to_db()
+        self.save_to_db("kubernetes")
 
     def delete_k8s_cluster_monitoring_metrics(self, cluster_id: str):
         self._topology.delete_monitoring_metrics(cluster_id)
-        self.save_to_db()
+        self.save_to_db("kubernetes")
 
     @require_topology
     def add_kubernetes(self, k8s: TopologyK8sModel) -> TopologyK8sModel:
         self._topology.add_k8s_cluster(k8s)
-        self.save_to_db()
+        self.save_to_db("kubernetes")
         return k8s
 
     def update_kubernetes(self, cluster: TopologyK8sModel, pre_work_callback: Optional[Callable[[PreWorkCallbackResponse], None]] = None) -> TopologyK8sModel:
@@ -325,13 +369,55 @@ class TopologyManager(GenericManager):
             run_pre_work_callback(pre_work_callback, async_return=OssCompliantResponse(status=OssStatus.failed, detail="K8s cluster to update has not been found."))
 
         self._topology.upd_k8s_cluster(cluster)
-        self.save_to_db()
+        self.save_to_db("kubernetes")
+        return cluster
+
+    @require_topology
+    def add_k8s_deployed_blueprint(self, cluster_id: str, blueprint_id: str) -> TopologyK8sModel:
+        """
+        Add a blueprint to the ones deployed on a k8s cluster, only the list of the cluster is written to the database.
+        The blueprint is added once for every chart it installs, so it stays in the list until its last chart is removed.
+
+        Args:
+            cluster_id: The name of the k8s cluster
+            blueprint_id: The blueprint deployed on the cluster
+
+        Returns:
+            The updated cluster
+        """
+        cluster = self._topology.get_k8s_cluster(cluster_id)
+        cluster.deployed_blueprints.append(blueprint_id)
+        self._topology_repository.save_k8s_deployed_blueprints(self._topology, cluster.name)
+        self._publish_snapshot("kubernetes")
         return cluster
 
+    @require_topology
+    def remove_k8s_deployed_blueprint(self, cluster_id: str, blueprint_id: str) -> bool:
+        """
+        Remove one entry of a blueprint from the ones deployed on a k8s cluster (one for every chart of the blueprint),
+        only the list of the cluster is written to the database
+
+        Args:
+            cluster_id: The name of the k8s cluster
+            blueprint_id: The blueprint to be removed
+
+        Returns:
+            True if the blueprint has been removed, False if it was not deployed on the cluster
+        """
+        cluster = self._topology.get_k8s_cluster(cluster_id)
+        if blueprint_id not in cluster.deployed_blueprints:
+            return False
+        cluster.deployed_blueprints.remove(blueprint_id)
+        self._topology_repository.save_k8s_deployed_blueprints(self._topology, cluster.name)
+        self._publish_snapshot("kubernetes")
+        return True
+
     @require_topology
     def delete_kubernetes(self, k8s_id: str, force_deletion: bool = False) -> TopologyK8sModel:
         deleted_cluster = self._topology.del_k8s_cluster(k8s_id, force_deletion=force_deletion)
-        self.save_to_db()
+        self.save_to_db("kubernetes")
+        k8s_client_cache.invalidate(k8s_id)
+        close_helm_executors(k8s_id)
         return deleted_cluster
 
     @require_topology
@@ -348,12 +434,9 @@ class TopologyManager(GenericManager):
 
             The matching k8s cluster or Throw HTTPException if NOT found.
         """
-        k8s_clusters: List[TopologyK8sModel] = self._topology.get_k8s_clusters()
-        match = next((x for x in k8s_clusters if area_id in x.areas), None)
-
-        if match:
-            return match
-        else:
+        try:
+            return self._topology.find_k8s_cluster_by_area(area_id)
+        except TopoK8SNotFoundException:
             error_msg = f"K8s cluster not found in area {area_id}"
             self.logger.error(error_msg)
             raise NFVCLCoreException(error_msg)
@@ -386,7 +469,7 @@ class TopologyManager(GenericManager):
             prefixlen=network.cidr.prefixlen
         )
 
-        self.save_to_db()
+        self.save_to_db("networks")
 
         return multus_info
 
@@ -405,7 +488,7 @@ class TopologyManager(GenericManager):
         reserved_range = network.get_reserved_range_by_ip(ip_address)
         if reserved_range.assigned_to == PoolAssignation.K8S_CLUSTER.value and reserved_range.owner == k8s_id:
             reserved_range.release_ip_address(ip_address)
-        self.save_to_db()
+        self.save_to_db("networks")
         return ip_address
 
     ############################ Prometheus ########################################
@@ -421,18 +504,18 @@ class TopologyManager(GenericManager):
     @require_topology
     def add_prometheus(self, prometheus: PrometheusServerModel) -> PrometheusServerModel:
         self._topology.add_prometheus_srv(prometheus)
-        self.save_to_db()
+        self.save_to_db("prometheus_srv")
         return prometheus
 
     @require_topology
     def update_prometheus(self, prometheus: PrometheusServerModel) -> PrometheusServerModel:
         self._topology.upd_prometheus_srv(prometheus)
-        self.save_to_db()
+        self.save_to_db("prometheus_srv")
         return prometheus
 
     def delete_prometheus(self, prometheus_id: str, force: Optional[bool] = False):
         self._topology.del_prometheus_srv(prometheus_id, force)
-        self.save_to_db()
+        self.save_to_db("prometheus_srv")
 
     @require_topology
     def add_prometheus_target(self, prometheus_id: str, target: PrometheusTargetModel) -> PrometheusServerModel:
@@ -443,12 +526,27 @@ class TopologyManager(GenericManager):
             prometheus_id: The ID of the Prometheus server.
             target: The target to add.
 
+        Returns:
+            The updated PrometheusServerModel.
+        """
+        return self.add_prometheus_targets(prometheus_id, [target])
+
+    @require_topology
+    def add_prometheus_targets(self, prometheus_id: str, targets: List[PrometheusTargetModel]) -> PrometheusServerModel:
+        """
+        Add new targets to the specified Prometheus server, the topology is saved once.
+
+        Args:
+            prometheus_id: The ID of the Prometheus server.
+            targets: The targets to add.
+
         Returns:
             The updated PrometheusServerModel.
         """
         prom_server = self._topology.find_prom_srv(prometheus_id)
-        prom_server.add_target(target)
-        self.save_to_db()
+        prom_server.add_targets(targets)
+        if targets:
+            self.save_to_db("prometheus_srv")
         return prom_server
 
     @require_topology
@@ -465,7 +563,7 @@ class TopologyManager(GenericManager):
         """
         prom_server = self._topology.find_prom_srv(prometheus_id)
         prom_server.del_targets([target])
-        self.save_to_db()
+        self.save_to_db("prometheus_srv")
         return prom_server
 
     @require_topology
@@ -482,7 +580,7 @@ class TopologyManager(GenericManager):
         """
         prom_server = self._topology.find_prom_srv(prometheus_id)
         prom_server.del_targets(targets)
-        self.save_to_db()
+        self.save_to_db("prometheus_srv")
         return prom_server
 
     ############################ Grafana ########################################
@@ -498,19 +596,19 @@ class TopologyManager(GenericManager):
     @require_topology
     def add_grafana(self, grafana: GrafanaServerModel) -> GrafanaServerModel:
         self._topology.add_grafana_srv(grafana)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana
 
     @require_topology
     def update_grafana(self, grafana: GrafanaServerModel) -> GrafanaServerModel:
         self._topology.upd_grafana_srv(grafana)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana
 
     @require_topology
     def delete_grafana(self, grafana_id: str):
         self._topology.del_grafana_srv(grafana_id, False)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
 
     @require_topology
     def add_grafana_folder(self, grafana_id: str, folder: GrafanaFolderModel, parent_folder_uid: Optional[str] = None, parent_by_blue_id: Optional[str] = None) -> GrafanaServerModel:
@@ -530,7 +628,7 @@ class TopologyManager(GenericManager):
             parent_folder.add_folder(folder)
         else:
             grafana_server.add_folder(folder, parent_folder_uid)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana_server
 
     @require_topology
@@ -547,7 +645,7 @@ class TopologyManager(GenericManager):
         """
         grafana_server = self._topology.find_grafana_srv(grafana_id)
         grafana_server.remove_folder(folder_uid)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana_server
 
     @require_topology
@@ -564,7 +662,7 @@ class TopologyManager(GenericManager):
         """
         grafana_server = self._topology.find_grafana_srv(grafana_id)
         grafana_server.add_dashboard(dashboard, parent_folder_uid)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana_server
 
     @require_topology
@@ -581,7 +679,7 @@ class TopologyManager(GenericManager):
         """
         grafana_server = self._topology.find_grafana_srv(grafana_id)
         grafana_server.remove_dashboard(dashboard.uid)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana_server
 
     @require_topology
@@ -599,7 +697,7 @@ class TopologyManager(GenericManager):
         grafana_server = self._topology.find_grafana_srv(grafana_id)
         for dashboard in dashboards:
             grafana_server.remove_dashboard(dashboard.uid)
-        self.save_to_db()
+        self.save_to_db("grafana_srv")
         return grafana_server
 
     ############################ Loki ########################################
@@ -615,19 +713,19 @@ class TopologyManager(GenericManager):
     @require_topology
     def add_loki(self, loki: LokiServerModel) -> LokiServerModel:
         self._topology.add_loki_srv(loki)
-        self.save_to_db()
+        self.save_to_db("loki_srv")
         return loki
 
     @require_topology
     def update_loki(self, loki: LokiServerModel) -> LokiServerModel:
         self._topology.upd_loki_srv(loki)
-        self.save_to_db()
+        self.save_to_db("loki_srv")
         return loki
 
     @require_topology
     def delete_loki(self, loki_id: str):
         self._topology.del_loki_srv(loki_id)
-        self.save_to_db()
+        self.save_to_db("loki_srv")
 
     ###############
     #    PDUs     #
@@ -641,4 +739,4 @@ class TopologyManager(GenericManager):
             pdu: the pdu to be updated (identified by pdu.name) with updated data.
         """
         self._topology.upd_pdu(pdu)
-        self.save_to_db()
+        self.save_to_db("pdus")
@@ -1,19 +1,44 @@
-from typing import Dict, cast
+import threading
+from typing import Dict, Optional, cast
 
+from nfvcl_core.database.proxmox_vmid_repository import ProxmoxVmidRepository
 from nfvcl_core.managers.generic_manager import GenericManager
 from nfvcl_core.managers.topology_manager import TopologyManager
 from nfvcl_core_models.vim.vim_models import VimTypeEnum
 from nfvcl_providers.vim_clients.openstack_vim_client import OpenStackVimClient
 from nfvcl_providers.vim_clients.proxmox_vim_client import ProxmoxVimClient
+from nfvcl_providers.vim_clients.proxmox_vmid_allocator import ProxmoxVmidAllocator
 from nfvcl_providers.vim_clients.rest_vim_client import RESTVimClient
-from nfvcl_providers.vim_clients.vim_client import VimClient
+from nfvcl_providers.vim_clients.vim_client import VimClient, ImageRegistry
 
 
 class VimClientsManager(GenericManager):
-    def __init__(self, topology_manager: TopologyManager):
+    def __init__(self, topology_manager: TopologyManager, proxmox_vmid_repository: Optional[ProxmoxVmidRepository] = None, max_parallel_operations: int = 4):
         super().__init__()
         self._topology_manager = topology_manager
+        self._proxmox_vmid_repository = proxmox_vmid_repository
         self.clients: Dict[str, VimClient] = {}
+        self.max_parallel_operations = max(1, max_parallel_operations)
+        self._operation_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._semaphores_lock = threading.Lock()
+        # The image registries survive the clients, that are closed when no longer referenced
+        self._image_registries: Dict[str, ImageRegistry] = {}
+        self._vmid_allocators: Dict[str, ProxmoxVmidAllocator] = {}
+
+    def get_operation_semaphore(self, vim_name: str) -> threading.BoundedSemaphore:
+        """
+        Get the semaphore limiting the number of VM operations executed in parallel on a VIM.
+        The semaphore is shared by every blueprint using the VIM.
+        Args:
+            vim_name: The name of the VIM
+
+        Returns:
+            The semaphore of the VIM
+        """
+        with self._semaphores_lock:
+            if vim_name not in self._operation_semaphores:
+                self._operation_semaphores[vim_name] = threading.BoundedSemaphore(self.max_parallel_operations)
+            return self._operation_semaphores[vim_name]
 
     def get_vim_client(self, requester: object, vim_type: VimTypeEnum, vim_name: str) -> VimClient:
         if vim_type == VimTypeEnum.PROXMOX:
@@ -38,7 +63,13 @@ class VimClientsManager(GenericManager):
         self.logger.spam(f"Getting {vim_type.__name__} for requester {requester.__class__.__name__} and VIM {vim_name}")
         if vim_name not in self.clients:
             self.logger.info(f"Creating new {vim_type.__name__} for vim {vim_name}")
-            self.clients[vim_name] = vim_type(self._topology_manager.get_vim(vim_name))
+            new_client = vim_type(self._topology_manager.get_vim(vim_name))
+            new_client.image_registry = self._image_registries.setdefault(vim_name, ImageRegistry())
+            if isinstance(new_client, ProxmoxVimClient):
+                if vim_name not in self._vmid_allocators:
+                    self._vmid_allocators[vim_name] = ProxmoxVmidAllocator(vim_name, self._proxmox_vmid_repository)
+                new_client.vmid_allocator = self._vmid_allocators[vim_name]
+            self.clients[vim_name] = new_client
         client = self.clients[vim_name]
         requester_id = id(requester)
         if requester_id not in client.references:
@@ -0,0 +1,30 @@
+from pymongo.synchronous.database import Database
+
+from nfvcl_core.migrations.base_class_migration import Migration
+from nfvcl_common.utils.log import create_logger
+from nfvcl_core_models.performance import MAX_PERFORMANCE_OPERATIONS, PERFORMANCE_HISTORY_SIZE
+
+
+class Migration005PerformanceHistory(Migration):
+    def __init__(self):
+        self.logger = create_logger("Migration005PerformanceHistory")
+
+    def upgrade(self, db: Database):
+        if 'performances_history' not in db.list_collection_names():
+            db.create_collection('performances_history', capped=True, size=PERFORMANCE_HISTORY_SIZE)
+
+        for performance_item in db['performances'].find():
+            operations = performance_item.get("operations", [])
+            if len(operations) <= MAX_PERFORMANCE_OPERATIONS:
+                continue
+            # Move the oldest operations to the history collection
+            to_archive = operations[:len(operations) - MAX_PERFORMANCE_OPERATIONS]
+            db['performances_history'].insert_many([{**operation, "blueprint_id": performance_item["blueprint_id"]} for operation in to_archive])
+            db['performances'].update_one(
+                {"_id": performance_item["_id"]},
+                {"$set": {"operations": operations[len(to_archive):]}}
+            )
+            self.logger.info(f"Archived {len(to_archive)} operations of blueprint {performance_item['blueprint_id']}")
+
+    def downgrade(self, db: Database):
+        pass
@@ -0,0 +1,28 @@
+from pymongo.synchronous.database import Database
+
+from nfvcl_core.migrations.base_class_migration import Migration
+from nfvcl_common.utils.log import create_logger
+from nfvcl_core_models.network.ipam_index import IPUsageBitmap
+
+
+class Migration006IpamBitmap(Migration):
+    def __init__(self):
+        self.logger = create_logger("Migration006IpamBitmap")
+
+    def upgrade(self, db: Database):
+        collection = db['topology'].find() # There is only ONE 'topology' collection in the database
+
+        for topology_item in collection:
+            network_list = topology_item.get('networks', [])
+            changed = False
+            for network in network_list:
+                for reserved_range in network.get('reserved_ranges', []):
+                    # Encode the list of booleans (one per IP) as a bitmap
+                    if isinstance(reserved_range.get('used'), list):
+                        reserved_range['used'] = IPUsageBitmap.from_bool_list(reserved_range['used']).to_encoded()
+                        changed = True
+            if changed:
+                db['topology'].update_one({"_id": topology_item["_id"]}, {"$set": {"networks": network_list}})
+
+    def downgrade(self, db: Database):
+        pass
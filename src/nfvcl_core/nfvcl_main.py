@@ -33,10 +33,10 @@ from nfvcl_core_models.custom_types import NFVCLCoreException
 from nfvcl_core_models.k8s_management_models import Labels
 from nfvcl_core_models.monitoring.prometheus_model import PrometheusServerModel
 from nfvcl_core_models.network.network_models import PduModel, NetworkModel, RouterModel, IPv4Pool, IPv4ReservedRange, IPv4ReservedRangeRequest
-from nfvcl_core_models.performance import BlueprintPerformance
+from nfvcl_core_models.performance import BlueprintPerformance, BlueprintPerformanceHistoryOperation
 from nfvcl_core_models.plugin_k8s_model import K8sPluginsToInstall, K8sMonitoringConfig
 from nfvcl_core_models.response_model import OssCompliantResponse
-from nfvcl_core_models.task import NFVCLTaskResult, NFVCLTask, NFVCLTaskStatus, NFVCLTaskStatusType
+from nfvcl_core_models.task import NFVCLTaskResult, NFVCLTask, NFVCLTaskStatus, NFVCLTaskStatusType, NFVCLTaskLane, NFVCLTaskSchedulerMetrics
 from nfvcl_core_models.topology_k8s_model import TopologyK8sModel, K8sQuota, ProvidedBy
 from nfvcl_core_models.topology_models import TopologyModel
 from nfvcl_core_models.user import UserNoConfidence, UserCreateREST
@@ -138,18 +138,18 @@ class NFVCL:
 
         return sorted(public_methods, key=lambda x: x.order)
 
-    def _add_task_sync(self, function: Callable, *args, **kwargs):
+    def _add_task_sync(self, function: Callable, *args, lane: NFVCLTaskLane = NFVCLTaskLane.DAY2, serialization_key: Optional[str] = None, **kwargs):
         event = threading.Event()
         # used to receive the return data from the function
         namespace = {}
-        self.task_manager.add_task(NFVCLTask(function, partial(callback_function, event, namespace), *args, **kwargs))
+        self.task_manager.add_task(NFVCLTask(function, partial(callback_function, event, namespace), *args, lane=lane, serialization_key=serialization_key, **kwargs))
         event.wait()
         task_result: NFVCLTaskResult = namespace["msg"]
         if task_result.error:
             raise task_result.exception
         return namespace["msg"]
 
-    def _add_task_async(self, function: Callable, *args, **kwargs) -> OssCompliantResponse:
+    def _add_task_async(self, function: Callable, *args, lane: NFVCLTaskLane = NFVCLTaskLane.DAY2, serialization_key: Optional[str] = None, **kwargs) -> OssCompliantResponse:
         callback: Optional[Callable] = kwargs.pop("callback", None)
         # check if the callable function has a pre_work_callback parameter
         function_args = inspect.getfullargspec(function).args
@@ -160,7 +160,7 @@ class NFVCL:
             event = threading.Event()
             kwargs["pre_work_callback"] = partial(pre_work_callback_function, event, namespace)
 
-        task_id = self.task_manager.add_task(NFVCLTask(function, callback, *args, **kwargs))
+        task_id = self.task_manager.add_task(NFVCLTask(function, callback, *args, lane=lane, serialization_key=serialization_key, **kwargs))
 
         async_response: OssCompliantResponse
 
@@ -176,6 +176,10 @@ class NFVCL:
         return async_response
 
     def add_task(self, function, *args, **kwargs):
+        """
+        Submit a function to the TaskManager.
+        The keyword arguments 'lane' (NFVCLTaskLane) and 'serialization_key' are consumed by the scheduler and not passed to the function.
+        """
         callback: Optional[Callable] = kwargs.pop("callback", None)
 
         # TODO check if the function is sync or async
@@ -190,7 +194,7 @@ class NFVCL:
     def get_module_routes(self, prefix) -> List[BlueprintDay2Route]:
         return blueprint_type.get_module_routes(prefix)
 
-    @NFVCLPublic(path="/get_task_status", section=UTILS_SECTION, method=HttpRequestType.GET, sync=True)
+    @NFVCLPublic(path="/get_task_status", section=UTILS_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
     def get_task_status(self, task_id: str) -> NFVCLTaskStatus:
         """
         Get the status of a task given its task_id
@@ -200,25 +204,34 @@ class NFVCL:
         Args:
             task_id: ID of the task to get the status of
 
-        Returns: NFVCLTaskStatus, the "status" field can be "running" or "done"
+        Returns: NFVCLTaskStatus, the "status" field can be "queued", "running" or "done"
         """
         if task_id not in self.task_manager.task_history:
             raise NFVCLCoreException(message="Task not found", http_equivalent_code=404)
         else:
             task = self.task_manager.task_history[task_id]
-            if task.result is None:
+            if not task.started:
+                return NFVCLTaskStatus(task_id=task_id, status=NFVCLTaskStatusType.QUEUED)
+            elif task.result is None:
                 return NFVCLTaskStatus(task_id=task_id, status=NFVCLTaskStatusType.RUNNING)
             else:
                 return NFVCLTaskStatus(task_id=task_id, status=NFVCLTaskStatusType.DONE, result=task.result.result, error=task.result.error, exception=str(task.result.exception) if task.result.exception else None)
 
+    @NFVCLPublic(path="/task_scheduler_metrics", section=UTILS_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_task_scheduler_metrics(self) -> NFVCLTaskSchedulerMetrics:
+        """
+        Get the queue depth and wait time of every scheduling lane of the task manager
+        """
+        return self.task_manager.get_metrics()
+
     ############# Topology #############
 
-    @NFVCLPublic(path="", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_topology(self, callback=None) -> TopologyModel:
+    @NFVCLPublic(path="", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_topology(self) -> TopologyModel:
         """
         Get information regarding the managed topology
         """
-        return self.add_task(self.topology_manager.get_topology, callback=callback)
+        return self.topology_manager.get_topology_snapshot()
 
     @NFVCLPublic(path="", section=TOPOLOGY_SECTION, method=HttpRequestType.POST, sync=True)
     def create_topology(self, topology: TopologyModel, callback=None):
@@ -231,9 +244,9 @@ class NFVCL:
     def delete_topology(self):
         return self.add_task(self.topology_manager.delete_topology)
 
-    @NFVCLPublic(path="/vim/{vim_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_vim(self, vim_id: str, callback=None) -> VimModel:
-        return self.add_task(self.topology_manager.get_vim, vim_id, callback=callback)
+    @NFVCLPublic(path="/vim/{vim_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_vim(self, vim_id: str) -> VimModel:
+        return self.topology_manager.get_topology_snapshot().get_vim(vim_id)
 
     @NFVCLPublic(path="/vim", section=TOPOLOGY_SECTION, method=HttpRequestType.POST, sync=True)
     def create_vim(self, vim: VimModel, callback=None):
@@ -247,9 +260,9 @@ class NFVCL:
     def delete_vim(self, vim_id: str, callback=None):
         return self.add_task(self.topology_manager.delete_vim, vim_id, callback=callback)
 
-    @NFVCLPublic(path="/network/{network_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_network(self, network_id: str, callback=None) -> NetworkModel:
-        return self.add_task(self.topology_manager.get_network, network_id, callback=callback)
+    @NFVCLPublic(path="/network/{network_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_network(self, network_id: str) -> NetworkModel:
+        return self.topology_manager.get_topology_snapshot().get_network(network_id)
 
     @NFVCLPublic(path="/network", section=TOPOLOGY_SECTION, method=HttpRequestType.POST, sync=True)
     def create_network(self, network: NetworkModel, callback=None):
@@ -279,9 +292,9 @@ class NFVCL:
     def delete_network(self, network_id: str, callback=None):
         return self.add_task(self.topology_manager.delete_network, network_id, callback=callback)
 
-    @NFVCLPublic(path="/router/{router_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_router(self, router_id: str, callback=None) -> RouterModel:
-        return self.add_task(self.topology_manager.get_router, router_id, callback=callback)
+    @NFVCLPublic(path="/router/{router_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_router(self, router_id: str) -> RouterModel:
+        return self.topology_manager.get_topology_snapshot().get_router(router_id)
 
     @NFVCLPublic(path="/router", section=TOPOLOGY_SECTION, method=HttpRequestType.POST, sync=True)
     def create_router(self, router: RouterModel, callback=None) -> RouterModel:
@@ -291,13 +304,13 @@ class NFVCL:
     def delete_router(self, router_id: str, callback=None) -> RouterModel:
         return self.add_task(self.topology_manager.delete_router, router_id, callback=callback)
 
-    @NFVCLPublic(path="/pdus", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_pdus(self, callback=None) -> List[PduModel]:
-        return self.add_task(self.topology_manager.get_pdus, callback=callback)
+    @NFVCLPublic(path="/pdus", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_pdus(self) -> List[PduModel]:
+        return self.topology_manager.get_topology_snapshot().get_pdus()
 
-    @NFVCLPublic(path="/pdu/{pdu_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_pdu(self, pdu_id: str, callback=None) -> PduModel:
-        return self.add_task(self.topology_manager.get_pdu, pdu_id, callback=callback)
+    @NFVCLPublic(path="/pdu/{pdu_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_pdu(self, pdu_id: str) -> PduModel:
+        return self.topology_manager.get_topology_snapshot().get_pdu(pdu_id)
 
     @NFVCLPublic(path="/pdu", section=TOPOLOGY_SECTION, method=HttpRequestType.POST, sync=True)
     def create_pdu(self, pdu: PduModel, callback=None):
@@ -311,13 +324,13 @@ class NFVCL:
     # def force_unlock_pdu(self, pdu_id: str, callback=None):
     #     return self._add_task(self._topology_manager.force_unlock_pdu, pdu_id, callback=callback)
 
-    @NFVCLPublic(path="/kubernetes", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_kubernetes_list(self, callback=None) -> List[TopologyK8sModel]:
-        return self.add_task(self.topology_manager.get_kubernetes_list, callback=callback)
+    @NFVCLPublic(path="/kubernetes", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_kubernetes_list(self) -> List[TopologyK8sModel]:
+        return self.topology_manager.get_topology_snapshot().kubernetes
 
-    @NFVCLPublic(path="/kubernetes/{cluster_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_kubernetes(self, cluster_id: str, callback=None) -> TopologyK8sModel:
-        return self.add_task(self.topology_manager.get_k8s_cluster_by_id, cluster_id, callback=callback)
+    @NFVCLPublic(path="/kubernetes/{cluster_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
+    def get_kubernetes(self, cluster_id: str) -> TopologyK8sModel:
+        return self.topology_manager.get_topology_snapshot().get_k8s_cluster(cluster_id)
 
     @NFVCLPublic(
         path="/kubernetes_external",
@@ -342,13 +355,13 @@ class NFVCL:
     # Prometheus Section #
     ######################
 
-    @NFVCLPublic(path="/prometheus",section=TOPOLOGY_SECTION,method=HttpRequestType.GET,sync=True,summary=GET_PROM_LIST_SRV_SUMMARY,description=GET_PROM_LIST_SRV_DESCRIPTION)
-    def get_prometheus_list(self, callback=None) -> List[PrometheusServerModel]:
-        return self.add_task(self.topology_manager.get_prometheus_list, callback=callback)
+    @NFVCLPublic(path="/prometheus",section=TOPOLOGY_SECTION,method=HttpRequestType.GET,sync=True,read_only=True,summary=GET_PROM_LIST_SRV_SUMMARY,description=GET_PROM_LIST_SRV_DESCRIPTION)
+    def get_prometheus_list(self) -> List[PrometheusServerModel]:
+        return self.topology_manager.get_topology_snapshot().prometheus_srv
 
-    @NFVCLPublic(path="/prometheus/{prometheus_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, summary=GET_PROM_SRV_SUMMARY, description=GET_PROM_SRV_DESCRIPTION)
-    def get_prometheus(self, prometheus_id: str, callback=None) -> PrometheusServerModel:
-        return self.add_task(self.topology_manager.get_prometheus, prometheus_id, callback=callback)
+    @NFVCLPublic(path="/prometheus/{prometheus_id}", section=TOPOLOGY_SECTION, method=HttpRequestType.GET, sync=True, read_only=True, summary=GET_PROM_SRV_SUMMARY, description=GET_PROM_SRV_DESCRIPTION)
+    def get_prometheus(self, prometheus_id: str) -> PrometheusServerModel:
+        return self.topology_manager.get_topology_snapshot().find_prom_srv(prometheus_id)
 
     @NFVCLPublic(path="/prometheus", section=TOPOLOGY_SECTION, method=HttpRequestType.POST, summary=ADD_PROM_SRV_SUMMARY, description=ADD_PROM_SRV_DESCRIPTION, sync=True)
     def create_prometheus(self, prometheus_model: PrometheusServerModel, callback=None) -> PrometheusServerModel:
@@ -371,56 +384,62 @@ class NFVCL:
     #####################
 
     @NFVCLPublic(path="", section=BLUEPRINTS_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_blueprints(self, blue_type: str = None, detailed: bool = False, tree: bool = False, callback=None) -> List[dict]:
-        return self.add_task(self.blueprint_manager.get_blueprint_summary_list, blue_type, detailed, tree, callback=callback)
+    def get_blueprints(self, blue_type: str = None, detailed: bool = False, tree: bool = False) -> List[dict]:
+        # The detailed representation is not kept in the snapshots, it needs to be serialized by a worker: these methods
+        # can block and are not read_only
+        if detailed:
+            return self.add_task(self.blueprint_manager.get_blueprint_summary_list, blue_type, detailed, tree, lane=NFVCLTaskLane.READ)
+        return self.blueprint_manager.get_blueprint_summary_list_snapshot(blue_type, tree)
 
     @NFVCLPublic(path="/{blueprint_id}", section=BLUEPRINTS_SECTION, method=HttpRequestType.GET, sync=True)
-    def get_blueprint(self, blueprint_id: str = None, detailed: bool = False, callback=None) -> dict:
-        return self.add_task(self.blueprint_manager.get_blueprint_summary_by_id, blueprint_id, detailed, callback=callback)
+    def get_blueprint(self, blueprint_id: str = None, detailed: bool = False) -> dict:
+        if detailed:
+            return self.add_task(self.blueprint_manager.get_blueprint_summary_by_id, blueprint_id, detailed, lane=NFVCLTaskLane.READ)
+        return self.blueprint_manager.get_blueprint_summary_by_id_snapshot(blueprint_id)
 
     # @NFVCLPublic(path="", section=BLUEPRINTS_SECTION, method=HttpRequestType.POST)
     def create_blueprint(self, blue_type: str, msg: BlueprintNGCreateModel, callback=None):
-        return self.add_task(self.blueprint_manager.create_blueprint, blue_type, msg, callback=callback)
+        return self.add_task(self.blueprint_manager.create_blueprint, blue_type, msg, callback=callback, lane=NFVCLTaskLane.DAY0)
 
     # @NFVCLPublic(path="", section=BLUEPRINTS_SECTION, method=HttpRequestType.PUT)
     def update_blueprint(self, blue_id: str, day2_path: str, msg: Any = None, callback=None):
-        return self.add_task(self.blueprint_manager.update_blueprint, blue_id, day2_path, msg, callback=callback)
+        return self.add_task(self.blueprint_manager.update_blueprint, blue_id, day2_path, msg, callback=callback, serialization_key=blue_id)
 
     # @NFVCLPublic(path="/get_from_blueprint", section=BLUEPRINTS_SECTION, method=HttpRequestType.GET)
     def get_from_blueprint(self, blue_id: str, day2_path: str, callback=None) -> Any:
-        return self.add_task(self.blueprint_manager.get_from_blueprint, blue_id, day2_path, callback=callback)
+        return self.add_task(self.blueprint_manager.get_from_blueprint, blue_id, day2_path, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{blueprint_id}", section=BLUEPRINTS_SECTION, method=HttpRequestType.DELETE)
     def delete_blueprint(self, blueprint_id: str, force_deletion: bool = False, callback=None):
-        return self.add_task(self.blueprint_manager.delete_blueprint, blueprint_id, force_deletion=force_deletion,callback=callback)
+        return self.add_task(self.blueprint_manager.delete_blueprint, blueprint_id, force_deletion=force_deletion,callback=callback, lane=NFVCLTaskLane.DAY0, serialization_key=blueprint_id)
 
     @NFVCLPublic(path="/all/blue", section=BLUEPRINTS_SECTION, method=HttpRequestType.DELETE)
     def delete_all_blueprints(self, callback=None):
-        return self.add_task(self.blueprint_manager.delete_all_blueprints, callback=callback)
+        return self.add_task(self.blueprint_manager.delete_all_blueprints, callback=callback, lane=NFVCLTaskLane.DAY0)
 
     @NFVCLPublic(path="/protect/{blueprint_id}", section=BLUEPRINTS_SECTION, method=HttpRequestType.PATCH, sync=True)
     def protect_blueprint(self, blueprint_id: str, protect: bool, callback=None) -> dict:
-        return self.add_task(self.blueprint_manager.protect_blueprint, blueprint_id, protect, callback=callback)
+        return self.add_task(self.blueprint_manager.protect_blueprint, blueprint_id, protect, callback=callback, serialization_key=blueprint_id)
 
     @NFVCLPublic(path="/{snapshot_name}", section=SNAPSHOT_SECTION, method=HttpRequestType.GET, sync=True)
     def get_snapshot(self, snapshot_name: str, callback=None) -> BlueprintNGBaseModel:
-        return self.add_task(self.blueprint_manager.get_snapshot, snapshot_name, callback=callback)
+        return self.add_task(self.blueprint_manager.get_snapshot, snapshot_name, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/", section=SNAPSHOT_SECTION, method=HttpRequestType.GET, sync=True)
     def get_snapshot_list(self, callback=None) -> List[BlueprintNGBaseModel]:
-        return self.add_task(self.blueprint_manager.get_snapshot_list, callback=callback)
+        return self.add_task(self.blueprint_manager.get_snapshot_list, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{blueprint_id}", section=SNAPSHOT_SECTION, method=HttpRequestType.POST, sync=True)
     def snapshot_blueprint(self, blueprint_id: str, snapshot_name: str, callback=None) -> BlueprintNGBaseModel:
-        return self.add_task(self.blueprint_manager.snapshot_blueprint, snapshot_name, blueprint_id, callback=callback)
+        return self.add_task(self.blueprint_manager.snapshot_blueprint, snapshot_name, blueprint_id, callback=callback, serialization_key=blueprint_id)
 
     @NFVCLPublic(path="/restore/{snapshot_name}", section=SNAPSHOT_SECTION, method=HttpRequestType.POST)
     def snapshot_restore(self, snapshot_name: str, callback=None):
-        return self.add_task(self.blueprint_manager.snapshot_restore, snapshot_name, callback=callback)
+        return self.add_task(self.blueprint_manager.snapshot_restore, snapshot_name, callback=callback, lane=NFVCLTaskLane.DAY0)
 
     @NFVCLPublic(path="/snapshot_and_delete/{blueprint_id}", section=SNAPSHOT_SECTION, method=HttpRequestType.POST)
     def snapshot_and_delete_blueprint(self, blueprint_id: str, snapshot_name: str, callback=None):
-        return self.add_task(self.blueprint_manager.snapshot_and_delete, snapshot_name, blueprint_id, callback=callback)
+        return self.add_task(self.blueprint_manager.snapshot_and_delete, snapshot_name, blueprint_id, callback=callback, lane=NFVCLTaskLane.DAY0, serialization_key=blueprint_id)
 
     @NFVCLPublic(path="/{snapshot_name}", section=SNAPSHOT_SECTION, method=HttpRequestType.DELETE, sync=True)
     def delete_snapshot(self, snapshot_name: str, callback=None) -> BlueprintNGBaseModel:
@@ -430,11 +449,15 @@ class NFVCL:
 
     @NFVCLPublic(path="/", section=PERFORMANCE_SECTION, method=HttpRequestType.GET, sync=True)
     def get_all_performances(self, callback=None) -> List[BlueprintPerformance]:
-        return self.add_task(self.performance_manager.get_all_performaces, callback=callback)
+        return self.add_task(self.performance_manager.get_all_performaces, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{blueprint_id}", section=PERFORMANCE_SECTION, method=HttpRequestType.GET, sync=True)
     def get_performance(self, blueprint_id: str, callback=None) -> BlueprintPerformance:
-        return self.add_task(self.performance_manager.get_blue_performance, blueprint_id, callback=callback)
+        return self.add_task(self.performance_manager.get_blue_performance, blueprint_id, callback=callback, lane=NFVCLTaskLane.READ)
+
+    @NFVCLPublic(path="/{blueprint_id}/history", section=PERFORMANCE_SECTION, method=HttpRequestType.GET, sync=True)
+    def get_performance_history(self, blueprint_id: str, callback=None) -> List[BlueprintPerformanceHistoryOperation]:
+        return self.add_task(self.performance_manager.get_archived_operations, blueprint_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     # @NFVCLPublic(path="/{blueprint_id}", section=PERFORMANCE_SECTION, method=HttpRequestType.DELETE)
     # def delete_performance(self, blueprint_id: str, callback=None):
@@ -446,7 +469,7 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/plugins", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_installed_plugins)
     def k8s_get_installed_plugins(self, cluster_id: str, callback=None) -> List[str]:
-        return self.add_task(self.kubernetes_manager.get_k8s_installed_plugins, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_installed_plugins, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/plugins", section=K8S_SECTION, method=HttpRequestType.PUT, sync=False, doc_by=KubernetesManager.install_plugins)
     def k8s_install_plugin(self, cluster_id: str, plugin_name: K8sPluginsToInstall, callback=None) -> OssCompliantResponse:
@@ -478,27 +501,27 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/cidr", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_cidr)
     def k8s_get_cluster_cidr(self, cluster_id: str, callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_k8s_cidr, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_cidr, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/ipaddresspools", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_ipaddress_pools)
     def k8s_get_ipaddresspools(self, cluster_id: str, callback=None) -> List[str]:
-        return self.add_task(self.kubernetes_manager.get_k8s_ipaddress_pools, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_ipaddress_pools, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/storageclasses", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_storage_classes)
     def k8s_get_storage_classes(self, cluster_id: str, callback=None) -> List[str]:
-        return self.add_task(self.kubernetes_manager.get_k8s_storage_classes, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_storage_classes, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/defaultstorageclasses", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_default_storage_class)
     def k8s_get_default_storage_classes(self, cluster_id: str, callback=None) -> str:
-        return self.add_task(self.kubernetes_manager.get_k8s_default_storage_class, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_default_storage_class, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/pods", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_pods)
     def k8s_get_pods(self, cluster_id: str, callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_k8s_pods, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_pods, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/namespaces", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_namespace_list)
     def k8s_get_namespace_list(self, cluster_id: str, namespace: Optional[str] = None, callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_k8s_namespace_list, cluster_id, namespace, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_namespace_list, cluster_id, namespace, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/namespace/{name}", section=K8S_SECTION, method=HttpRequestType.POST, sync=True, doc_by=KubernetesManager.create_k8s_namespace)
     def k8s_create_namespace(self, cluster_id: str, name: str, labels: dict, callback=None) -> OssCompliantResponse:
@@ -518,7 +541,7 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/sa", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_service_account)
     def k8s_get_service_account(self, cluster_id: str, callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_k8s_service_account, cluster_id, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_k8s_service_account, cluster_id, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/secret/{namespace}/{user}", section=K8S_SECTION, method=HttpRequestType.POST, sync=True, doc_by=KubernetesManager.create_secret_for_sa)
     def k8s_create_secret_for_sa(self, cluster_id: str, namespace: str, user: str, secret_name: Annotated[str, "text/plain"], callback=None) -> dict:
@@ -526,7 +549,7 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/roles", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_k8s_roles)
     def k8s_get_roles(self, cluster_id: str, rolename: Optional[str] = None, namespace: Optional[str] = None, callback=None) -> dict:
-        role_list = self.add_task(self.kubernetes_manager.get_k8s_roles, cluster_id, rolename, namespace, callback=callback)
+        role_list = self.add_task(self.kubernetes_manager.get_k8s_roles, cluster_id, rolename, namespace, callback=callback, lane=NFVCLTaskLane.READ)
         return role_list.to_dict()
 
     @NFVCLPublic(path="/{cluster_id}/roles/admin/sa/{namespace}/{s_account}", section=K8S_SECTION, method=HttpRequestType.POST, sync=True, doc_by=KubernetesManager.give_admin_rights_to_sa)
@@ -539,7 +562,7 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/secrets", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_secrets)
     def k8s_get_secrets(self, cluster_id: str, namespace: str = "", secret_name: str = "", owner: str = "", callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_secrets, cluster_id, namespace, secret_name, owner, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_secrets, cluster_id, namespace, secret_name, owner, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/user/{username}", section=K8S_SECTION, method=HttpRequestType.POST, sync=True, doc_by=KubernetesManager.create_k8s_kubectl_user, summary="Create (the user) and retrieve info for a new kubectl user")
     def k8s_create_kubectl_user(self, cluster_id: str, username: str, expire_seconds: int = 31536000, callback=None) -> dict:
@@ -559,7 +582,7 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/nodes", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_nodes)
     def k8s_get_nodes(self, cluster_id: str, detailed: bool = False, callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_nodes, cluster_id, detailed, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_nodes, cluster_id, detailed, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/node/{node_name}", section=K8S_SECTION, method=HttpRequestType.POST, sync=True, doc_by=KubernetesManager.add_label_to_k8s_node)
     def k8s_add_label_to_node(self, cluster_id: str, node_name: str, labels: Labels, callback=None) -> dict:
@@ -567,7 +590,7 @@ class NFVCL:
 
     @NFVCLPublic(path="/{cluster_id}/deployments", section=K8S_SECTION, method=HttpRequestType.GET, sync=True, doc_by=KubernetesManager.get_deployment)
     def k8s_get_deployment(self, cluster_id: str, namespace: str, detailed: bool = False, callback=None) -> dict:
-        return self.add_task(self.kubernetes_manager.get_deployment, cluster_id, namespace, detailed, callback=callback)
+        return self.add_task(self.kubernetes_manager.get_deployment, cluster_id, namespace, detailed, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/{cluster_id}/deployment/label", section=K8S_SECTION, method=HttpRequestType.POST, sync=True, doc_by=KubernetesManager.add_label_to_k8s_deployment)
     def k8s_add_label_to_deployment(self, cluster_id: str, namespace: str, deployment_name: str, labels: Labels, callback=None) -> dict:
@@ -581,11 +604,11 @@ class NFVCL:
 
     @NFVCLPublic(path="/{username}", section=USER_SECTION, method=HttpRequestType.GET, sync=True)
     def get_user(self, username: str, callback=None) -> UserNoConfidence:
-        return self.add_task(self.user_manager.get_censored_user_by_username, username, callback=callback)
+        return self.add_task(self.user_manager.get_censored_user_by_username, username, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/", section=USER_SECTION, method=HttpRequestType.GET, sync=True)
     def get_user_list(self, callback=None) -> List[UserNoConfidence]:
-        return self.add_task(self.user_manager.get_censored_users, callback=callback)
+        return self.add_task(self.user_manager.get_censored_users, callback=callback, lane=NFVCLTaskLane.READ)
 
     @NFVCLPublic(path="/", section=USER_SECTION, method=HttpRequestType.POST, sync=True)
     def create_user(self, user: UserCreateREST, callback=None) -> UserNoConfidence:
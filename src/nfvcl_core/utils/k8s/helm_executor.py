@@ -0,0 +1,198 @@
+import asyncio
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple, Union
+
+from pyhelm3 import Client, ReleaseRevisionStatus
+from pyhelm3.models import Chart, ReleaseRevision
+
+from nfvcl_common.utils.file_utils import create_tmp_file
+from nfvcl_common.utils.log import create_logger
+from nfvcl_core.utils.k8s.k8s_utils import get_k8s_credential_digest
+
+# Seconds for which the metadata of a chart without a pinned version is cached
+HELM_CHART_CACHE_TTL = 300
+# Seconds for which the list of the releases is cached, it is also refreshed after every change made by NFVCL
+HELM_RELEASE_CACHE_TTL = 30
+
+
+class HelmExecutor:
+    """
+    Execute the Helm operations on a Kubernetes cluster from sync code.
+
+    The pyhelm3 coroutines are submitted to a single event loop running in a daemon thread for the whole life of NFVCL,
+    so the callers do not create and tear down an event loop for every call. Operations submitted by different threads
+    are executed concurrently. The chart metadata and the list of the releases of the cluster are cached.
+    """
+
+    def __init__(self, kubeconfig_content: str, cluster_key: str = ""):
+        self.logger = create_logger(self.__class__.__name__)
+        # The cluster is part of the file name, so closing the executor of a cluster does not remove the file of another one
+        digest = hashlib.sha256(f"{cluster_key}:{kubeconfig_content}".encode()).hexdigest()[:16]
+        self.kubeconfig_path = create_tmp_file(f"k8s_credential_{digest}", "helm", True)
+        self.kubeconfig_path.write_text(kubeconfig_content)
+        self.client = Client(kubeconfig=self.kubeconfig_path)
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True, name=f"HelmExecutor-{digest}")
+        self._thread.start()
+
+        self._lock = threading.Lock()
+        # Number of operations running on the loop, the executor is stopped by the last one after close()
+        self._running = 0
+        self._closed = False
+        # (chart ref, repo, version) -> (chart, load time)
+        self._charts: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[Chart, float]] = {}
+        self._chart_locks: Dict[Tuple[str, Optional[str], Optional[str]], threading.Lock] = {}
+        # (release name, namespace) of the releases in the cluster, None if it must be loaded
+        self._releases: Optional[Set[Tuple[str, str]]] = None
+        self._releases_time = 0.0
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Execute a coroutine on the event loop of the executor and wait for its result
+        """
+        with self._lock:
+            if self._closed:
+                coroutine.close()
+                raise RuntimeError("The Helm executor has been closed")
+            self._running += 1
+        try:
+            return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+        finally:
+            with self._lock:
+                self._running -= 1
+                stop = self._closed and self._running == 0
+            if stop:
+                self._stop()
+
+    def get_chart(self, chart_ref: Union[str, Path], repo: Optional[str] = None, version: Optional[str] = None) -> Chart:
+        """
+        Get the chart, the metadata of charts with a pinned version are loaded once
+        Args:
+            chart_ref: The chart reference (name in the repo or path)
+            repo: The chart repository
+            version: The chart version, if None the latest one
+
+        Returns:
+            The chart
+        """
+        key = (str(chart_ref), repo, version)
+        with self._lock:
+            chart_lock = self._chart_locks.setdefault(key, threading.Lock())
+        # Concurrent requests of the same chart load it once
+        with chart_lock:
+            cached = self._charts.get(key)
+            if cached is not None and (version is not None or time.monotonic() - cached[1] < HELM_CHART_CACHE_TTL):
+                return cached[0]
+            chart = self.run(self.client.get_chart(chart_ref, repo=repo, version=version))
+            self._charts[key] = (chart, time.monotonic())
+            return chart
+
+    def install_or_upgrade_release(self, release_name: str, chart: Chart, values: Dict[str, Any], namespace: str, **kwargs) -> ReleaseRevision:
+        try:
+            return self.run(self.client.install_or_upgrade_release(release_name, chart, values, namespace=namespace, **kwargs))
+        finally:
+            self._invalidate_releases()
+
+    def uninstall_release(self, release_name: str, namespace: str, wait: bool = True):
+        try:
+            self.run(self.client.uninstall_release(release_name, namespace=namespace, wait=wait))
+        finally:
+            self._invalidate_releases()
+
+    def list_releases(self, namespace: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Get the releases of the cluster from the cached release index
+        Args:
+            namespace: If given, only the releases in this namespace
+
+        Returns:
+            List of (release name, namespace)
+        """
+        with self._lock:
+            releases = self._releases
+            if releases is not None and time.monotonic() - self._releases_time > HELM_RELEASE_CACHE_TTL:
+                releases = None
+        if releases is None:
+            definitions = self.run(self.client.list_release_definitions(all=True, all_namespaces=True))
+            releases = {(definition["name"], definition["namespace"]) for definition in definitions}
+            with self._lock:
+                self._releases = releases
+                self._releases_time = time.monotonic()
+        return [release for release in releases if namespace is None or release[1] == namespace]
+
+    def is_release_installed(self, release_name: str, namespace: str) -> bool:
+        return (release_name, namespace) in self.list_releases(namespace)
+
+    def get_release_status(self, release_name: str, namespace: str) -> ReleaseRevisionStatus:
+        """
+        Get the status of the current revision of a release, only the release is queried
+        """
+        revision: ReleaseRevision = self.run(self.client.get_current_revision(release_name, namespace=namespace))
+        return revision.status
+
+    def close(self):
+        """
+        Stop the event loop and delete the kubeconfig file, the operations already running are completed first
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            stop = self._running == 0
+        if stop:
+            self._stop()
+
+    def _run_loop(self):
+        self._loop.run_forever()
+        self._loop.close()
+
+    def _stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.kubeconfig_path.unlink(missing_ok=True)
+
+    def _invalidate_releases(self):
+        with self._lock:
+            self._releases = None
+
+
+# (cluster id or credential digest, credential digest) -> executor
+_helm_executors: Dict[Tuple[str, str], HelmExecutor] = {}
+_helm_executors_lock = threading.Lock()
+
+
+def get_helm_executor(kubeconfig_content: str, cluster_id: Optional[str] = None) -> HelmExecutor:
+    """
+    Get the Helm executor of a cluster, the executor is shared by every user of the cluster.
+    When the credentials of the cluster change, the executor of the old ones is closed.
+    Args:
+        kubeconfig_content: The content of the Kubernetes credential file of the cluster
+        cluster_id: The id of the cluster in the topology, if None the executor is shared by every user of the same credentials
+
+    Returns:
+        The HelmExecutor of the cluster
+    """
+    digest = get_k8s_credential_digest(kubeconfig_content)
+    cluster_key = cluster_id if cluster_id is not None else digest
+    with _helm_executors_lock:
+        executor = _helm_executors.get((cluster_key, digest))
+        if executor is None:
+            for key in [key for key in _helm_executors.keys() if key[0] == cluster_key]:
+                _helm_executors.pop(key).close()
+            executor = HelmExecutor(kubeconfig_content, cluster_key)
+            _helm_executors[(cluster_key, digest)] = executor
+        return executor
+
+
+def close_helm_executors(cluster_id: str):
+    """
+    Close the Helm executors of a cluster, the operations already running are completed
+    Args:
+        cluster_id: The id of the cluster in the topology
+    """
+    with _helm_executors_lock:
+        for key in [key for key in _helm_executors.keys() if key[0] == cluster_id]:
+            _helm_executors.pop(key).close()
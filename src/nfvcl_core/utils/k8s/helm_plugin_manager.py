@@ -1,54 +1,57 @@
-import asyncio
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import List
+from typing import List, Callable, Iterable, Optional, Dict
 
 import yaml
 from kubernetes.client import V1DaemonSet
 from kubernetes.utils import FailToCreateError
-from pyhelm3 import Client
 from verboselogs import VerboseLogger
 
-from nfvcl_common.utils.file_utils import render_file_from_template_to_file, create_tmp_file
+from nfvcl_common.utils.file_utils import render_file_from_template_to_file
 from nfvcl_common.utils.log import create_logger
-from nfvcl_core.utils.k8s.k8s_utils import get_k8s_config_from_file_content
-from nfvcl_core.utils.k8s.kube_api_utils_class import KubeApiUtils
+from nfvcl_core.utils.k8s.helm_executor import get_helm_executor
+from nfvcl_core.utils.k8s.k8s_client_cache import k8s_client_cache
+from nfvcl_core.utils.k8s.readiness_waiter import KubeReadinessTarget, KubeReadinessKind
+from nfvcl_core_models.custom_types import NFVCLCoreException
 from nfvcl_core_models.monitoring.k8s_monitoring import K8sMonitoring, DestinationType
-from nfvcl_core_models.plugin_k8s_model import K8sPluginName, K8sPluginAdditionalData
+from nfvcl_core_models.plugin_k8s_model import K8sPluginName, K8sPluginAdditionalData, K8sPluginInstallReport, \
+    K8sPluginInstallResult, K8sPluginInstallStatus
 from nfvcl_core_models.resources import HelmChartResource
 
 
-def build_helm_client_from_credential_file_path(k8s_credential_file_path) -> Client:
-    """
-    Args:
-        k8s_credential_file_path: Path to the Kubernetes credentials file to authenticate the Helm client.
+PLUGIN_PATH = Path("helm_charts/k8s_plugins/")
+PLUGIN_VALUE_PATH = PLUGIN_PATH / 'values'
 
-    Returns:
-        Client: An instance of the Helm client authenticated using the provided Kubernetes credentials file path.
-    """
-    return Client(kubeconfig=k8s_credential_file_path)
+# Maximum number of plugins installed at the same time
+PLUGIN_INSTALL_WORKERS = 4
+# Seconds to wait for the resources of a plugin to be ready
+PLUGIN_READINESS_TIMEOUT = 300
+# Seconds between the attempts to apply a definition refused by the cluster (e.g. its webhook is not serving yet)
+PLUGIN_APPLY_RETRY_INTERVAL = 2
+NETWORK_PLUGINS = [K8sPluginName.FLANNEL, K8sPluginName.CALICO]
 
 
-def build_helm_client_from_credential_file_content(k8s_credential_file_content, k8s_credential_file_path) -> Client:
+class K8sPluginStep:
     """
-    Args:
-        k8s_credential_file_content: The content of the Kubernetes credential file.
-        k8s_credential_file_path: The file path where the Kubernetes credential file content will be written.
-
-    Returns:
-        Client: An instance of the Helm client authenticated using the provided Kubernetes credentials content.
+    A node of the plugin installation graph
     """
-    with open(k8s_credential_file_path, mode="w") as k8s_credential_file:
-        k8s_credential_file.write(k8s_credential_file_content)
-
-    helm_client = Client(kubeconfig=k8s_credential_file_path)
-
-    return helm_client
-
 
-PLUGIN_PATH = Path("helm_charts/k8s_plugins/")
-PLUGIN_VALUE_PATH = PLUGIN_PATH / 'values'
+    def __init__(self, name: K8sPluginName, install: Callable[[K8sPluginAdditionalData], None], requires: Iterable[K8sPluginName] = (), readiness_namespace: Optional[str] = None, readiness: Iterable[KubeReadinessTarget] = ()):
+        """
+        Args:
+            name: The plugin name
+            install: The function installing the plugin
+            requires: The plugins that must be ready before this one is installed, if they are installed together with it
+            readiness_namespace: The namespace of the readiness targets
+            readiness: Resources that must be ready, in addition to the ones waited by Helm, before the plugin is considered installed
+        """
+        self.name = name
+        self.install = install
+        self.requires = list(requires)
+        self.readiness_namespace = readiness_namespace
+        self.readiness = list(readiness)
 
 
 class HelmPluginManager:
@@ -71,9 +74,10 @@ class HelmPluginManager:
 
     def __init__(self, k8s_credential_file, context_name: str = "") -> None:
         self.k8s_credential_file = k8s_credential_file
-        self.k8s_config = get_k8s_config_from_file_content(k8s_credential_file)
-        self.kube_utils = KubeApiUtils(self.k8s_config)
-        self.helm_client = build_helm_client_from_credential_file_content(k8s_credential_file, create_tmp_file(f"k8s_{context_name}.yaml", "k8s_helm_client_credentials", True))
+        # The context is the cluster id (or the K8s blueprint id, that is the id of the cluster it creates)
+        self.kube_utils = k8s_client_cache.get_kube_api_utils(k8s_credential_file, context_name if context_name else None)
+        self.k8s_config = self.kube_utils.kube_client_config
+        self.helm_executor = get_helm_executor(k8s_credential_file, context_name if context_name else None)
         self.context_name = context_name
         self.logger: VerboseLogger = create_logger(self.__class__.__name__, blueprintid=context_name)
 
@@ -97,23 +101,21 @@ class HelmPluginManager:
             namespace=namespace
         )
 
-        helm_client: Client = self.helm_client
-
-        chart = asyncio.run(helm_client.get_chart(
+        chart = self.helm_executor.get_chart(
             helm_chart_res.get_chart_converted(),
             repo=helm_chart_res.repo,
             version=helm_chart_res.version
-        ))
+        )
 
         self.logger.info(f"Installing chart {chart} in {namespace}")
-        asyncio.run(helm_client.install_or_upgrade_release(
+        self.helm_executor.install_or_upgrade_release(
             helm_chart_res.name.lower(),
             chart,
             values if values else {},
             namespace=helm_chart_res.namespace.lower(),
             atomic=True,
             wait=True
-        ))
+        )
 
     def uninstall_plugin(self, namespace: str, wait=True):
         """
@@ -122,49 +124,118 @@ class HelmPluginManager:
             namespace: str, The namespace in which the chart will be installed.
         """
 
-        helm_client: Client = self.helm_client
-        releases = asyncio.run(helm_client.list_releases(namespace=namespace))
+        releases = self.helm_executor.list_releases(namespace=namespace)
         self.logger.info(f"Uninstalling plugin in {namespace}")
-        for release in releases:
-            asyncio.run(helm_client.uninstall_release(release.name, namespace=namespace, wait=wait))
+        for release_name, release_namespace in releases:
+            self.helm_executor.uninstall_release(release_name, namespace=release_namespace, wait=wait)
 
-    def install_plugins(self, plugin_names: list[K8sPluginName], plugin_data: K8sPluginAdditionalData):
+    def install_plugins(self, plugin_names: list[K8sPluginName], plugin_data: K8sPluginAdditionalData) -> K8sPluginInstallReport:
         """
+        Install the plugins following their dependencies, plugins that do not depend on each other are installed at the
+        same time. A plugin is started as soon as the plugins it requires are ready.
+
         Args:
             plugin_names: list[K8sPluginName]: List of plugin names to be installed.
             plugin_data: K8sPluginAdditionalData: Additional data required for installing the plugins.
+
+        Returns:
+            The report with the outcome and the timing of every plugin
         """
-        plugin_names_copy = plugin_names.copy()
         installed_plugins = self.get_installed_plugins()
-        union = installed_plugins + plugin_names_copy
+        union = installed_plugins + plugin_names
         if K8sPluginName.CALICO in union and K8sPluginName.FLANNEL in union:
             self.logger.error("CALICO and FLANNEL cannot be installed at the same time")
             raise Exception("CALICO and FLANNEL cannot be installed at the same time")
-        # Check if there are already installed plugins
-        for installed_plugin in installed_plugins:
-            if installed_plugin in plugin_names_copy:
-                self.logger.warning(f"Plugin {installed_plugin.name} is already installed, the installation will be skipped")
-                plugin_names_copy.remove(installed_plugin)
-
-        # Network plugins must be installed before the others
-        if K8sPluginName.FLANNEL in plugin_names_copy:
-            self._install_flannel(plugin_data)
-            plugin_names_copy.remove(K8sPluginName.FLANNEL)
-        if K8sPluginName.CALICO in plugin_names_copy:
-            self._install_calico(plugin_data)
-            plugin_names_copy.remove(K8sPluginName.CALICO)
-
-        for plugin_name in plugin_names_copy:
-            if plugin_name == K8sPluginName.OPEN_EBS:
-                self._install_openebs()
-            elif plugin_name == K8sPluginName.MULTUS:
-                self._install_multus(plugin_data)
-            elif plugin_name == K8sPluginName.METALLB:
-                self._install_metallb(plugin_data)
-            elif plugin_name == K8sPluginName.CERT_MANAGER:
-                self._install_cert_manager(plugin_data)
-            elif plugin_name == K8sPluginName.NFVCL_WEBHOOK:
-                self._install_nfvcl_webhook(plugin_data)
+
+        steps = self._get_plugin_steps()
+        results: Dict[K8sPluginName, K8sPluginInstallResult] = {}
+        pending: Dict[K8sPluginName, K8sPluginStep] = {}
+        for plugin_name in dict.fromkeys(plugin_names):
+            if plugin_name in installed_plugins:
+                self.logger.warning(f"Plugin {plugin_name.name} is already installed, the installation will be skipped")
+                results[plugin_name] = K8sPluginInstallResult(name=plugin_name, status=K8sPluginInstallStatus.ALREADY_INSTALLED)
+            elif plugin_name not in steps:
+                self.logger.warning(f"Plugin {plugin_name.name} cannot be installed by the plugin manager, the installation will be skipped")
+                results[plugin_name] = K8sPluginInstallResult(name=plugin_name, status=K8sPluginInstallStatus.UNSUPPORTED)
+            else:
+                pending[plugin_name] = steps[plugin_name]
+        # Only the plugins installed now are waited, the other ones are already on the cluster (or not requested)
+        requirements = {name: [required for required in step.requires if required in pending] for name, step in pending.items()}
+
+        start = time.monotonic()
+        running: Dict[Future, K8sPluginName] = {}
+        with ThreadPoolExecutor(max_workers=PLUGIN_INSTALL_WORKERS, thread_name_prefix=f"Plugins-{self.context_name}") as executor:
+            while pending or running:
+                changed = True
+                while changed:
+                    changed = False
+                    for name in list(pending.keys()):
+                        missing_requirements = [required for required in requirements[name] if required in results and results[required].status != K8sPluginInstallStatus.INSTALLED]
+                        if missing_requirements:
+                            self.logger.error(f"Plugin {name.name} will not be installed, required plugins {[plugin.name for plugin in missing_requirements]} have not been installed")
+                            results[name] = K8sPluginInstallResult(name=name, status=K8sPluginInstallStatus.SKIPPED, requires=requirements[name], error=f"Required plugins not installed: {', '.join(plugin.value for plugin in missing_requirements)}")
+                            del pending[name]
+                            changed = True
+                        elif all(required in results for required in requirements[name]):
+                            running[executor.submit(self._install_plugin_step, pending.pop(name), requirements[name], plugin_data, start)] = name
+                if not running:
+                    break
+                finished, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    results[running.pop(future)] = future.result()
+
+        report = K8sPluginInstallReport(plugins=[results[name] for name in dict.fromkeys(plugin_names)], duration=time.monotonic() - start)
+        for result in report.plugins:
+            if result.duration is not None:
+                self.logger.info(f"Plugin {result.name}: {result.status}, started at {result.started_at:.1f}s, took {result.duration:.1f}s")
+        failed = report.failed()
+        if failed:
+            raise NFVCLCoreException(f"Plugins not installed: {', '.join(f'{result.name} ({result.error})' for result in failed)}")
+        return report
+
+    def _install_plugin_step(self, step: K8sPluginStep, requires: List[K8sPluginName], plugin_data: K8sPluginAdditionalData, start: float) -> K8sPluginInstallResult:
+        """
+        Install a plugin and wait for its readiness targets, the errors are returned in the result
+        """
+        result = K8sPluginInstallResult(name=step.name, status=K8sPluginInstallStatus.INSTALLED, requires=requires, started_at=time.monotonic() - start)
+        step_start = time.monotonic()
+        self.logger.info(f"Installing plugin {step.name.name}")
+        try:
+            step.install(plugin_data)
+            if step.readiness_namespace is not None and step.readiness:
+                ready = self.kube_utils.wait_for_resources_to_be_ready(step.readiness_namespace, step.readiness)
+                not_ready = [f"{kind.value} {name}" for (kind, name), is_ready in ready.items() if not is_ready]
+                if not_ready:
+                    raise TimeoutError(f"Resources not ready in namespace {step.readiness_namespace}: {', '.join(not_ready)}")
+        except Exception as e:
+            self.logger.error(f"Installation of plugin {step.name.name} failed: {e}")
+            self.logger.debug(traceback.format_exc())
+            result.status = K8sPluginInstallStatus.FAILED
+            result.error = str(e)
+        result.duration = time.monotonic() - step_start
+        return result
+
+    def _get_plugin_steps(self) -> Dict[K8sPluginName, K8sPluginStep]:
+        """
+        The plugins that can be installed by install_plugins, with their dependencies. Every plugin requires the network
+        plugin, that is needed by the pods to start.
+        """
+        return {
+            K8sPluginName.FLANNEL: K8sPluginStep(K8sPluginName.FLANNEL, self._install_flannel),
+            # The tigera operator creates the calico-node DaemonSet after its own installation
+            K8sPluginName.CALICO: K8sPluginStep(
+                K8sPluginName.CALICO,
+                self._install_calico,
+                readiness_namespace="calico-system",
+                readiness=[KubeReadinessTarget(KubeReadinessKind.DAEMON_SET, "calico-node", PLUGIN_READINESS_TIMEOUT)]
+            ),
+            K8sPluginName.OPEN_EBS: K8sPluginStep(K8sPluginName.OPEN_EBS, lambda plugin_data: self._install_openebs(), requires=NETWORK_PLUGINS),
+            K8sPluginName.MULTUS: K8sPluginStep(K8sPluginName.MULTUS, self._install_multus, requires=NETWORK_PLUGINS),
+            K8sPluginName.METALLB: K8sPluginStep(K8sPluginName.METALLB, self._install_metallb, requires=NETWORK_PLUGINS),
+            K8sPluginName.CERT_MANAGER: K8sPluginStep(K8sPluginName.CERT_MANAGER, self._install_cert_manager, requires=NETWORK_PLUGINS),
+            # The certificate of the webhook is issued by cert-manager
+            K8sPluginName.NFVCL_WEBHOOK: K8sPluginStep(K8sPluginName.NFVCL_WEBHOOK, self._install_nfvcl_webhook, requires=NETWORK_PLUGINS + [K8sPluginName.CERT_MANAGER]),
+        }
 
     def _install_openebs(self):
         """
@@ -350,24 +421,17 @@ class HelmPluginManager:
         self.__apply_yaml_file_to_cluster(K8sPluginName.NFVCL_WEBHOOK, rendered_file_certificates)
         self.__apply_yaml_file_to_cluster(K8sPluginName.NFVCL_WEBHOOK, rendered_file_deployment)
 
-        # Poll until the secret is available
-        max_retries = 30
-        retry_interval = 1  # seconds
-        ca_b64 = None
-        for attempt in range(max_retries):
-            try:
-                secret = self.kube_utils.get_secrets("nfvcl-webhook", "webhook-tls")
-                if secret and secret.items and len(secret.items) > 0 and "ca.crt" in secret.items[0].data:
-                    ca_b64 = secret.items[0].data["ca.crt"]
-                    break
-                self.logger.debug(f"Secret not ready yet, waiting (attempt {attempt + 1}/{max_retries})...")
-            except Exception as e:
-                self.logger.debug(f"Error retrieving secret: {e}")
+        # The deployment mounts the webhook-tls secret, it is ready only when cert-manager has issued the certificate
+        if not self.kube_utils.wait_for_deployment_to_be_ready_by_name("nfvcl-webhook", "nfvcl-webhook", PLUGIN_READINESS_TIMEOUT):
+            self.logger.error("Timed out waiting for nfvcl-webhook deployment")
+            raise TimeoutError("Timed out waiting for nfvcl-webhook deployment to be ready")
 
-            time.sleep(retry_interval)
+        ca_b64 = None
+        secret = self.kube_utils.get_secrets("nfvcl-webhook", "webhook-tls")
+        if secret and secret.items and len(secret.items) > 0 and "ca.crt" in secret.items[0].data:
+            ca_b64 = secret.items[0].data["ca.crt"]
         else:
-            self.logger.error("Timed out waiting for webhook-tls secret")
-            raise TimeoutError("Timed out waiting for webhook-tls secret to become available")
+            raise TimeoutError("The webhook-tls secret is not available")
 
         if ca_b64:
             rendered_file_webhook = render_file_from_template_to_file(template_file_webhook, {"cabundle": ca_b64}, self.context_name, ".yaml")
@@ -430,20 +494,25 @@ class HelmPluginManager:
 
         return plugin_list
 
-    def __apply_yaml_file_to_cluster(self, plugin_name: K8sPluginName, yaml_file_path: Path):
+    def __apply_yaml_file_to_cluster(self, plugin_name: K8sPluginName, yaml_file_path: Path, timeout: float = PLUGIN_READINESS_TIMEOUT):
         """
         Apply the contents of a YAML file to a Kubernetes cluster.
+        Definitions refused by the cluster (e.g. custom resources whose validating webhook is not serving yet) are applied
+        again until they are accepted or the timeout expires.
 
         Args:
             plugin_name: The name of the Kubernetes plugin for which the YAML file is being applied.
             yaml_file_path: The path to the YAML file containing the Kubernetes definitions to be applied.
+            timeout: Maximum number of seconds spent retrying.
         """
-        # Element in position 1 because apply_def_to_cluster is working on yaml file, please look at the source
-        # code of apply_def_to_cluster
-        try:
-            self.kube_utils.apply_def_to_cluster(yaml_file_to_be_applied=yaml_file_path)[1]
-        except FailToCreateError as fail:
-            self.logger.warning(traceback.format_tb(fail.__traceback__))
-            self.logger.warning("Definition <{}> for plugin <{}> has gone wrong. Retrying in 30 seconds...".format(str(yaml_file_path), plugin_name.name))
-            time.sleep(30)
-            self.kube_utils.apply_def_to_cluster(yaml_file_to_be_applied=yaml_file_path)[1]
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self.kube_utils.apply_def_to_cluster(yaml_file_to_be_applied=yaml_file_path)
+                return
+            except FailToCreateError as fail:
+                if time.monotonic() + PLUGIN_APPLY_RETRY_INTERVAL > deadline:
+                    self.logger.warning(traceback.format_tb(fail.__traceback__))
+                    raise
+                self.logger.debug(f"Definition <{yaml_file_path}> for plugin <{plugin_name.name}> not accepted yet, retrying in {PLUGIN_APPLY_RETRY_INTERVAL} seconds...")
+                time.sleep(PLUGIN_APPLY_RETRY_INTERVAL)
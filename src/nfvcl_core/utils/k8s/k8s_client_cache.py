@@ -0,0 +1,59 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from nfvcl_common.utils.log import create_logger
+from nfvcl_core.utils.k8s.k8s_utils import get_k8s_config_from_file_content, get_k8s_credential_digest
+from nfvcl_core.utils.k8s.kube_api_utils_class import KubeApiUtils
+
+
+class K8sClientCache:
+    """
+    Process wide cache of the Kubernetes API clients.
+
+    The KubeApiUtils of a cluster (holding the parsed Configuration and the ApiClient with its connection pool) is created
+    once and shared by every user of the cluster, so repeated operations do not parse the kubeconfig and do not open new
+    TLS connections. The clients are indexed by (cluster id, credential digest): when the credentials of a cluster change
+    in the topology a new client is created and the old one is discarded.
+    """
+
+    def __init__(self):
+        self.logger = create_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str], KubeApiUtils] = {}
+
+    def get_kube_api_utils(self, credentials: str, cluster_id: Optional[str] = None) -> KubeApiUtils:
+        """
+        Get the KubeApiUtils of a cluster
+        Args:
+            credentials: The content of the kubeconfig of the cluster
+            cluster_id: The id of the cluster in the topology, if None the client is shared by every user of the same credentials
+
+        Returns:
+            The shared KubeApiUtils
+        """
+        digest = get_k8s_credential_digest(credentials)
+        cluster_key = cluster_id if cluster_id is not None else digest
+        with self._lock:
+            kube_utils = self._clients.get((cluster_key, digest))
+            if kube_utils is None:
+                stale = [key for key in self._clients.keys() if key[0] == cluster_key]
+                if stale:
+                    self.logger.debug(f"Credentials of cluster {cluster_key} changed, discarding the old client")
+                for key in stale:
+                    del self._clients[key]
+                kube_utils = KubeApiUtils(get_k8s_config_from_file_content(credentials))
+                self._clients[(cluster_key, digest)] = kube_utils
+            return kube_utils
+
+    def invalidate(self, cluster_id: str):
+        """
+        Discard the clients of a cluster, the users still holding them can keep using them
+        Args:
+            cluster_id: The id of the cluster in the topology
+        """
+        with self._lock:
+            for key in [key for key in self._clients.keys() if key[0] == cluster_id]:
+                del self._clients[key]
+
+
+k8s_client_cache = K8sClientCache()
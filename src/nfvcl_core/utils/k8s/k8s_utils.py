@@ -1,8 +1,11 @@
-import tempfile
+import copy
+import hashlib
+import threading
 from logging import Logger
-from typing import List
+from typing import List, Dict
 
 import kubernetes.utils
+import yaml
 from kubernetes import config
 from kubernetes.client import Configuration
 from nfvcl_core_models.plugin_k8s_model import K8sPluginName
@@ -11,29 +14,33 @@ from nfvcl_common.utils.log import create_logger
 logger: Logger = create_logger("K8S UTILS")
 
 
+_k8s_configs: Dict[str, Configuration] = {}
+_k8s_configs_lock = threading.Lock()
+
+
 def get_k8s_config_from_file_content(kube_client_config_file_content: str) -> kubernetes.client.Configuration:
     """
-    Create a kube client config from the content of configuration file. It creates a temp file and read it's content in
-    order to create the k8s config
+    Create a kube client config from the content of configuration file. The content is parsed once, following calls
+    with the same content return a copy of the cached configuration.
     @param kube_client_config_file_content: the content of the configuration file
 
     @return kube client configuration
     """
-    tmp = tempfile.NamedTemporaryFile()
-    kube_client_config = type.__call__(Configuration)
-
-    try:
-        with open(tmp.name, 'w') as f:
-            f.write(kube_client_config_file_content)
-        tmp.flush()
+    digest = get_k8s_credential_digest(kube_client_config_file_content)
+    with _k8s_configs_lock:
+        kube_client_config = _k8s_configs.get(digest)
+        if kube_client_config is None:
+            kube_client_config = get_config_for_k8s_from_dict(yaml.safe_load(kube_client_config_file_content))
+            _k8s_configs[digest] = kube_client_config
+    # The caller may change the returned configuration
+    return copy.deepcopy(kube_client_config)
 
-        config.load_kube_config(config_file=tmp.name, context=None, client_configuration=kube_client_config,
-                                persist_config=False)
-        kube_client_config.verify_ssl = False
-    finally:
-        tmp.close()
 
-    return kube_client_config
+def get_k8s_credential_digest(kube_client_config_file_content: str) -> str:
+    """
+    Get the digest identifying the content of a kube client configuration file
+    """
+    return hashlib.sha256(kube_client_config_file_content.encode()).hexdigest()
 
 
 def get_config_for_k8s_from_dict(kube_client_config_dict: dict) -> kubernetes.client.Configuration:
@@ -44,7 +51,7 @@ def get_config_for_k8s_from_dict(kube_client_config_dict: dict) -> kubernetes.cl
     @return kube client configuration
     """
     kube_client_config = type.__call__(Configuration)
-    config.load_kube_config_from_dict(config_file=kube_client_config_dict, context=None, client_configuration=kube_client_config, persist_config=False)
+    config.load_kube_config_from_dict(config_dict=kube_client_config_dict, context=None, client_configuration=kube_client_config, persist_config=False)
     kube_client_config.verify_ssl = False
 
     return kube_client_config
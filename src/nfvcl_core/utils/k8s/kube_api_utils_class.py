@@ -1,7 +1,7 @@
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple
 
 import kubernetes
 import kubernetes.client
@@ -13,10 +13,11 @@ from kubernetes.client import V1ServiceAccountList, ApiException, V1ServiceAccou
     V1CertificateSigningRequestCondition, V1Role, V1PolicyRule, V1ClusterRoleBinding, V1ResourceQuota, \
     V1ResourceQuotaSpec, V1Deployment, V1DeploymentSpec, V1NodeList, V1Node, V1Container, V1DaemonSetList, \
     V1StorageClassList, V1PodList, V1ServiceList, V1DeploymentList, V1ConfigMap, VersionInfo, V1StorageClass, \
-    V1CustomResourceDefinitionList, V1RoleList
+    V1CustomResourceDefinitionList, V1RoleList, V1ReplicaSetList
 from kubernetes.stream import stream
 
 from nfvcl_core.utils.k8s.k8s_client_extension import create_from_yaml_custom
+from nfvcl_core.utils.k8s.readiness_waiter import KubeReadinessWaiter, KubeReadinessTarget, KubeReadinessKind
 from nfvcl_common.utils.log import create_logger
 from nfvcl_common.utils.util import generate_rsa_key, generate_cert_sign_req, convert_to_base64
 from nfvcl_core_models.custom_types import NFVCLCoreException
@@ -731,6 +732,58 @@ self.rbac_auth_v1_api.list_namespaced_role(namespace=namespace, field_selector='
 
         return pod_list
 
+    def get_replica_sets(self, namespace: str, label_selector: Optional[str] = None) -> V1ReplicaSetList:
+        """
+        Get the ReplicaSets of a namespace
+
+        Args:
+            namespace: The namespace in which the ReplicaSets reside
+            label_selector: The selector with which is possible to filter the list of ReplicaSets
+
+        Returns:
+            An object V1ReplicaSetList containing a list of ReplicaSets
+        """
+        apps_v1_api = kubernetes.client.AppsV1Api(self.api_client)
+
+        try:
+            replica_set_list = apps_v1_api.list_namespaced_replica_set(
+                namespace=namespace,
+                label_selector=label_selector,
+                timeout_seconds=self.TIMEOUT_SECONDS)
+        except ApiException as error:
+            raise NFVCLCoreException(f"Exception when calling AppsV1Api>get_replica_sets: {error}", http_equivalent_code=error.status)
+
+        return replica_set_list
+
+    def get_pods_by_deployment(self, namespace: str, deployments: V1DeploymentList) -> Dict[str, V1PodList]:
+        """
+        Get the pods of the deployments of a namespace. The ReplicaSets and the pods of the namespace are listed once and
+        matched to the deployments through their ownerReferences (pod -> ReplicaSet -> deployment).
+
+        Args:
+            namespace: The namespace in which the deployments reside
+            deployments: The deployments of the namespace
+
+        Returns:
+            deployment name -> pods (as V1PodList) of the deployment, every deployment is present even without pods
+        """
+        deployment_names: Dict[str, str] = {deployment.metadata.uid: deployment.metadata.name for deployment in deployments.items}
+        pods_by_deployment: Dict[str, List] = {deployment.metadata.name: [] for deployment in deployments.items}
+
+        # ReplicaSet uid -> name of the owner deployment
+        replica_set_owners: Dict[str, str] = {}
+        for replica_set in self.get_replica_sets(namespace).items:
+            for owner in replica_set.metadata.owner_references or []:
+                if owner.kind == "Deployment" and owner.uid in deployment_names:
+                    replica_set_owners[replica_set.metadata.uid] = deployment_names[owner.uid]
+
+        for pod in self.get_pods_for_namespace(namespace).items:
+            for owner in pod.metadata.owner_references or []:
+                if owner.kind == "ReplicaSet" and owner.uid in replica_set_owners:
+                    pods_by_deployment[replica_set_owners[owner.uid]].append(pod)
+
+        return {name: V1PodList(items=pods) for name, pods in pods_by_deployment.items()}
+
     def get_logs_for_pod(self, namespace: str, pod_name: str, tail_lines=None) -> str:
         """
         Get logs from a pod in a k8s instance that belongs to the given namespace
@@ -858,50 +911,54 @@ self.rbac_auth_v1_api.list_namespaced_role(namespace=namespace, field_selector='
         Returns:
             True if the deployment is ready within the timeout, False otherwise.
         """
-        apps_v1_api = kubernetes.client.AppsV1Api(self.api_client)
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            self.logger.debug(f"Waiting for deployment {deployment_name} in namespace {namespace} to be ready...")
-            deployment = apps_v1_api.read_namespaced_deployment_status(name=deployment_name, namespace=namespace)
-            if deployment.status.ready_replicas == deployment.spec.replicas:
-                self.logger.debug(f"Deployment {deployment_name} in namespace {namespace} ready")
-                return True
-            time.sleep(5)
-
-        self.logger.warning(f"Deployment {deployment_name} in namespace {namespace} not ready, timeout reached")
-        return False
+        self.logger.debug(f"Waiting for deployment {deployment_name} in namespace {namespace} to be ready...")
+        results = self.wait_for_resources_to_be_ready(namespace, [KubeReadinessTarget(KubeReadinessKind.DEPLOYMENT, deployment_name, timeout)])
+        return results[(KubeReadinessKind.DEPLOYMENT, deployment_name)]
 
     def wait_for_deployment_to_be_ready(self, deployment: V1Deployment, timeout: int = 300) -> bool:
         """
         Wait for a deployment to be ready.
 
         Args:
-            deployment: The deployment to wait for.
+            deployment: The deployment to wait for (as returned by the patch that changed it).
             timeout: The maximum time to wait for the deployment to be ready, in seconds.
 
         Returns:
             True if the deployment is ready within the timeout, False otherwise.
         """
-        deployment_name = deployment.metadata.name
-        namespace = deployment.metadata.namespace
+        return self.wait_for_deployments_to_be_ready([deployment], timeout)[deployment.metadata.name]
 
-        apps_v1_api = kubernetes.client.AppsV1Api(self.api_client)
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            self.logger.debug(f"Waiting for deployment {deployment_name} in namespace {namespace} to be ready...")
-            deployment_status = apps_v1_api.read_namespaced_deployment_status(name=deployment_name, namespace=namespace)
-            if deployment_status.spec.template.metadata.annotations == deployment.spec.template.metadata.annotations:
-                if deployment_status.status.ready_replicas == deployment_status.spec.replicas:
-                    self.logger.debug(f"Deployment {deployment_name} in namespace {namespace} ready")
-                    return True
-            else:
-                self.logger.debug(f"Deployment {deployment_name} in namespace {namespace} not ready, annotations mismatch...")
-            time.sleep(5)
+    def wait_for_deployments_to_be_ready(self, deployments: List[V1Deployment], timeout: int = 300) -> Dict[str, bool]:
+        """
+        Wait for many deployments of the same namespace to be ready, the deployments are waited at the same time.
 
-        self.logger.warning(f"Deployment {deployment_name} in namespace {namespace} not ready, timeout reached")
-        return False
+        Args:
+            deployments: The deployments to wait for (as returned by the patch that changed them), the new generation must be rolled out.
+            timeout: The maximum time to wait for each deployment to be ready, in seconds.
+
+        Returns:
+            Deployment name -> True if the deployment is ready within the timeout, False otherwise.
+        """
+        if len(deployments) == 0:
+            return {}
+        namespace = deployments[0].metadata.namespace
+        self.logger.debug(f"Waiting for {len(deployments)} deployments in namespace {namespace} to be ready...")
+        targets = [KubeReadinessTarget(KubeReadinessKind.DEPLOYMENT, deployment.metadata.name, timeout, min_generation=deployment.metadata.generation) for deployment in deployments]
+        results = self.wait_for_resources_to_be_ready(namespace, targets)
+        return {name: ready for (kind, name), ready in results.items()}
+
+    def wait_for_resources_to_be_ready(self, namespace: str, targets: List[KubeReadinessTarget]) -> Dict[Tuple[KubeReadinessKind, str], bool]:
+        """
+        Wait for deployments, stateful sets and jobs of a namespace to be ready, using a watch for each kind of object.
+
+        Args:
+            namespace: The namespace in which the objects reside.
+            targets: The objects to wait for, each one with its own timeout.
+
+        Returns:
+            (kind, name) -> True if the object is ready within its timeout, False otherwise.
+        """
+        return KubeReadinessWaiter(self.api_client).wait(namespace, targets)
 
     def apply_def_to_cluster(self, dict_to_be_applied: dict = None, yaml_file_to_be_applied: Path = None):
         """
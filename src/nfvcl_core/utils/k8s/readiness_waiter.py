@@ -0,0 +1,192 @@
+import threading
+import time
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Any, Callable
+
+import kubernetes
+import kubernetes.client
+from kubernetes import watch
+from kubernetes.client import ApiException
+
+from nfvcl_common.utils.log import create_logger
+
+
+class KubeReadinessKind(str, Enum):
+    DEPLOYMENT = "Deployment"
+    STATEFUL_SET = "StatefulSet"
+    DAEMON_SET = "DaemonSet"
+    JOB = "Job"
+
+
+class KubeReadinessTarget:
+    """
+    An object to wait for
+    """
+
+    def __init__(self, kind: KubeReadinessKind, name: str, timeout: float = 300, min_generation: Optional[int] = None):
+        """
+        Args:
+            kind: The kind of the object
+            name: The name of the object
+            timeout: Maximum number of seconds to wait for this object
+            min_generation: The object is ready only if its controller observed at least this generation (e.g. the one
+                returned by the patch that restarted it)
+        """
+        self.kind = kind
+        self.name = name
+        self.timeout = timeout
+        self.min_generation = min_generation
+
+
+def _deployment_ready(deployment, min_generation: Optional[int]) -> Optional[bool]:
+    status = deployment.status
+    if status is None or (min_generation is not None and (status.observed_generation or 0) < min_generation):
+        return None
+    replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 1
+    # The old pods of a rolling update must be gone
+    if (status.updated_replicas or 0) == replicas and (status.ready_replicas or 0) == replicas and (status.replicas or 0) == replicas:
+        return True
+    return None
+
+
+def _stateful_set_ready(stateful_set, min_generation: Optional[int]) -> Optional[bool]:
+    status = stateful_set.status
+    if status is None or (min_generation is not None and (status.observed_generation or 0) < min_generation):
+        return None
+    replicas = stateful_set.spec.replicas if stateful_set.spec.replicas is not None else 1
+    if (status.ready_replicas or 0) == replicas and (status.updated_replicas or 0) == replicas:
+        return True
+    return None
+
+
+def _daemon_set_ready(daemon_set, min_generation: Optional[int]) -> Optional[bool]:
+    status = daemon_set.status
+    if status is None or (min_generation is not None and (status.observed_generation or 0) < min_generation):
+        return None
+    desired = status.desired_number_scheduled or 0
+    # A DaemonSet just created by an operator may not have scheduled its pods yet
+    if desired > 0 and (status.number_ready or 0) == desired and (status.updated_number_scheduled or 0) == desired:
+        return True
+    return None
+
+
+def _job_ready(job, min_generation: Optional[int]) -> Optional[bool]:
+    status = job.status
+    if status is None:
+        return None
+    for condition in status.conditions or []:
+        if condition.type == "Failed" and condition.status == "True":
+            return False
+    completions = job.spec.completions if job.spec.completions is not None else 1
+    if (status.succeeded or 0) >= completions:
+        return True
+    return None
+
+
+class KubeReadinessWaiter:
+    """
+    Wait for many objects of a namespace to become ready using watch streams instead of polling.
+
+    A single watch is opened for each kind of object (Deployment, StatefulSet, DaemonSet, Job) in the namespace, every event
+    resolves the objects it refers to, so the wait ends as soon as the last object is ready.
+    """
+
+    # Seconds after which the server closes a watch, it is reopened if some objects are still pending
+    WATCH_TIMEOUT = 60
+
+    def __init__(self, api_client: kubernetes.client.ApiClient):
+        self.logger = create_logger("K8s readiness waiter")
+        self.api_client = api_client
+        apps_v1_api = kubernetes.client.AppsV1Api(api_client)
+        batch_v1_api = kubernetes.client.BatchV1Api(api_client)
+        self._list_functions: Dict[KubeReadinessKind, Callable] = {
+            KubeReadinessKind.DEPLOYMENT: apps_v1_api.list_namespaced_deployment,
+            KubeReadinessKind.STATEFUL_SET: apps_v1_api.list_namespaced_stateful_set,
+            KubeReadinessKind.DAEMON_SET: apps_v1_api.list_namespaced_daemon_set,
+            KubeReadinessKind.JOB: batch_v1_api.list_namespaced_job,
+        }
+        self._ready_functions: Dict[KubeReadinessKind, Callable[[Any, Optional[int]], Optional[bool]]] = {
+            KubeReadinessKind.DEPLOYMENT: _deployment_ready,
+            KubeReadinessKind.STATEFUL_SET: _stateful_set_ready,
+            KubeReadinessKind.DAEMON_SET: _daemon_set_ready,
+            KubeReadinessKind.JOB: _job_ready,
+        }
+
+    def wait(self, namespace: str, targets: List[KubeReadinessTarget]) -> Dict[Tuple[KubeReadinessKind, str], bool]:
+        """
+        Wait for the objects to be ready
+        Args:
+            namespace: The namespace of the objects
+            targets: The objects to wait for, each one with its own timeout
+
+        Returns:
+            (kind, name) -> True if the object became ready within its timeout, False otherwise (timeout or failed job)
+        """
+        start = time.monotonic()
+        condition = threading.Condition()
+        pending: Dict[Tuple[KubeReadinessKind, str], KubeReadinessTarget] = {(target.kind, target.name): target for target in targets}
+        results: Dict[Tuple[KubeReadinessKind, str], bool] = {}
+        watches: List[watch.Watch] = []
+
+        def resolve(key: Tuple[KubeReadinessKind, str], ready: bool):
+            with condition:
+                if key in pending:
+                    del pending[key]
+                    results[key] = ready
+                    condition.notify_all()
+
+        def watch_kind(kind: KubeReadinessKind):
+            while True:
+                with condition:
+                    names = {name for (pending_kind, name) in pending.keys() if pending_kind == kind}
+                    if not names:
+                        return
+                    stream_watch = watch.Watch()
+                    watches.append(stream_watch)
+                try:
+                    for event in stream_watch.stream(self._list_functions[kind], namespace=namespace, timeout_seconds=self.WATCH_TIMEOUT):
+                        obj = event["object"]
+                        key = (kind, obj.metadata.name)
+                        target = pending.get(key)
+                        if target is None:
+                            continue
+                        if event["type"] == "DELETED":
+                            continue
+                        ready = self._ready_functions[kind](obj, target.min_generation)
+                        if ready is not None:
+                            self.logger.debug(f"{kind.value} {obj.metadata.name} in namespace {namespace} {'ready' if ready else 'failed'}")
+                            resolve(key, ready)
+                        with condition:
+                            if not any(pending_kind == kind for (pending_kind, _) in pending.keys()):
+                                stream_watch.stop()
+                except ApiException as error:
+                    # 410 Gone: the resource version is too old, the watch is simply reopened
+                    if error.status != 410:
+                        self.logger.warning(f"Error watching {kind.value} in namespace {namespace}: {error}")
+                        time.sleep(1)
+                except Exception as error:
+                    self.logger.warning(f"Error watching {kind.value} in namespace {namespace}: {error}")
+                    time.sleep(1)
+
+        threads = []
+        for kind in {target.kind for target in targets}:
+            thread = threading.Thread(target=watch_kind, args=(kind,), daemon=True, name=f"Readiness-{namespace}-{kind.value}")
+            threads.append(thread)
+            thread.start()
+
+        with condition:
+            while pending:
+                now = time.monotonic()
+                for key, target in list(pending.items()):
+                    if now - start >= target.timeout:
+                        self.logger.warning(f"{key[0].value} {key[1]} in namespace {namespace} not ready, timeout reached")
+                        del pending[key]
+                        results[key] = False
+                if not pending:
+                    break
+                next_deadline = min(start + target.timeout for target in pending.values())
+                condition.wait(max(0.0, next_deadline - now))
+            for stream_watch in watches:
+                stream_watch.stop()
+
+        return results
@@ -3,9 +3,9 @@
 import copy
 from datetime import datetime
 from enum import Enum
-from typing import TypeVar, Optional, Generic, List, Dict, Any
+from typing import TypeVar, Optional, Generic, List, Dict, Any, Set
 
-from pydantic import Field, SerializeAsAny, field_validator, ValidationError
+from pydantic import Field, SerializeAsAny, field_validator, ValidationError, PrivateAttr
 
 from nfvcl_common.utils.blue_utils import get_class_from_path
 from nfvcl_common.base_model import NFVCLBaseModel
@@ -121,9 +121,27 @@ class BlueprintNGBaseModel(NFVCLBaseModel, Generic[StateTypeVar, CreateConfigTyp
 
     day_2_call_history: List[RegisteredBlueprintCall] = Field(default=[], description="The history of calls that have been made to the blueprint instance")
 
+    # Fields that have been reassigned since the last save, they are written without comparing them with the saved version
+    _assigned_fields: Set[str] = PrivateAttr(default_factory=set)
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**self.fix_types(["state", "provider_data", "create_config"], **kwargs))
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._assigned_fields.add(name)
+
+    def pop_assigned_fields(self) -> Set[str]:
+        """
+        Get the fields that have been reassigned since the last call and reset the tracking
+
+        Returns: The set of reassigned field names
+        """
+        assigned_fields = self._assigned_fields
+        self._assigned_fields = set()
+        return assigned_fields
+
     def fix_types(self, field_names: List[str], **kwargs: Any):
         """
         Pydantic deserialize as parent class, this override the value deserializing as the correct class
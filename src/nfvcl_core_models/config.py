@@ -13,6 +13,8 @@ class NFVCLParameters(NFVCLBaseModel):
     ip: str
     port: int
     workers: int = Field(default=4, description="The number of workers to handle the requests")
+    read_workers: int = Field(default=1, description="The number of additional workers reserved to read-only requests")
+    vim_parallel_operations: int = Field(default=4, description="The maximum number of VM operations (creation, configuration) executed in parallel on the same VIM")
     rescue_mode: Optional[bool] = Field(default=False, description="Enable the rescue mode (will not load blueprints)")
     authentication: bool = Field(default=False, description="Enable the authentication")
     mounted_folder: str = Field(default="mounted_folder", description="The folder in which files are generated to be exposed in API 'NFVCL_URL:NFVCL_PORT/files/'")
@@ -47,6 +49,7 @@ class MongoParameters(NFVCLBaseModel):
     db: str
     username: Optional[str] = None
     password: Optional[str] = None
+    write_behind_ms: int = Field(default=0, description="Window in milliseconds in which blueprint saves are coalesced before being written to the database, 0 to write them immediately")
 
     class Config:
         validate_assignment = True
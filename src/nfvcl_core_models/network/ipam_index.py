@@ -0,0 +1,299 @@
+import base64
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple, Iterator, Iterable, Dict, Any, Generic, TypeVar
+
+from pydantic_core import core_schema
+
+T = TypeVar("T")
+
+
+class IntervalSet:
+    """
+    Sorted set of disjoint closed integer intervals, adjacent intervals are merged.
+    Lookups are done with a binary search on the interval boundaries.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def size(self) -> int:
+        """
+        Returns: The number of integers contained in the set
+        """
+        return sum(end - start + 1 for start, end in self)
+
+    def find(self, value: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the interval containing the value
+        Args:
+            value: The value to look for
+
+        Returns:
+            The (start, end) interval containing the value, None if the value is not in the set
+        """
+        idx = bisect_right(self._starts, value) - 1
+        if idx >= 0 and self._ends[idx] >= value:
+            return self._starts[idx], self._ends[idx]
+        return None
+
+    def contains(self, value: int) -> bool:
+        return self.find(value) is not None
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """
+        Returns: True if at least one integer of the [start, end] interval is in the set
+        """
+        idx = bisect_left(self._ends, start)
+        return idx < len(self._starts) and self._starts[idx] <= end
+
+    def first(self) -> Optional[int]:
+        """
+        Returns: The lowest integer in the set, None if the set is empty
+        """
+        return self._starts[0] if len(self._starts) > 0 else None
+
+    def add(self, start: int, end: int):
+        """
+        Add the [start, end] interval to the set, merging it with the overlapping and adjacent ones
+        """
+        lo = bisect_left(self._ends, start - 1)
+        hi = bisect_right(self._starts, end + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def remove(self, start: int, end: int):
+        """
+        Remove the [start, end] interval from the set, splitting the partially overlapped intervals
+        """
+        lo = bisect_left(self._ends, start)
+        hi = bisect_right(self._starts, end)
+        if lo >= hi:
+            return
+        new_starts = []
+        new_ends = []
+        if self._starts[lo] < start:
+            new_starts.append(self._starts[lo])
+            new_ends.append(start - 1)
+        if self._ends[hi - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self._ends[hi - 1])
+        self._starts[lo:hi] = new_starts
+        self._ends[lo:hi] = new_ends
+
+    def gaps(self, start: int, end: int) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the sub-intervals of [start, end] that are NOT in the set, in ascending order
+        """
+        idx = bisect_left(self._ends, start)
+        cursor = start
+        while cursor <= end:
+            if idx < len(self._starts) and self._starts[idx] <= end:
+                if self._starts[idx] > cursor:
+                    yield cursor, self._starts[idx] - 1
+                cursor = max(cursor, self._ends[idx] + 1)
+                idx += 1
+            else:
+                yield cursor, end
+                break
+
+
+class IPUsageBitmap:
+    """
+    Usage flags of the addresses of a range, one bit per address.
+    The free addresses are also kept in an IntervalSet, so that the first free one is found without scanning the flags.
+
+    In pydantic models it is serialized to {"size": <number of addresses>, "bitmap": <base64 of the flags>}, the flag
+    of an address is the bit (offset % 8) of the byte (offset // 8). The legacy form, a list of booleans (one per
+    address), is still accepted as input.
+    """
+
+    def __init__(self, size: int = 0):
+        self._size = 0
+        self._bits = bytearray()
+        self._free = IntervalSet()
+        self.extend(size)
+
+    @classmethod
+    def from_bool_list(cls, values: List[bool]) -> "IPUsageBitmap":
+        bitmap = cls(len(values))
+        for offset, value in enumerate(values):
+            if value:
+                bitmap._bits[offset >> 3] |= 1 << (offset & 7)
+        bitmap._free = IntervalSet()
+        run_start = None
+        for offset, value in enumerate(values):
+            if not value and run_start is None:
+                run_start = offset
+            elif value and run_start is not None:
+                bitmap._free.add(run_start, offset - 1)
+                run_start = None
+        if run_start is not None:
+            bitmap._free.add(run_start, len(values) - 1)
+        return bitmap
+
+    def to_bool_list(self) -> List[bool]:
+        return [self.is_used(offset) for offset in range(self._size)]
+
+    @classmethod
+    def from_encoded(cls, encoded: Dict[str, Any]) -> "IPUsageBitmap":
+        size = int(encoded["size"])
+        bits = bytearray(base64.b64decode(encoded["bitmap"]))
+        if len(bits) != (size + 7) // 8:
+            raise ValueError(f"The usage bitmap has {len(bits)} bytes, {(size + 7) // 8} expected for {size} addresses")
+        bitmap = cls()
+        bitmap._size = size
+        bitmap._bits = bits
+        bitmap._free = IntervalSet()
+        run_start = None
+        for byte_idx, byte in enumerate(bits):
+            # Fast path for bytes with every address free or used
+            if byte == 0x00 and run_start is not None:
+                continue
+            if byte == 0xFF and run_start is None:
+                continue
+            for bit in range(8):
+                offset = (byte_idx << 3) + bit
+                if offset >= size:
+                    break
+                used = bool(byte & (1 << bit))
+                if not used and run_start is None:
+                    run_start = offset
+                elif used and run_start is not None:
+                    bitmap._free.add(run_start, offset - 1)
+                    run_start = None
+        if run_start is not None:
+            bitmap._free.add(run_start, size - 1)
+        return bitmap
+
+    def to_encoded(self) -> Dict[str, Any]:
+        return {"size": self._size, "bitmap": base64.b64encode(bytes(self._bits)).decode("ascii")}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __eq__(self, other):
+        if isinstance(other, IPUsageBitmap):
+            return self._size == other._size and self._bits == other._bits
+        if isinstance(other, list):
+            return self.to_bool_list() == other
+        return False
+
+    def __repr__(self) -> str:
+        return f"IPUsageBitmap(size={self._size}, used={self.used_count()})"
+
+    def is_used(self, offset: int) -> bool:
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def used_count(self) -> int:
+        return self._size - self._free.size()
+
+    def set_used(self, offset: int):
+        self._bits[offset >> 3] |= 1 << (offset & 7)
+        self._free.remove(offset, offset)
+
+    def set_free(self, offset: int):
+        self._bits[offset >> 3] &= ~(1 << (offset & 7)) & 0xFF
+        self._free.add(offset, offset)
+
+    def first_free(self) -> Optional[int]:
+        """
+        Returns: The offset of the first free address, None if every address is used
+        """
+        return self._free.first()
+
+    def extend(self, count: int):
+        """
+        Add free addresses at the end of the range
+        Args:
+            count: The number of addresses to add
+        """
+        if count <= 0:
+            return
+        self._bits.extend(bytearray((self._size + count + 7) // 8 - len(self._bits)))
+        self._free.add(self._size, self._size + count - 1)
+        self._size += count
+
+    @classmethod
+    def _validate(cls, value: Any) -> "IPUsageBitmap":
+        if isinstance(value, IPUsageBitmap):
+            return value
+        if isinstance(value, dict):
+            return cls.from_encoded(value)
+        if isinstance(value, list):
+            return cls.from_bool_list(value)
+        raise ValueError(f"Unable to decode the usage flags from type {type(value).__name__}")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler) -> core_schema.CoreSchema:
+        encoded_schema = core_schema.typed_dict_schema({
+            "size": core_schema.typed_dict_field(core_schema.int_schema()),
+            "bitmap": core_schema.typed_dict_field(core_schema.str_schema())
+        })
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            json_schema_input_schema=core_schema.union_schema([encoded_schema, core_schema.list_schema(core_schema.bool_schema())]),
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.to_encoded(), return_schema=encoded_schema)
+        )
+
+
+class RangeIndex(Generic[T]):
+    """
+    Index of non overlapping address ranges, by name and by contained address
+    """
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._items: List[T] = []
+        self._by_name: Dict[str, T] = {}
+        self.used = IntervalSet()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, start: int, end: int, name: str, item: T):
+        idx = bisect_right(self._starts, start)
+        self._starts.insert(idx, start)
+        self._ends.insert(idx, end)
+        self._items.insert(idx, item)
+        self._by_name[name] = item
+        self.used.add(start, end)
+
+    def remove(self, name: str) -> Optional[T]:
+        item = self._by_name.pop(name, None)
+        if item is None:
+            return None
+        idx = next(i for i, indexed in enumerate(self._items) if indexed is item)
+        start, end = self._starts[idx], self._ends[idx]
+        del self._starts[idx]
+        del self._ends[idx]
+        del self._items[idx]
+        self.used.remove(start, end)
+        # Ranges saved before overlaps were rejected may still cover part of the removed one
+        for other_start, other_end in zip(self._starts, self._ends):
+            if other_start > end:
+                break
+            if other_end >= start:
+                self.used.add(max(start, other_start), min(end, other_end))
+        return item
+
+    def get(self, name: str) -> Optional[T]:
+        return self._by_name.get(name)
+
+    def find_by_address(self, value: int) -> Optional[T]:
+        idx = bisect_right(self._starts, value) - 1
+        if idx >= 0 and self._ends[idx] >= value:
+            return self._items[idx]
+        return None
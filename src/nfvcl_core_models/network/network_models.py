@@ -2,9 +2,10 @@ from enum import Enum
 from ipaddress import AddressValueError, IPv4Address
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator, PositiveInt
+from pydantic import BaseModel, Field, field_validator, PositiveInt, PrivateAttr
 
 from nfvcl_common.base_model import NFVCLBaseModel
+from nfvcl_core_models.network.ipam_index import IPUsageBitmap, RangeIndex, IntervalSet
 from nfvcl_core_models.network.ipam_models import SerializableIPv4Address, SerializableIPv4Network
 from nfvcl_common.utils.util import generate_id
 
@@ -92,12 +93,12 @@ class IPv4ReservedRange(IPv4Pool):
     """
     owner: str = Field(description="The owner of the reserved range, could be the ID of a kubernetes cluster an ID of a Blueprint....")
     assigned_to: Optional[PoolAssignation] = Field(default=None, description="Type of assignation")
-    used: Optional[List[bool]] = Field(default=None)
+    used: Optional[IPUsageBitmap] = Field(default=None, description="Usage flag of every IP of the range")
 
     def __init__(self, **data):
         super().__init__(**data)
         if self.used is None:
-            self.used = [False] * (int(self.end) - int(self.start) + 1)
+            self.used = IPUsageBitmap(int(self.end) - int(self.start) + 1)
 
     def is_ip_in_range(self, ip: SerializableIPv4Address) -> bool:
         """
@@ -127,12 +128,11 @@ class IPv4ReservedRange(IPv4Pool):
         Returns:
             The IP address assigned, None if no IP is available
         """
-        for i in range(len(self.used)):  # Iterate over the used list and take the first free address
-            if not self.used[i]:
-                self.used[i] = True
-                return self.start + i
-
-        return None
+        offset = self.used.first_free()
+        if offset is None:
+            return None
+        self.used.set_used(offset)
+        return self.start + offset
 
     def release_ip_address(self, ip: SerializableIPv4Address) -> bool:
         """
@@ -143,8 +143,8 @@ class IPv4ReservedRange(IPv4Pool):
         Returns:
             True if the IP was released, False otherwise
         """
-        if self.start <= ip <= self.end and self.used[int(ip) - int(self.start)]:  # Check if the IP is in the range and used
-            self.used[int(ip) - int(self.start)] = False
+        if self.start <= ip <= self.end and self.used.is_used(int(ip) - int(self.start)):  # Check if the IP is in the range and used
+            self.used.set_free(int(ip) - int(self.start))
             return True
         return False
 
@@ -156,7 +156,7 @@ class IPv4ReservedRange(IPv4Pool):
         """
         if new_end <= self.end:
             raise ValueError("The end IP must be greater than the end IP of the pool")
-        self.used.extend([False] * (int(new_end) - int(self.end)))
+        self.used.extend(int(new_end) - int(self.end))
         self.end = new_end
 
 
@@ -173,6 +173,10 @@ class NetworkModel(BaseModel):
     reserved_ranges: List[IPv4ReservedRange] = Field(default=[], description='The list of ranges that have been reserved or assigned. They are not available for assignation because they are already in use or they have been manually added there')
     dns_nameservers: List[SerializableIPv4Address] = Field(default=[], description='List of DNS server IPs available in this network')
 
+    # Index of the reserved ranges, rebuilt when the reserved_ranges list is replaced or modified outside this class
+    _reserved_index: Optional[RangeIndex[IPv4ReservedRange]] = PrivateAttr(default=None)
+    _reserved_index_source: Optional[List[IPv4ReservedRange]] = PrivateAttr(default=None)
+
     @classmethod
     def build_network_model(cls, name: str, type: NetworkTypeEnum, cidr: SerializableIPv4Network):
         return NetworkModel(name=name, type=type, cidr=cidr)
@@ -235,6 +239,18 @@ class NetworkModel(BaseModel):
         except AddressValueError:
             return None
 
+    def _get_reserved_index(self) -> RangeIndex[IPv4ReservedRange]:
+        """
+        Get the index of the reserved ranges, building it if it is missing or outdated
+        """
+        if self._reserved_index is None or self._reserved_index_source is not self.reserved_ranges or len(self._reserved_index) != len(self.reserved_ranges):
+            index = RangeIndex[IPv4ReservedRange]()
+            for reserved_range in self.reserved_ranges:
+                index.add(int(reserved_range.start), int(reserved_range.end), reserved_range.name, reserved_range)
+            self._reserved_index = index
+            self._reserved_index_source = self.reserved_ranges
+        return self._reserved_index
+
     def add_reserved_range(self, reserved_range: IPv4ReservedRange):
         """
         Add a reserved range to the network. This is useful if you want to exclude a range from automatic assignation.
@@ -246,11 +262,13 @@ class NetworkModel(BaseModel):
 
         Raises: ValueError if the range is already present in the network
         """
-        if reserved_range in self.reserved_ranges:
+        index = self._get_reserved_index()
+        if index.used.overlaps(int(reserved_range.start), int(reserved_range.end)):
             msg_err = ("Reserved range >{}< is already present in the topology. Or have overlapped IPs with an existing"
                        "range. See IPv4ReservedRange for more info.").format(reserved_range.model_dump())
             raise ValueError(msg_err)
         self.reserved_ranges.append(reserved_range)
+        index.add(int(reserved_range.start), int(reserved_range.end), reserved_range.name, reserved_range)
         return reserved_range
 
     def reserve_range(self, owner: str, length: int, assigned_to: str) -> List[IPv4ReservedRange]:
@@ -267,30 +285,29 @@ class NetworkModel(BaseModel):
         Raises: ValueError if the requested range is too long for the network. There are not enough free IPs.
         """
         total_ips = sum([pool.range_length() for pool in self.allocation_pool])
-        available_ips = []
         if total_ips < length:
             raise ValueError("The requested range is too long for the network. There are not enough free IPs in allocation_pools.")
-        # Building a list of NOT reserved ips.
+        index = self._get_reserved_index()
+        # Building the list of NOT reserved intervals, adjacent intervals are merged
+        available_intervals = IntervalSet()
+        missing = length
         for pool in self.allocation_pool:
-            if len(available_ips) >= length:
+            if missing <= 0:
                 break
-            for ip in pool.ip_list():
-                if len(available_ips) >= length:
+            for gap_start, gap_end in index.used.gaps(int(pool.start), int(pool.end)):
+                gap_end = min(gap_end, gap_start + missing - 1)
+                available_intervals.add(gap_start, gap_end)
+                missing -= gap_end - gap_start + 1
+                if missing <= 0:
                     break
-                if not self.is_ip_reserved(ip):
-                    available_ips.append(ip)
-        if len(available_ips) < length:
+        if missing > 0:
             raise ValueError("The requested range is too long for the network. There are not enough free IPs in allocation_pools.")
         # Start building the reserved range
         reserved_ranges = []
-        for ip in available_ips:
-            if len(reserved_ranges) == 0:
-                reserved_ranges.append(IPv4ReservedRange(start=ip, end=ip, owner=owner, assigned_to=PoolAssignation.K8S_CLUSTER))
-            else:
-                if reserved_ranges[-1].end + 1 == ip:
-                    reserved_ranges[-1].extend_range_end(ip)
-                else:
-                    reserved_ranges.append(IPv4ReservedRange(start=ip, end=ip, owner=owner, assigned_to=PoolAssignation.K8S_CLUSTER))
+        for start, end in available_intervals:
+            reserved_range = IPv4ReservedRange(start=SerializableIPv4Address(start), end=SerializableIPv4Address(end), owner=owner, assigned_to=PoolAssignation.K8S_CLUSTER)
+            index.add(start, end, reserved_range.name, reserved_range)
+            reserved_ranges.append(reserved_range)
         self.reserved_ranges.extend(reserved_ranges)
         return reserved_ranges
 
@@ -303,10 +320,7 @@ class NetworkModel(BaseModel):
         Returns:
             True if the IP is reserved, False otherwise
         """
-        for reserved_range in self.reserved_ranges:
-            if reserved_range.is_ip_in_range(ip):
-                return True
-        return False
+        return self._get_reserved_index().used.contains(int(ip))
 
     def release_range(self, reserved_range_name: str) -> IPv4ReservedRange:
         """
@@ -317,11 +331,12 @@ class NetworkModel(BaseModel):
         Returns:
             The released range.
         """
-        # Looking for the reservation to be removed in every reserved range.
-        for reserved_range in self.reserved_ranges:
-            if reserved_range.name == reserved_range_name:
-                self.reserved_ranges.remove(reserved_range)
-                return reserved_range
+        reserved_range = self._get_reserved_index().remove(reserved_range_name)
+        if reserved_range is not None:
+            # Removed by identity, list.remove() would use __eq__ and could pick an overlapping range
+            idx = next(i for i, element in enumerate(self.reserved_ranges) if element is reserved_range)
+            del self.reserved_ranges[idx]
+            return reserved_range
 
         raise ValueError(f"Reserved range >{reserved_range_name}< is not present in the network.")
 
@@ -331,9 +346,9 @@ class NetworkModel(BaseModel):
         Args:
             reserved_range_name: The name of the reserved range to be retrieved
         """
-        for reserved_range in self.reserved_ranges:
-            if reserved_range.name == reserved_range_name:
-                return reserved_range
+        reserved_range = self._get_reserved_index().get(reserved_range_name)
+        if reserved_range is not None:
+            return reserved_range
         raise ValueError(f"Reserved range >{reserved_range_name}< is not present in the network.")
 
     def get_reserved_range_by_ip(self, reserved_ip: SerializableIPv4Address) -> IPv4ReservedRange:
@@ -342,9 +357,9 @@ class NetworkModel(BaseModel):
         Args:
             reserved_ip: The IP address part of the reserved range
         """
-        for reserved_range in self.reserved_ranges:
-            if reserved_range.is_ip_in_range(ip=reserved_ip):
-                return reserved_range
+        reserved_range = self._get_reserved_index().find_by_address(int(reserved_ip))
+        if reserved_range is not None:
+            return reserved_range
         raise ValueError(f"Reserved range containing IP >{reserved_ip}< is not present in the network.")
 
 class RouterPortModel(BaseModel):
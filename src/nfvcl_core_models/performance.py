@@ -6,6 +6,11 @@ from pydantic import Field
 
 from nfvcl_common.base_model import NFVCLBaseModel
 
+# Number of operations kept in the performance document of a blueprint, older ones are moved to the history collection
+MAX_PERFORMANCE_OPERATIONS = 100
+# The history collection is capped, the oldest operations are discarded when this size (in bytes) is reached
+PERFORMANCE_HISTORY_SIZE = 256 * 1024 * 1024
+
 class BlueprintPerformanceType(str, Enum):
     DAY0 = 'day0'
     DAY2 = 'day2'
@@ -29,6 +34,9 @@ class BlueprintPerformanceOperation(NFVCLBaseModel):
     duration: Optional[int] = Field(default=None)
     provider_calls: List[BlueprintPerformanceProviderCall] = Field(default_factory=list)
 
+class BlueprintPerformanceHistoryOperation(BlueprintPerformanceOperation):
+    blueprint_id: str = Field()
+
 class BlueprintPerformance(NFVCLBaseModel):
     blueprint_id: str = Field()
     blueprint_type: str = Field()
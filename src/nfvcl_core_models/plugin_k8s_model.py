@@ -99,6 +99,37 @@ class K8sPluginsToInstall(NFVCLBaseModel):
     skip_plug_checks: bool = Field(default=False, description="If True do not check for plugin compatibility")
 
 
+class K8sPluginInstallStatus(str, Enum):
+    INSTALLED = 'installed'
+    ALREADY_INSTALLED = 'already_installed'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+    UNSUPPORTED = 'unsupported'
+
+
+class K8sPluginInstallResult(NFVCLBaseModel):
+    """
+    Result of the installation of a single plugin
+    """
+    name: K8sPluginName = Field(description="Plugin name")
+    status: K8sPluginInstallStatus = Field(description="Outcome of the installation")
+    requires: List[K8sPluginName] = Field(default=[], description="The plugins that have been installed before this one")
+    started_at: Optional[float] = Field(default=None, description="Seconds from the beginning of the installation when this plugin has been started")
+    duration: Optional[float] = Field(default=None, description="Seconds spent installing the plugin and waiting for it to be ready")
+    error: Optional[str] = Field(default=None, description="The error that made the installation fail, or the reason why it has been skipped")
+
+
+class K8sPluginInstallReport(NFVCLBaseModel):
+    """
+    Report of the installation of a list of plugins
+    """
+    plugins: List[K8sPluginInstallResult] = Field(default=[], description="The result of every requested plugin")
+    duration: float = Field(default=0, description="Seconds spent installing all the plugins")
+
+    def failed(self) -> List[K8sPluginInstallResult]:
+        return [plugin for plugin in self.plugins if plugin.status in (K8sPluginInstallStatus.FAILED, K8sPluginInstallStatus.SKIPPED)]
+
+
 class K8sPluginToUninstall(NFVCLBaseModel):
     namespace: str = Field()
 
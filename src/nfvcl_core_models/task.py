@@ -1,25 +1,45 @@
 import uuid
 from enum import Enum
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Dict
 
 from pydantic import Field
 
 from nfvcl_common.base_model import NFVCLBaseModel
 
 
+class NFVCLTaskLane(str, Enum):
+    """
+    Scheduling lanes of the TaskManager, listed in order of priority.
+    """
+    READ = "read"
+    DAY2 = "day2"
+    DAY0 = "day0"
+
+
 class NFVCLTask:
-    def __init__(self, callable_function: Callable, callback_function: Optional[Callable], *args, **kwargs):
+    def __init__(self, callable_function: Callable, callback_function: Optional[Callable], *args, lane: NFVCLTaskLane = NFVCLTaskLane.DAY2, serialization_key: Optional[str] = None, **kwargs):
+        """
+        Args:
+            callable_function: The function to be executed by a worker
+            callback_function: The function to be called with the NFVCLTaskResult once the task is completed
+            lane: The scheduling lane of the task
+            serialization_key: Tasks sharing the same key (e.g. the blueprint ID) are never executed concurrently and keep their submission order
+        """
         self.task_id = str(uuid.uuid4())
         self.callable_function = callable_function
         self.args = args
         self.kwargs = kwargs
         self.callback_function = callback_function
+        self.lane = lane
+        self.serialization_key = serialization_key
+        self.enqueue_time: Optional[float] = None
+        self.start_time: Optional[float] = None
 
     def __str__(self):
         """
         String representation of the task. Used when printing the task object.
         """
-        return f"Task ID: {self.task_id}, Callable: {self.callable_function}, Args: {self.args}, Kwargs: {self.kwargs}, Callback: {self.callback_function}"
+        return f"Task ID: {self.task_id}, Lane: {self.lane.value}, Key: {self.serialization_key}, Callable: {self.callable_function}, Args: {self.args}, Kwargs: {self.kwargs}, Callback: {self.callback_function}"
 
 class NFVCLTaskResult:
     def __init__(self, task_id: str, result: Any, error = False, exception: Exception = None):
@@ -32,6 +52,7 @@ class NFVCLTaskResult:
         return f"Result: {self.result}, Error: {self.error}, Exception: {self.exception}"
 
 class NFVCLTaskStatusType(str, Enum):
+    QUEUED = "queued"
     RUNNING = "running"
     DONE = "done"
 
@@ -41,3 +62,20 @@ class NFVCLTaskStatus(NFVCLBaseModel):
     result: Optional[Any] = Field(default=None)
     error: bool = Field(default=False)
     exception: Optional[str] = Field(default=None)
+
+
+class NFVCLTaskLaneMetrics(NFVCLBaseModel):
+    queued: int = Field(default=0, description="Number of tasks waiting in the lane")
+    running: int = Field(default=0, description="Number of tasks of the lane currently executed by a worker")
+    started: int = Field(default=0, description="Number of tasks of the lane started since NFVCL boot")
+    wait_time_avg_ms: float = Field(default=0.0, description="Average time spent by a task in the queue before being started")
+    wait_time_max_ms: float = Field(default=0.0, description="Maximum time spent by a task in the queue before being started")
+    wait_time_last_ms: float = Field(default=0.0, description="Time spent in the queue by the last started task")
+
+
+class NFVCLTaskSchedulerMetrics(NFVCLBaseModel):
+    worker_count: int = Field()
+    read_worker_count: int = Field()
+    busy_workers: int = Field(default=0)
+    blocked_keys: int = Field(default=0, description="Number of serialization keys (blueprints) with a task currently running")
+    lanes: Dict[NFVCLTaskLane, NFVCLTaskLaneMetrics] = Field(default_factory=dict)
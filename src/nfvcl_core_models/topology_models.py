@@ -1,7 +1,7 @@
 from http import HTTPStatus
-from typing import List, Optional
+from typing import List, Optional, Callable, Any, Iterable, Hashable, Dict
 
-from pydantic import HttpUrl, Field
+from pydantic import HttpUrl, Field, PrivateAttr
 
 from nfvcl_common.base_model import NFVCLBaseModel
 from nfvcl_core_models.custom_types import NFVCLCoreException
@@ -22,6 +22,51 @@ class TopoK8SNotFoundException(Exception):
     pass
 
 
+class TopologyIndex:
+    """
+    Position of the elements of a topology list by key (name, area...), when more elements have the same key the
+    first one is indexed. The index is rebuilt when the list is replaced, resized or explicitly invalidated; lookups are
+    verified against the list so that changes made to the elements from outside the model are detected.
+    """
+
+    def __init__(self, key_function: Callable[[Any], Iterable[Hashable]]):
+        self._key_function = key_function
+        self._source: Optional[List[Any]] = None
+        self._length = -1
+        self._positions: Dict[Hashable, int] = {}
+
+    def invalidate(self):
+        self._source = None
+
+    def _build(self, items: List[Any]) -> Dict[Hashable, int]:
+        positions = {}
+        for position, item in enumerate(items):
+            for key in self._key_function(item):
+                positions.setdefault(key, position)
+        self._positions = positions
+        self._source = items
+        self._length = len(items)
+        return positions
+
+    def find(self, items: List[Any], key: Hashable) -> int:
+        """
+        Find the position of the first element having the key
+        Args:
+            items: The indexed list
+            key: The key to look for
+
+        Returns:
+            The position of the element in the list, -1 if not found
+        """
+        if self._source is items and self._length == len(items):
+            position = self._positions.get(key, -1)
+            # The element is checked, the index could be shared between read-only copies of the topology
+            if 0 <= position < len(items) and key in self._key_function(items[position]):
+                return position
+        # Outdated or not found, rebuild to be sure
+        return self._build(items).get(key, -1)
+
+
 class TopologyModel(NFVCLBaseModel):
     id: Optional[str] = Field(default='topology')
     callback: Optional[HttpUrl] = Field(default=None)
@@ -36,6 +81,26 @@ class TopologyModel(NFVCLBaseModel):
     grafana_srv: List[GrafanaServerModel] = Field(default_factory=list)
     loki_srv: List[LokiServerModel] = Field(default_factory=list)
 
+    _indexes: Dict[str, TopologyIndex] = PrivateAttr(default_factory=lambda: {
+        "vims": TopologyIndex(lambda item: (item.name,)),
+        "vims_area": TopologyIndex(lambda item: item.areas),
+        "kubernetes": TopologyIndex(lambda item: (item.name,)),
+        "kubernetes_area": TopologyIndex(lambda item: item.areas),
+        "networks": TopologyIndex(lambda item: (item.name,)),
+        "routers": TopologyIndex(lambda item: (item.name,)),
+        "pdus": TopologyIndex(lambda item: (item.name,)),
+        "prometheus_srv": TopologyIndex(lambda item: (item.id,)),
+        "grafana_srv": TopologyIndex(lambda item: (item.id,)),
+        "loki_srv": TopologyIndex(lambda item: (item.id,)),
+    })
+
+    def _invalidate_indexes(self, *names: str):
+        """
+        Invalidate the indexes of the given lists, they are rebuilt on the next lookup
+        """
+        for name in names:
+            self._indexes[name].invalidate()
+
     def add_prometheus_srv(self, prom_srv: PrometheusServerModel):
         """
         Add a prometheus server instance to the topology
@@ -71,6 +136,7 @@ class TopologyModel(NFVCLBaseModel):
         """
         index = self.find_prom_srv_index(prom_server.id)
         self.prometheus_srv[index] = prom_server
+        self._invalidate_indexes("prometheus_srv")
         return prom_server
 
     def add_grafana_srv(self, grafana_srv: GrafanaServerModel):
@@ -109,6 +175,7 @@ class TopologyModel(NFVCLBaseModel):
         """
         index = self.find_grafana_srv_index(grafana_server.id)
         self.grafana_srv[index] = grafana_server
+        self._invalidate_indexes("grafana_srv")
         return grafana_server
 
     def add_loki_srv(self, loki_srv: LokiServerModel):
@@ -139,6 +206,7 @@ class TopologyModel(NFVCLBaseModel):
         """
         index = self.find_loki_srv_index(loki_server.id)
         self.loki_srv[index] = loki_server
+        self._invalidate_indexes("loki_srv")
         return loki_server
 
     def get_monitoring_metrics_config(self, cluster_id: str) -> K8sMonitoring | None:
@@ -201,10 +269,10 @@ class TopologyModel(NFVCLBaseModel):
 
         Returns: The k8s cluster instance
         """
-        found_cluster = next((cluster for cluster in self.kubernetes if cluster.name == cluster_id), None)
-        if found_cluster is None:
+        index = self._indexes["kubernetes"].find(self.kubernetes, cluster_id)
+        if index < 0:
             raise NFVCLCoreException(f"K8s cluster with name {cluster_id} not found in the topology", http_equivalent_code=HTTPStatus.NOT_FOUND)
-        return found_cluster
+        return self.kubernetes[index]
 
     def add_k8s_cluster(self, k8s_cluster: TopologyK8sModel):
         """
@@ -245,6 +313,7 @@ class TopologyModel(NFVCLBaseModel):
 
         # Update in the topology information
         self.kubernetes[k8s_index] = k8s_cluster
+        self._invalidate_indexes("kubernetes", "kubernetes_area")
 
         return k8s_cluster
 
@@ -285,6 +354,7 @@ class TopologyModel(NFVCLBaseModel):
 
         # Update in the topology information
         self.pdus[pdu_index] = pdu
+        self._invalidate_indexes("pdus")
 
         return pdu
 
@@ -342,6 +412,7 @@ class TopologyModel(NFVCLBaseModel):
         """
         vim_index = self.find_vim_index(vim.name)
         self.vims[vim_index] = vim
+        self._invalidate_indexes("vims", "vims_area")
         return vim
 
     def get_vim(self, vim_name) -> VimModel:
@@ -361,12 +432,12 @@ class TopologyModel(NFVCLBaseModel):
 
         Returns: A VIM that have the required area.
         """
-        vim = next((item for item in self.vims if area_id in item.areas), None)
-        if vim is None:
+        vim_index = self._indexes["vims_area"].find(self.vims, area_id)
+        if vim_index < 0:
             msg_err = "The VIM of area ->{}<- was not found in the topology.".format(area_id)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.CONFLICT)
 
-        return vim
+        return self.vims[vim_index]
 
     def get_vim_list_by_area(self, area_id: int) -> List[VimModel]:
         """
@@ -436,6 +507,7 @@ class TopologyModel(NFVCLBaseModel):
         """
         net_index = self.find_net_index(network.name)
         self.networks[net_index] = network
+        self._invalidate_indexes("networks")
         return network
 
     def get_network(self, network_name) -> NetworkModel:
@@ -492,6 +564,7 @@ class TopologyModel(NFVCLBaseModel):
         """
         router_idx = self.find_router_index(router.name)
         self.routers[router_idx] = router
+        self._invalidate_indexes("routers")
         return router
 
     def get_router(self, router_name) -> RouterModel:
@@ -522,10 +595,8 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the prom server in the list
         """
-        prom_svr_to_search = PrometheusServerModel(id=prom_srv_id)
-        try:
-            prom_svr_index = self.prometheus_srv.index(prom_svr_to_search)
-        except ValueError:
+        prom_svr_index = self._indexes["prometheus_srv"].find(self.prometheus_srv, prom_srv_id)
+        if prom_svr_index < 0:
             msg_err = "The prometheus server ->{}<- has not been found".format(prom_srv_id)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
 
@@ -553,10 +624,8 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the Grafana server in the list
         """
-        grafana_srv_to_search = GrafanaServerModel(id=grafana_srv_id)
-        try:
-            grafana_srv_index = self.grafana_srv.index(grafana_srv_to_search)
-        except ValueError:
+        grafana_srv_index = self._indexes["grafana_srv"].find(self.grafana_srv, grafana_srv_id)
+        if grafana_srv_index < 0:
             msg_err = "The Grafana server ->{}<- has not been found".format(grafana_srv_id)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
 
@@ -584,10 +653,8 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the loki server in the list
         """
-        loki_svr_to_search = LokiServerModel(id=loki_srv_id)
-        try:
-            loki_svr_index = self.loki_srv.index(loki_svr_to_search)
-        except ValueError:
+        loki_svr_index = self._indexes["loki_srv"].find(self.loki_srv, loki_srv_id)
+        if loki_svr_index < 0:
             msg_err = "The Loki server ->{}<- has not been found".format(loki_srv_id)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
 
@@ -637,7 +704,7 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the k8s cluster in the list
         """
-        k8s_cluster_index = next((index for index, item in enumerate(self.kubernetes) if item.name == cluster_name), -1)
+        k8s_cluster_index = self._indexes["kubernetes"].find(self.kubernetes, cluster_name)
         if k8s_cluster_index < 0:
             msg_err = "The K8s cluster ->{}<- was not found in the topology.".format(cluster_name)
             raise TopoK8SNotFoundException(msg_err)
@@ -653,7 +720,7 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the k8s cluster in the list
         """
-        k8s_cluster_index = next((index for index, item in enumerate(self.kubernetes) if area_id in item.areas), -1)
+        k8s_cluster_index = self._indexes["kubernetes_area"].find(self.kubernetes, area_id)
         if k8s_cluster_index < 0:
             msg_err = f"No K8S cluster has been found for area {area_id}"
             raise TopoK8SNotFoundException(msg_err)
@@ -669,7 +736,7 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the net in the list
         """
-        net_index = next((index for index, item in enumerate(self.networks) if item.name == net_name), -1)
+        net_index = self._indexes["networks"].find(self.networks, net_name)
         if net_index < 0:
             msg_err = "The network ->{}<- was not found in the topology.".format(net_name)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
@@ -685,7 +752,7 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the vim in the list
         """
-        vim_index = next((index for index, item in enumerate(self.vims) if item.name == vim_name), -1)
+        vim_index = self._indexes["vims"].find(self.vims, vim_name)
         if vim_index < 0:
             msg_err = "The VIM ->{}<- was not found in the topology.".format(vim_name)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
@@ -701,7 +768,7 @@ class TopologyModel(NFVCLBaseModel):
         Returns:
             The position of the router in the list
         """
-        router_index = next((index for index, item in enumerate(self.vims) if item.name == router_name), -1)
+        router_index = self._indexes["routers"].find(self.routers, router_name)
         if router_index < 0:
             msg_err = "The router ->{}<- was not found in the topology.".format(router_name)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
@@ -720,9 +787,9 @@ class TopologyModel(NFVCLBaseModel):
         Raises:
             ValueError if the PDU is not found in the model
         """
-        pdu_index = next((index for index, item in enumerate(self.pdus) if item.name == pdu_name), -1)
+        pdu_index = self._indexes["pdus"].find(self.pdus, pdu_name)
         if pdu_index < 0:
-            msg_err = "The PDU ->{}<- was not found in the topology.".format(pdu_index)
+            msg_err = "The PDU ->{}<- was not found in the topology.".format(pdu_name)
             raise NFVCLCoreException(msg_err, http_equivalent_code=HTTPStatus.NOT_FOUND)
 
         return pdu_index
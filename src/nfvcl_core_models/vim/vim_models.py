@@ -202,3 +202,11 @@ class VimModel(NFVCLBaseModel):
             logger.error(msg_err)
         else:
             return router_name
+
+
+class ProxmoxVmidReservations(NFVCLBaseModel):
+    """
+    VMIDs reserved by NFVCL on a Proxmox VIM for VMs that are being created
+    """
+    vim_name: str
+    vmids: List[int] = Field(default_factory=list)
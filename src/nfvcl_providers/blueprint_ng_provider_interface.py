@@ -1,4 +1,5 @@
 import abc
+import threading
 from typing import Callable, Optional
 
 from nfvcl_common.utils.log import create_logger
@@ -19,6 +20,9 @@ class BlueprintNGProviderInterface(abc.ABC):
         self.area = area
         self.blueprint_id = blueprint_id
         self.save_to_db = persistence_function
+        # Held while changing the provider data or the blueprint resources, the persistence function dumps them holding
+        # the same lock. Replaced by the ProvidersAggregator when the provider is used by multiple threads.
+        self.data_lock: threading.RLock = threading.RLock()
         self.logger = create_logger(self.__class__.__name__, blueprintid=self.blueprint_id)
         self.logger.debug(f"Creating {self.__class__.__name__} for area {self.area}")
         self.init()
@@ -1,14 +1,11 @@
-import asyncio
 from copy import deepcopy
 from typing import Dict, Any, List, Optional
 
 import pyhelm3.errors
 import yaml
-from kubernetes.client import V1PodList
 from pydantic import Field
-from pyhelm3 import Client, ReleaseRevisionStatus
+from pyhelm3 import ReleaseRevisionStatus
 
-from nfvcl_core.utils.k8s.kube_api_utils_class import KubeApiUtils
 from nfvcl_core_models.network.ipam_models import SerializableIPv4Address
 from nfvcl_core_models.network.network_models import MultusInterface
 from nfvcl_providers.blueprint_ng_provider_interface import BlueprintNGProviderData
@@ -16,8 +13,8 @@ from nfvcl_providers.kubernetes.k8s_provider_interface import K8SProviderInterfa
 from nfvcl_core_models.resources import HelmChartResource
 from nfvcl_core_models.topology_k8s_model import TopologyK8sModel
 from nfvcl_common.utils.file_utils import create_tmp_file, create_tmp_folder
-from nfvcl_core.utils.k8s.k8s_utils import get_k8s_config_from_file_content
-from nfvcl_core.utils.k8s.helm_plugin_manager import build_helm_client_from_credential_file_content
+from nfvcl_core.utils.k8s.k8s_client_cache import k8s_client_cache
+from nfvcl_core.utils.k8s.helm_executor import HelmExecutor, get_helm_executor
 
 
 class K8SProviderDataNative(BlueprintNGProviderData):
@@ -29,45 +26,35 @@ class K8SProviderNativeException(K8SProviderException):
     pass
 
 
-helm_client_dict: Dict[int, Client] = {}
-
 class K8SProviderNative(K8SProviderInterface):
     def init(self):
         self.HELM_TMP_FOLDER_PATH = create_tmp_folder('helm')
         self.data: K8SProviderDataNative = K8SProviderDataNative()
         self.k8s_cluster: TopologyK8sModel = self.topology_manager.get_k8s_cluster_by_area(self.area)
-        self.kube_utils = KubeApiUtils(get_k8s_config_from_file_content(self.k8s_cluster.credentials))
-        self.helm_client = self.get_helm_client_by_area(self.area)
+        self.kube_utils = k8s_client_cache.get_kube_api_utils(self.k8s_cluster.credentials, self.k8s_cluster.name)
+        self.helm_executor = self.get_helm_executor_by_area(self.area)
 
-    def get_helm_client_by_area(self, area: int) -> Client:
+    def get_helm_executor_by_area(self, area: int) -> HelmExecutor:
         """
-        Returns the helm client for the K8S cluster in the given area
+        Returns the helm executor for the K8S cluster in the given area, it is shared with every other user of the cluster
         Args:
-            area: The area in which the client is built
+            area: The area of the K8S cluster
 
         Returns:
-            The client for the K8S cluster in the given area
+            The executor for the K8S cluster in the given area
         """
-        global helm_client_dict
-
         k8s_cluster: TopologyK8sModel = self.topology_manager.get_k8s_cluster_by_area(area)
-        k8s_credential_file_name = f"k8s_credential_{k8s_cluster.name}"
-        k8s_credential_file_path = create_tmp_file(k8s_credential_file_name, "helm", True)
-        # If helm client does not exist for an area or the cluster for the area have changed without restart of NFVCL
-        if area not in helm_client_dict or not (helm_client_dict[area]._command._kubeconfig == k8s_credential_file_path):
-            k8s_cluster: TopologyK8sModel = self.topology_manager.get_k8s_cluster_by_area(area)
-            helm_client_dict[area] = build_helm_client_from_credential_file_content(k8s_cluster.credentials, k8s_credential_file_path)
-
-        return helm_client_dict[area]
+        # A new executor is created if the credentials of the cluster changed without restart of NFVCL
+        return get_helm_executor(k8s_cluster.credentials, k8s_cluster.name)
 
     def install_helm_chart(self, helm_chart_resource: HelmChartResource, values: Dict[str, Any]):
         self.logger.info(f"Installing Helm chart {helm_chart_resource.name}")
 
-        chart = asyncio.run(self.helm_client.get_chart(
+        chart = self.helm_executor.get_chart(
             helm_chart_resource.get_chart_converted(),
             repo=helm_chart_resource.repo,
             version=helm_chart_resource.version
-        ))
+        )
 
         ns_labels = {
             "nfvcl-webhook-enabled": "true",
@@ -81,7 +68,7 @@ class K8SProviderNative(K8SProviderInterface):
 
         # Install or upgrade a release, if fails print debug cmd to reproduce locally the error with debug option. Pyhelm3 does not support debug option.
         try:
-            revision = asyncio.run(self.helm_client.install_or_upgrade_release(
+            revision = self.helm_executor.install_or_upgrade_release(
                 helm_chart_resource.name.lower(),
                 chart,
                 values,
@@ -89,7 +76,7 @@ class K8SProviderNative(K8SProviderInterface):
                 atomic=True,
                 wait=True,
                 create_namespace=False
-            ))
+            )
         except pyhelm3.errors.Error as helmError:
             self.logger.error(f"Helm chart deployment failed. You can debug installation in this way from nfvcl folder:\n{self._generate_debug_cmd_cli(helm_chart_resource, values, chart.metadata.version)}")
             raise helmError
@@ -106,19 +93,13 @@ class K8SProviderNative(K8SProviderInterface):
             raise K8SProviderNativeException(f"The helm chart '{helm_chart_resource.name}' is not in the DEPLOYED state")
 
         # Adding this blueprint to the deployed list on the cluster
+        self.topology_manager.add_k8s_deployed_blueprint(self.k8s_cluster.name, self.blueprint_id)
 
-        cluster = self.topology_manager.get_k8s_cluster_by_area(self.area)
-        cluster.deployed_blueprints.append(self.blueprint_id)
-        self.topology_manager.update_kubernetes(cluster)
-
-        services = self.kube_utils.get_services(namespace=helm_chart_resource.namespace.lower())
-        deployments = self.kube_utils.get_deployments(namespace=helm_chart_resource.namespace.lower(), detailed=True)
-
-        deployments_pods: Dict[str, V1PodList] = {}
-
-        for deployment in deployments.items:
-            deployment_pods = self.kube_utils.get_pods_for_namespace(namespace=helm_chart_resource.namespace.lower(), label_selector=','.join([f'{k}={v}' for k, v in deployment.spec.selector.match_labels.items()]))
-            deployments_pods[deployment.metadata.name] = deployment_pods
+        # One list per resource kind, the pods are matched to the deployments locally
+        namespace = helm_chart_resource.namespace.lower()
+        services = self.kube_utils.get_services(namespace=namespace)
+        deployments = self.kube_utils.get_deployments(namespace=namespace, detailed=True)
+        deployments_pods = self.kube_utils.get_pods_by_deployment(namespace, deployments)
 
         helm_chart_resource.set_services_from_k8s_api(services)
         helm_chart_resource.set_deployments_from_k8s_api(deployments, deployments_pods)
@@ -140,43 +121,37 @@ class K8SProviderNative(K8SProviderInterface):
         values_path = self.HELM_TMP_FOLDER_PATH / f"{helm_chart_resource.namespace.lower()}_{helm_chart_resource.name}.yaml"
         yaml_content = yaml.dump(values)
         values_path.write_text(yaml_content)
-        k8s_credential_path = self.HELM_TMP_FOLDER_PATH / f"k8s_credential_{self.k8s_cluster.name}"
+        k8s_credential_path = self.helm_executor.kubeconfig_path
         return f"helm upgrade {helm_chart_resource.name} {helm_chart_resource.get_chart_converted()} --history-max 10 --install --output json --timeout 5m --values '{values_path.absolute()}' --debug --atomic --create-namespace --namespace {helm_chart_resource.namespace.lower()} --version {version} --wait --wait-for-jobs --kubeconfig {k8s_credential_path.absolute()}"
 
     def _check_if_helm_chart_installed(self, release_name: str, release_namespace: str):
-        releases = asyncio.run(self.helm_client.list_releases(all=True, all_namespaces=True))
-        for release in releases:
-            if release.name == release_name and release.namespace == release_namespace:
-                return True
-        return False
+        return self.helm_executor.is_release_installed(release_name, release_namespace)
 
     def _check_helm_chart_status(self, release_name: str, release_namespace: str, desired_status: ReleaseRevisionStatus):
-        releases = asyncio.run(self.helm_client.list_releases(all=True, all_namespaces=True))
-        for release in releases:
-            revision = asyncio.run(release.current_revision())
-            if release.name == release_name and release.namespace == release_namespace:
-                return revision.status == desired_status
-        raise K8SProviderNativeException(f"Unable to check Helm chart status for '{release_name}', namespace '{release_namespace}', not found")
+        try:
+            return self.helm_executor.get_release_status(release_name, release_namespace) == desired_status
+        except pyhelm3.errors.ReleaseNotFoundError:
+            raise K8SProviderNativeException(f"Unable to check Helm chart status for '{release_name}', namespace '{release_namespace}', not found")
 
     def update_values_helm_chart(self, helm_chart_resource: HelmChartResource, values: Dict[str, Any]):
         self.logger.info(f"Updating Helm chart {helm_chart_resource.name}")
 
-        chart = asyncio.run(self.helm_client.get_chart(
+        chart = self.helm_executor.get_chart(
             helm_chart_resource.get_chart_converted(),
             repo=helm_chart_resource.repo,
             version=helm_chart_resource.version
-        ))
+        )
         self.logger.debug(f"Helm chart {helm_chart_resource.name} metadata version: {chart.metadata.version}")
 
         # Install or upgrade a release
-        revision = asyncio.run(self.helm_client.install_or_upgrade_release(
+        revision = self.helm_executor.install_or_upgrade_release(
             helm_chart_resource.name.lower(),
             chart,
             values,
             namespace=helm_chart_resource.namespace.lower(),
             atomic=True,
             wait=True
-        ))
+        )
 
         if not self._check_helm_chart_status(revision.release.name, revision.release.namespace, ReleaseRevisionStatus.DEPLOYED):
             self.logger.error(f"The helm chart '{helm_chart_resource.name}' is not in the DEPLOYED state")
@@ -189,11 +164,11 @@ class K8SProviderNative(K8SProviderInterface):
     def uninstall_helm_chart(self, helm_chart_resource: HelmChartResource):
         self.logger.info(f"Uninstalling Helm chart {helm_chart_resource.name}")
 
-        asyncio.run(self.helm_client.uninstall_release(
+        self.helm_executor.uninstall_release(
             helm_chart_resource.name.lower(),
             namespace=helm_chart_resource.namespace.lower(),
             wait=True
-        ))
+        )
         self.save_to_db()
 
         if self._check_if_helm_chart_installed(helm_chart_resource.name.lower(), helm_chart_resource.namespace.lower()):
@@ -201,11 +176,7 @@ class K8SProviderNative(K8SProviderInterface):
             raise K8SProviderNativeException(f"The helm chart '{helm_chart_resource.name}' was not uninstalled successfully")
 
         # Removing this blueprint to the deployed list on the cluster
-        try:
-            cluster = self.topology_manager.get_k8s_cluster_by_area(self.area)
-            cluster.deployed_blueprints.remove(self.blueprint_id)
-            self.topology_manager.update_kubernetes(cluster)
-        except ValueError as e:
+        if not self.topology_manager.remove_k8s_deployed_blueprint(self.k8s_cluster.name, self.blueprint_id):
             self.logger.warning("Blueprint has not been found in the cluster deployed blueprints")
 
         self.logger.success(f"Uninstalled Helm chart {helm_chart_resource.name}")
@@ -251,8 +222,10 @@ class K8SProviderNative(K8SProviderInterface):
         self.logger.debug(f"Restarting all deployments in namespace '{namespace}'")
         updated_deps = self.kube_utils.restart_all_deployments(namespace)
         failed_deployments = []
+        # The deployments are restarted together, wait for all of them at the same time
+        wait_results = self.kube_utils.wait_for_deployments_to_be_ready(updated_deps)
         for dep in updated_deps:
-            wait_res = self.kube_utils.wait_for_deployment_to_be_ready(dep)
+            wait_res = wait_results[dep.metadata.name]
             if wait_res:
                 self.logger.debug(f"Restarted deployment: {dep.metadata.name} in namespace '{namespace}' successful")
             else:
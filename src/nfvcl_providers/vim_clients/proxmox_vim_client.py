@@ -5,6 +5,7 @@ import paramiko
 import semantic_version
 from proxmoxer import ProxmoxAPI
 
+from nfvcl_providers.vim_clients.proxmox_vmid_allocator import ProxmoxVmidAllocator
 from nfvcl_providers.vim_clients.vim_client import VimClient
 from nfvcl_core_models.vim.vim_models import VimModel
 
@@ -16,6 +17,8 @@ class ProxmoxVimClient(VimClient):
         super().__init__(vim)
         self.proxmoxer: Optional[ProxmoxAPI] = None
         self.version = None
+        # Replaced by VimClientsManager with the allocator of the VIM, that is kept when the client is closed
+        self.vmid_allocator = ProxmoxVmidAllocator(vim.name)
         self.connect_proxmoxer()
         if self.version < IMPORT_URL_VERSION:
             self._connect_ssh()
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, Optional, Set
+
+from nfvcl_common.utils.log import create_logger
+
+# Range of the VMIDs used by NFVCL for the VMs
+PROXMOX_VMID_FIRST = 10000
+PROXMOX_VMID_LAST = 10999
+# Seconds after which the used VMIDs are loaded again from the cluster, to see VMs created or deleted outside NFVCL
+PROXMOX_VMID_REFRESH_INTERVAL = 60
+
+
+class ProxmoxVmidAllocator:
+    """
+    Allocate the VMIDs of the VMs created on a Proxmox VIM.
+
+    The VMIDs used in the cluster are loaded with a single request and the free ones are kept in memory, so a VMID is
+    handed out without contacting Proxmox. A VMID is reserved from its allocation until the VM has been created, the
+    reservations are also saved to the database (if a repository is given) so they are not reused after a restart.
+    """
+
+    def __init__(self, vim_name: str, reservation_repository=None, first: int = PROXMOX_VMID_FIRST, last: int = PROXMOX_VMID_LAST, refresh_interval: float = PROXMOX_VMID_REFRESH_INTERVAL):
+        """
+        Args:
+            vim_name: The name of the VIM
+            reservation_repository: Repository saving the reservations, must implement 'get_reserved_vmids',
+                'reserve_vmid' and 'release_vmid' (see ProxmoxVmidRepository)
+            first: The first VMID that can be allocated
+            last: The last VMID that can be allocated
+            refresh_interval: Seconds after which the used VMIDs are loaded again from the cluster
+        """
+        self.logger = create_logger(self.__class__.__name__)
+        self.vim_name = vim_name
+        self.first = first
+        self.last = last
+        self.refresh_interval = refresh_interval
+        self._reservation_repository = reservation_repository
+        self._lock = threading.Lock()
+        self._free: Deque[int] = deque()
+        self._reserved: Set[int] = set()
+        # Reservations of a previous run, kept until the cluster is loaded
+        self._recovered: Set[int] = set()
+        self._last_refresh: Optional[float] = None
+        if self._reservation_repository is not None:
+            self._recovered = self._reservation_repository.get_reserved_vmids(vim_name)
+            self._reserved |= self._recovered
+
+    def allocate(self, get_used_vmids: Callable[[], Iterable[int]]) -> int:
+        """
+        Reserve a free VMID, it must be released with 'release' when the VM has been created (or the creation failed)
+        Args:
+            get_used_vmids: Function returning the VMIDs used in the cluster, called only when the free VMIDs need to be refreshed
+
+        Returns:
+            The reserved VMID
+        """
+        with self._lock:
+            if self._last_refresh is None or len(self._free) == 0 or time.monotonic() - self._last_refresh > self.refresh_interval:
+                self._refresh(set(get_used_vmids()))
+            if len(self._free) == 0:
+                raise Exception(f"No free vmid available")
+            vmid = self._free.popleft()
+            self._reserved.add(vmid)
+        if self._reservation_repository is not None:
+            self._reservation_repository.reserve_vmid(self.vim_name, vmid)
+        return vmid
+
+    def release(self, vmid: int, created: bool = True):
+        """
+        Release the reservation of a VMID
+        Args:
+            vmid: The VMID
+            created: False if the VM has not been created, the VMID is returned to the free ones and the used VMIDs are
+                loaded again on the next allocation (the failure may be caused by a VM created outside NFVCL)
+        """
+        with self._lock:
+            self._reserved.discard(vmid)
+            if not created:
+                self._free.appendleft(vmid)
+                self._last_refresh = None
+        if self._reservation_repository is not None:
+            self._reservation_repository.release_vmid(self.vim_name, vmid)
+
+    def _refresh(self, used_vmids: Set[int]):
+        """
+        Compute the free VMIDs from the used ones, must be called holding the lock
+        """
+        # The VMs of the reservations of a previous run either exist now or have never been created
+        for vmid in self._recovered:
+            self._reserved.discard(vmid)
+            if self._reservation_repository is not None:
+                self._reservation_repository.release_vmid(self.vim_name, vmid)
+        self._recovered.clear()
+
+        self._free = deque(vmid for vmid in range(self.first, self.last + 1) if vmid not in used_vmids and vmid not in self._reserved)
+        self._last_refresh = time.monotonic()
+        self.logger.debug(f"Loaded VMIDs of VIM {self.vim_name}: {len(used_vmids)} used, {len(self._reserved)} reserved, {len(self._free)} free")
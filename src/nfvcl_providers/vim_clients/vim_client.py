@@ -1,14 +1,76 @@
-from typing import List
+import threading
+import time
+from typing import List, Dict, Tuple, Optional, Callable
 
 from nfvcl_common.utils.log import create_logger
 from nfvcl_core_models.vim.vim_models import VimModel
 
+# Seconds for which an image imported on a VIM is considered up to date
+IMAGE_REGISTRY_TTL = 3600
+
+
+class ImageRegistry:
+    """
+    Registry of the images already present on the storages of a VIM, with their checksum.
+    The concurrent requests for the same image are de-duplicated, the image is imported only by the first one.
+    """
+
+    def __init__(self, ttl: float = IMAGE_REGISTRY_TTL):
+        self.ttl = ttl
+        # (storage, image name) -> (checksum, import time)
+        self._entries: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        self._lock = threading.Lock()
+        self._image_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def ensure_image(self, storage: str, image_name: str, import_function: Callable[[], Optional[str]], check_function: Optional[Callable[[Optional[str]], bool]] = None) -> bool:
+        """
+        Import the image on the storage if it is not already present (or if it has been imported more than 'ttl' seconds ago)
+        Args:
+            storage: The storage identifier
+            image_name: The name of the image
+            import_function: The function importing the image, returns the checksum of the image (if known)
+            check_function: Called with the checksum of an image already imported, should be a cheap check returning False
+                if the image is not on the storage anymore or has changed, in that case it is imported again
+
+        Returns:
+            True if the image has been imported, False if it was already present
+        """
+        key = (storage, image_name)
+        with self._lock:
+            image_lock = self._image_locks.setdefault(key, threading.Lock())
+        with image_lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                if check_function is None or check_function(entry[0]):
+                    return False
+            # If the import fails the image must not be considered present
+            self.invalidate(storage, image_name)
+            checksum = import_function()
+            self._entries[key] = (checksum, time.monotonic())
+            return True
+
+    def invalidate(self, storage: str, image_name: Optional[str] = None):
+        """
+        Forget the images of a storage, they will be imported again on the next request
+        Args:
+            storage: The storage identifier
+            image_name: The image to be forgotten, every image of the storage if None
+        """
+        with self._lock:
+            for key in list(self._entries.keys()):
+                if key[0] == storage and (image_name is None or key[1] == image_name):
+                    del self._entries[key]
+
 
 class VimClient:
     def __init__(self, vim: VimModel):
         self.logger = create_logger(self.__class__.__name__)
         self.vim = vim
         self.references: List[int] = []
+        # Serialize the upload of the images on the VIM, VMs using the same image can be created in parallel
+        self.image_lock = threading.Lock()
+        # Replaced by VimClientsManager with the registry of the VIM, that is kept when the client is closed
+        self.image_registry = ImageRegistry()
 
     def close(self):
         pass
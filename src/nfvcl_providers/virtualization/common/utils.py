@@ -1,13 +1,15 @@
 import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Dict, Set, Sequence
 
 import paramiko
 import verboselogs
 
-from nfvcl_common.ansible_utils import run_ansible_playbook
+from nfvcl_common.ansible_utils import run_ansible_playbook, run_ansible_playbook_batch, AnsibleHost, AnsibleHostResult
 from nfvcl_common.utils.file_utils import create_tmp_folder
+from nfvcl_common.utils.ssh_utils import ssh_connection_manager
 from nfvcl_providers.virtualization.virtualization_provider_interface import \
     VirtualizationProviderException
 from nfvcl_core_models.resources import VmResourceAnsibleConfiguration
@@ -27,12 +29,10 @@ def check_ssh_ready(host: str, port: int, user: str, passwd: str, logger_overrid
         logger = logger_pu
 
     logger.debug(f"Checking SSH connection to {host}:{port} as user <{user}> and passwd <{passwd}>")
-    client = paramiko.client.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     try:
-        client.connect(host, port, username=user, password=passwd, allow_agent=False, look_for_keys=False, timeout=2)
+        # An already open connection to the host is reused only if the host is still answering
+        ssh_connection_manager.get_client(host, port, user, passwd, timeout=2, verify=True)
         logger.debug('SSH transport is available!')
-        client.close()
         return True
     except paramiko.ssh_exception.SSHException as e:
         # socket is open, but not SSH service responded
@@ -53,14 +53,12 @@ def wait_for_ssh_to_be_ready(host: str, port: int, user: str, passwd: str, timeo
         logger = logger_pu
 
     logger.debug(f"Starting SSH connection to {host}:{port} as user <{user}> and passwd <{passwd}>. Timeout is {timeout}, retry interval is {retry_interval}")
-    client = paramiko.client.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     timeout_start = time.time()
     while time.time() < timeout_start + timeout:
         try:
-            client.connect(host, port, username=user, password=passwd, allow_agent=False, look_for_keys=False)
+            # The connection is kept open and reused by the following probes
+            ssh_connection_manager.get_client(host, port, user, passwd)
             logger.debug('SSH transport is available!')
-            client.close()
             return True
         except paramiko.ssh_exception.SSHException as e:
             # socket is open, but not SSH service responded
@@ -95,12 +93,10 @@ def configure_machine_ansible(ip: str, username: str, password: str, playbook: s
 
     return fact_cache
 
-def configure_vm_ansible(vm_resource_configuration: VmResourceAnsibleConfiguration, blueprint_id: str, logger_override: Optional[verboselogs.VerboseLogger] = None) -> dict:
-    if logger_override:
-        logger = logger_override
-    else:
-        logger = logger_pu
-
+def _dump_vm_playbook(vm_resource_configuration: VmResourceAnsibleConfiguration, blueprint_id: str) -> str:
+    """
+    Generate the playbook of the configuration, a copy is saved in the tmp folder
+    """
     nfvcl_tmp_dir = create_tmp_folder("playbook")
 
     playbook_str = vm_resource_configuration.dump_playbook()
@@ -108,6 +104,17 @@ def configure_vm_ansible(vm_resource_configuration: VmResourceAnsibleConfigurati
     with open(Path(nfvcl_tmp_dir, f"{blueprint_id}_{vm_resource_configuration.vm_resource.name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.yml"), "w+") as f:
         f.write(playbook_str)
 
+    return playbook_str
+
+
+def configure_vm_ansible(vm_resource_configuration: VmResourceAnsibleConfiguration, blueprint_id: str, logger_override: Optional[verboselogs.VerboseLogger] = None) -> dict:
+    if logger_override:
+        logger = logger_override
+    else:
+        logger = logger_pu
+
+    playbook_str = _dump_vm_playbook(vm_resource_configuration, blueprint_id)
+
     # Wait for SSH to be ready, this is needed because sometimes cloudinit is still not finished and the server doesn't allow password connections
     wait_for_ssh_to_be_ready(
         vm_resource_configuration.vm_resource.access_ip,
@@ -128,3 +135,77 @@ def configure_vm_ansible(vm_resource_configuration: VmResourceAnsibleConfigurati
     )
 
     return fact_cache
+
+
+def configure_vms_ansible(vm_resource_configurations: Sequence[VmResourceAnsibleConfiguration], blueprint_id: str, logger_override: Optional[verboselogs.VerboseLogger] = None) -> List[AnsibleHostResult]:
+    """
+    Apply multiple configurations, the configurations with the same playbook are applied with a single ansible-runner
+    invocation (one inventory containing every VM) instead of one per VM. Different playbooks are run concurrently.
+
+    Args:
+        vm_resource_configurations: The configurations to be applied, a VM can appear more than once
+        blueprint_id: The blueprint owning the VMs
+        logger_override: The logger to be used
+
+    Returns:
+        The result (failure and facts) of every configuration, in the same order as the configurations
+    """
+    if logger_override:
+        logger = logger_override
+    else:
+        logger = logger_pu
+
+    if len(vm_resource_configurations) == 0:
+        return []
+
+    # Configurations with the same playbook are grouped. A configuration can only join a group following the last one
+    # containing its host, so the groups of a host always have increasing indexes.
+    groups: List[Dict[str, int]] = []  # host -> configuration index
+    group_playbooks: List[str] = []
+    # The groups that must be completed before each group: for every host, the group of its previous configuration
+    group_requires: List[Set[int]] = []
+    last_group_of_host: Dict[str, int] = {}
+    for idx, vm_resource_configuration in enumerate(vm_resource_configurations):
+        playbook_str = _dump_vm_playbook(vm_resource_configuration, blueprint_id)
+        host = vm_resource_configuration.vm_resource.access_ip
+        first_group = last_group_of_host.get(host, -1) + 1
+        group_idx = next((i for i in range(first_group, len(groups)) if group_playbooks[i] == playbook_str), None)
+        if group_idx is None:
+            group_idx = len(groups)
+            groups.append({})
+            group_playbooks.append(playbook_str)
+            group_requires.append(set())
+        if host in last_group_of_host:
+            group_requires[group_idx].add(last_group_of_host[host])
+        groups[group_idx][host] = idx
+        last_group_of_host[host] = group_idx
+
+    # The levels are computed once the groups are complete, since a group joined by a configuration may get new
+    # requirements after later groups have been created. Required groups have lower indexes, so a single pass is enough.
+    # Groups of the same level are run concurrently.
+    group_levels: List[int] = []
+    for group_idx in range(len(groups)):
+        group_levels.append(max((group_levels[required] + 1 for required in group_requires[group_idx]), default=0))
+
+    # Wait for SSH to be ready, this is needed because sometimes cloudinit is still not finished and the server doesn't allow password connections
+    vm_resources = {vm_resource_configuration.vm_resource.access_ip: vm_resource_configuration.vm_resource for vm_resource_configuration in vm_resource_configurations}
+    with ThreadPoolExecutor(max_workers=len(vm_resources), thread_name_prefix=f"SSHWait-{blueprint_id}") as executor:
+        for host, vm_resource in vm_resources.items():
+            executor.submit(wait_for_ssh_to_be_ready, host, 22, vm_resource.username, vm_resource.password, 300, 5, logger_override=logger_override)
+
+    def run_group(group: Dict[str, int], playbook_str: str) -> Dict[str, AnsibleHostResult]:
+        hosts = [AnsibleHost(host=host, username=vm_resources[host].username, password=vm_resources[host].password) for host in group.keys()]
+        logger.debug(f"Running ansible configurator on {len(hosts)} hosts: {', '.join(group.keys())}")
+        return run_ansible_playbook_batch(hosts, playbook_str, logger)
+
+    results: Dict[int, AnsibleHostResult] = {}  # configuration index -> result
+    for level in range(max(group_levels) + 1):
+        level_groups = [group_idx for group_idx, group_level in enumerate(group_levels) if group_level == level]
+        with ThreadPoolExecutor(max_workers=len(level_groups), thread_name_prefix=f"Ansible-{blueprint_id}") as executor:
+            futures = [executor.submit(run_group, groups[group_idx], group_playbooks[group_idx]) for group_idx in level_groups]
+            for group_idx, future in zip(level_groups, futures):
+                host_results = future.result()
+                for host, idx in groups[group_idx].items():
+                    results[idx] = host_results[host]
+
+    return [results[idx] for idx in range(len(vm_resource_configurations))]
@@ -54,6 +54,11 @@ class VirtualizationProviderRest(VirtualizationProviderInterface):
 
         self.httpx_client = httpx.Client(follow_redirects=True)
 
+        # Long polling of the task completion, if not supported by the remote server the task status is polled
+        # starting every 'task_poll_interval_min' seconds, doubling the interval up to 'task_poll_interval'
+        self.task_long_poll = True
+        self.task_long_poll_timeout = 30
+        self.task_poll_interval_min = 0.1
         self.task_poll_interval = 2
         self.task_poll_timeout = 300
 
@@ -69,29 +74,52 @@ class VirtualizationProviderRest(VirtualizationProviderInterface):
         self.logger.spam(f"Response received: {response.json()}, status code: {response.status_code}")
         response.raise_for_status()
         nfvcl_compliant_response = OssCompliantResponse.model_validate(response.json())
-        elapsed_time = 0
+        task_status = self.__wait_task(nfvcl_compliant_response.task_id)
+
+        if task_status.error:
+            raise VirtualizationProviderRestException(task_status.exception)
+        self.logger.spam(f"Task completed, result: {task_status.result}")
+        return task_status.result
+
+    def __wait_task(self, task_id: str) -> NFVCLTaskStatus:
+        """
+        Wait for the completion of a remote task, using the long polling endpoint if available
+        """
+        deadline = time.monotonic() + self.task_poll_timeout
+        poll_interval = self.task_poll_interval_min
         while True:
-            self.logger.spam(f"Waiting for task completion, elapsed time: {elapsed_time}/{self.task_poll_timeout} seconds")
-            resp = self.__http_request_get(f"{self.task_api_base}/{nfvcl_compliant_response.task_id}")
-            task_status = NFVCLTaskStatus.model_validate(resp)
-
-            if task_status.error:
-                raise VirtualizationProviderRestException(task_status.exception)
-
-            if task_status.status == NFVCLTaskStatusType.DONE:
-                self.logger.spam(f"Task completed, result: {task_status.result}")
-                return task_status.result
-            time.sleep(self.task_poll_interval)
-            elapsed_time += self.task_poll_interval
-            if elapsed_time > self.task_poll_timeout:
+            remaining = deadline - time.monotonic()
+            self.logger.spam(f"Waiting for task completion, remaining time: {remaining:.1f}/{self.task_poll_timeout} seconds")
+            task_status = None
+            if self.task_long_poll:
+                wait_timeout = max(0.0, min(self.task_long_poll_timeout, remaining))
+                try:
+                    resp = self.__http_request_get(f"{self.task_api_base}/{task_id}/wait", query_params={"timeout": wait_timeout}, timeout=wait_timeout + 10)
+                    task_status = NFVCLTaskStatus.model_validate(resp)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code not in (404, 405):
+                        raise e
+                    # The server does not implement the long polling, or the task does not exist (reported by the status request)
+                    self.logger.debug(f"Long polling of the tasks not available on {self.api_base_url}, using polling")
+                    self.task_long_poll = False
+            if task_status is None:
+                resp = self.__http_request_get(f"{self.task_api_base}/{task_id}")
+                task_status = NFVCLTaskStatus.model_validate(resp)
+                if task_status.status != NFVCLTaskStatusType.DONE and not task_status.error:
+                    time.sleep(max(0.0, min(poll_interval, deadline - time.monotonic())))
+                    poll_interval = min(poll_interval * 2, self.task_poll_interval)
+
+            if task_status.error or task_status.status == NFVCLTaskStatusType.DONE:
+                return task_status
+            if time.monotonic() >= deadline:
                 raise VirtualizationProviderRestException("Timeout waiting for task completion")
 
-    def __http_request_get(self, endpoint: str) -> Any:
+    def __http_request_get(self, endpoint: str, query_params: Optional[Dict] = None, timeout: Optional[float] = None) -> Any:
         response = self.httpx_client.request("GET", endpoint, headers={
             "Content-Type": "application/json",
             "Accept": "application/json",
             "X-NFVCL-Agent-ID": self.agent_uuid
-        })
+        }, params=query_params, timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT)
         response.raise_for_status()
         return response.json()
 
@@ -1,7 +1,5 @@
-import hashlib
 from typing import List, Dict, Set, Tuple
 
-import requests
 from openstack.compute.v2.flavor import Flavor
 from openstack.compute.v2.server import Server
 from openstack.compute.v2.server_interface import ServerInterface
@@ -15,6 +13,8 @@ from pydantic import Field
 from nfvcl_common.ansible_builder import AnsiblePlaybookBuilder
 from nfvcl_common.cloudinit_builder import CloudInit
 from nfvcl_providers.virtualization.common.models.netplan import VmAddNicNetplanConfigurator, NetplanInterface
+from nfvcl_common.utils.image_digest_cache import image_digest_cache
+from nfvcl_common.utils.ssh_utils import ssh_connection_manager
 from nfvcl_providers.virtualization.common.utils import configure_vm_ansible, check_ssh_ready
 from nfvcl_providers.virtualization.virtualization_provider_interface import \
     VirtualizationProviderException, \
@@ -61,6 +61,7 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
     vim_client: OpenStackVimClient
     conn: Connection
     vim_need_floating_ip: bool
+    ansible_batch_configuration = True
 
     def init(self):
         self.data: VirtualizationProviderDataOpenstack = VirtualizationProviderDataOpenstack()
@@ -98,16 +99,8 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
                 raise VirtualizationProviderOpenstackException(f"Network >{net}< not found on vim")
 
     def __get_checksum(self, vm_image: VmResourceImage) -> str:
-        self.logger.debug(f"Downloading {vm_image.url} image on NFVCL machine to compute its hash 512...")
-        response = requests.get(vm_image.url, stream=True)
-
-        if response.status_code == 200:
-            file_hash = hashlib.sha512(response.content).hexdigest()
-            self.logger.debug(f"Downloading of {vm_image.url} finished")
-            return file_hash
-        else:
-            self.logger.error(f"Failed to download file. Status code: {response.status_code}")
-            raise ValueError("The URL is not valid")
+        # The image is hashed in streaming, the digest is cached until the image changes on the server
+        return image_digest_cache.get_digest(vm_image.url, "sha512")
 
     def __prepare_image(self, vm_image: VmResourceImage):
         """
@@ -154,7 +147,8 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
 
         self._pre_creation_checks(vm_resource)
 
-        image = self.__prepare_image(vm_resource.image)
+        with self.vim_client.image_lock:
+            image = self.__prepare_image(vm_resource.image)
 
         flavor: Flavor = self.create_get_flavor(vm_resource.flavor, vm_resource.name)
 
@@ -202,14 +196,16 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
         # This allows to delete a blueprint that crash during the create_vm execution
 
         # Register the VM in the provider data, this is needed to be able to delete it using only the vm_resource
-        self.data.os_dict[vm_resource.id] = server_obj.id
+        with self.data_lock:
+            self.data.os_dict[vm_resource.id] = server_obj.id
         self.save_to_db()
 
         self.__update_net_info_vm(vm_resource, server_obj)
         self.__disable_port_security_all_ports(vm_resource, server_obj)
 
         # The VM is now created
-        vm_resource.created = True
+        with self.data_lock:
+            vm_resource.created = True
 
         self.logger.success(f"Creating VM {vm_resource.name} finished")
         self.save_to_db()
@@ -281,18 +277,20 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
         )
 
     def __update_net_info_vm(self, vm_resource: VmResource, server_obj: Server):
-        vm_resource.network_interfaces.clear()
         # Getting detailed info about the networks attached to the machine
         subnet_detailed = self.__get_network_details(vm_resource.get_all_connected_network_names())
         # Parse the OS output and create a structured network_interfaces dictionary
-        self.__parse_os_addresses(vm_resource, server_obj.addresses, subnet_detailed)
+        network_interfaces = self.__parse_os_addresses(server_obj.addresses, subnet_detailed)
 
         # Find the IP to use for configuring the VM, floating if present or the fixed one from the management interface if not
-        mgt_interface = vm_resource.network_interfaces[vm_resource.management_network][0]
-        if mgt_interface.floating:
-            vm_resource.access_ip = mgt_interface.floating.ip
-        else:
-            vm_resource.access_ip = mgt_interface.fixed.ip
+        mgt_interface = network_interfaces[vm_resource.management_network][0]
+        with self.data_lock:
+            vm_resource.network_interfaces.clear()
+            vm_resource.network_interfaces.update(network_interfaces)
+            if mgt_interface.floating:
+                vm_resource.access_ip = mgt_interface.floating.ip
+            else:
+                vm_resource.access_ip = mgt_interface.fixed.ip
 
         # Run an Ansible playbook to gather information
         self.__gather_info_from_vm(vm_resource)
@@ -418,7 +416,8 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
                     is_public=False
                 )
                 self.conn.add_flavor_access(flavor.id, self.vim_client.project_id)
-                self.data.flavors.append(flavor_name)
+                with self.data_lock:
+                    self.data.flavors.append(flavor_name)
             return flavor
 
     def __gather_info_from_vm(self, vm_resource: VmResource):
@@ -469,6 +468,9 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
             self.conn.delete_server(self.data.os_dict[vm_resource.id], wait=True, timeout=request_timeout)
         else:
             self.logger.warning(f"Unable to find VM id for resource '{vm_resource.id}' with name '{vm_resource.name}', manually check on VIM")
+        if vm_resource.access_ip:
+            # The IP of the VM may be reused, the connections to it are closed
+            ssh_connection_manager.release(vm_resource.access_ip, vm_resource.username)
         self.logger.success(f"Destroying VM {vm_resource.name} finished")
         self.save_to_db()
 
@@ -483,7 +485,8 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
         for network_id in self.data.networks:
             self.conn.delete_network(network_id)
 
-    def __parse_os_addresses(self, vm_resource: VmResource, addresses, subnet_details: Dict[str, Subnet]):
+    def __parse_os_addresses(self, addresses, subnet_details: Dict[str, Subnet]) -> Dict[str, List[VmResourceNetworkInterface]]:
+        network_interfaces: Dict[str, List[VmResourceNetworkInterface]] = {}
         for network_name, network_info in addresses.items():
             fixed = None
             floating = None
@@ -492,9 +495,10 @@ class VirtualizationProviderOpenstack(VirtualizationProviderInterface):
                     fixed = VmResourceNetworkInterfaceAddress(ip=address["addr"], mac=address["OS-EXT-IPS-MAC:mac_addr"], cidr=subnet_details[network_name].cidr)
                 if address["OS-EXT-IPS:type"] == "floating":
                     floating = VmResourceNetworkInterfaceAddress(ip=address["addr"], mac=address["OS-EXT-IPS-MAC:mac_addr"], cidr=subnet_details[network_name].cidr)
-                if network_name not in vm_resource.network_interfaces:
-                    vm_resource.network_interfaces[network_name] = []
-            vm_resource.network_interfaces[network_name].append(VmResourceNetworkInterface(fixed=fixed, floating=floating))
+                if network_name not in network_interfaces:
+                    network_interfaces[network_name] = []
+            network_interfaces[network_name].append(VmResourceNetworkInterface(fixed=fixed, floating=floating))
+        return network_interfaces
 
     def __disable_port_security(self, conn: Connection, port_id):
         try:
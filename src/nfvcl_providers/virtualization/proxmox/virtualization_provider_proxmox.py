@@ -5,7 +5,7 @@ import time
 import uuid
 from pathlib import Path
 from time import sleep
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Tuple, Set, Optional
 
 import httpx
 import proxmoxer
@@ -22,6 +22,7 @@ from nfvcl_core_models.vim.vim_models import ProxmoxPrivilegeEscalationTypeEnum
 from nfvcl_providers.vim_clients.proxmox_vim_client import ProxmoxVimClient
 from nfvcl_providers.virtualization.common.models.netplan import VmAddNicNetplanConfigurator, \
     NetplanInterface
+from nfvcl_common.utils.ssh_utils import ssh_connection_manager
 from nfvcl_providers.virtualization.common.utils import configure_vm_ansible, check_ssh_ready
 from nfvcl_providers.virtualization.proxmox.models.models import ProxmoxZone, Subnet, \
     ProxmoxNetsDevice, ProxmoxMac, ProxmoxTicket, ProxmoxNode, Vnet, Network
@@ -53,6 +54,7 @@ class VirtualizationProviderProxmoxException(VirtualizationProviderException):
 class VirtualizationProviderProxmox(VirtualizationProviderInterface):
     vim_client: ProxmoxVimClient
     data: VirtualizationProviderDataProxmox
+    ansible_batch_configuration = True
 
     def init(self):
         self.data: VirtualizationProviderDataProxmox = VirtualizationProviderDataProxmox()
@@ -199,11 +201,7 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
         if vm_resource.flavor.ssh_keys:
             ssh_keys.extend(vm_resource.flavor.ssh_keys)
 
-        vmid = self.__get_free_vmid()
-
-        interface0 = self.data.proxmox_net_device.add_net_device(str(vmid))
         vm_to_create = {
-            "vmid": vmid,
             "name": vm_resource.get_name_k8s_format(),
             "memory": vm_resource.flavor.memory_mb,
             "cores": vm_resource.flavor.vcpu_count,
@@ -213,15 +211,14 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
             "tags": "nfvcl",  # If you want add more tags, you have to separate them with ";"
             "agent": 1
         }
-        vm_to_create[interface0] = f"virtio,bridge={self.data.proxmox_vnet[vm_resource.management_network]},firewall=0" if vm_resource.management_network in self.data.proxmox_vnet.keys() else f"virtio,bridge={vm_resource.management_network},firewall=0"
+        # The bridge of every interface, the management one first
+        bridges = [self.data.proxmox_vnet[vm_resource.management_network] if vm_resource.management_network in self.data.proxmox_vnet.keys() else vm_resource.management_network]
+        for net in vm_resource.additional_networks:
+            bridges.append(self.data.proxmox_vnet[net] if net in self.data.proxmox_vnet.keys() else net)
 
         if self.vim.proxmox_parameters().proxmox_resource_pool:
             vm_to_create["pool"] = self.vim.proxmox_parameters().proxmox_resource_pool
 
-        for net in vm_resource.additional_networks:
-            interface = self.data.proxmox_net_device.add_net_device(str(vmid))
-            vm_to_create[interface] = f"virtio,bridge={self.data.proxmox_vnet[net]},firewall=0" if net in self.data.proxmox_vnet.keys() else f"virtio,bridge={net},firewall=0"
-
         if self.vim_client.version >= IMPORT_URL_VERSION:
             vm_to_create["scsi0"] = f"file={vm_resource.flavor.vm_volume if vm_resource.flavor.vm_volume else self.vim.proxmox_parameters().proxmox_vm_volume}:0,import-from=local:import/{vm_resource.image.name}.qcow2,iothread=on",
             vm_to_create["boot"] = "order=scsi0"
@@ -229,14 +226,32 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
             vm_to_create["scsi0"] = f"file={vm_resource.flavor.vm_volume if vm_resource.flavor.vm_volume else self.vim.proxmox_parameters().proxmox_vm_volume}:0,import-from=local:0/{vm_resource.image.name}.qcow2,iothread=on",
             vm_to_create["boot"] = "order=scsi0"
 
-        self.__execute_proxmox_request(
-            url=f"nodes/{self.data.proxmox_node_name}/qemu",
-            parameters=vm_to_create,
-            r_type=HttpRequestType.POST,
-            node_name=self.data.proxmox_node_name
-        )
-
-        self.data.proxmox_dict[vm_resource.id] = str(vmid)
+        # The VMID is reserved until the VM exists, every failure from here to the creation must release it
+        vmid = self.__get_free_vmid()
+        try:
+            vm_to_create["vmid"] = vmid
+            with self.data_lock:
+                for bridge in bridges:
+                    interface = self.data.proxmox_net_device.add_net_device(str(vmid))
+                    vm_to_create[interface] = f"virtio,bridge={bridge},firewall=0"
+            self.__execute_proxmox_request(
+                url=f"nodes/{self.data.proxmox_node_name}/qemu",
+                parameters=vm_to_create,
+                r_type=HttpRequestType.POST,
+                node_name=self.data.proxmox_node_name
+            )
+        except Exception:
+            with self.data_lock:
+                # The VMID may be reused by another VM of this blueprint, that must start again from net0
+                self.data.proxmox_net_device.nets.pop(str(vmid), None)
+            self.vim_client.vmid_allocator.release(vmid, created=False)
+            # The image may have been removed from the storage, it will be checked and imported again by the next VM
+            self.vim_client.image_registry.invalidate(self.__get_image_storage(), vm_resource.image.name)
+            raise
+        self.vim_client.vmid_allocator.release(vmid)
+
+        with self.data_lock:
+            self.data.proxmox_dict[vm_resource.id] = str(vmid)
         self.save_to_db()
         self.resize_disk(vmid, int(vm_resource.flavor.storage_gb), "scsi0")
 
@@ -297,12 +312,14 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
 
         # Find the IP to use for configuring the VMte
         if vm_resource.management_network in vm_resource.network_interfaces.keys() and len(vm_resource.network_interfaces[vm_resource.management_network]) > 0:
-            vm_resource.access_ip = vm_resource.network_interfaces[vm_resource.management_network][0].fixed.ip
+            with self.data_lock:
+                vm_resource.access_ip = vm_resource.network_interfaces[vm_resource.management_network][0].fixed.ip
         else:
             raise VirtualizationProviderProxmoxException(f"Error {vm_resource.name} has no an IP assigned")
 
         # The VM is now created
-        vm_resource.created = True
+        with self.data_lock:
+            vm_resource.created = True
 
         self.logger.success(f"Creating VM {vm_resource.name} finished")
         self.save_to_db()
@@ -426,6 +443,9 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
                 self.__execute_ssh_command(f"rm {self.path}/snippets/user_cloud_init_{vmid}_{self.blueprint_id}.yaml")
                 self.__execute_ssh_command(f"rm {self.path}/snippets/network_cloud_init_{vmid}_{self.blueprint_id}.yaml")
             del self.data.proxmox_dict[vm_resource.id]
+            if vm_resource.access_ip:
+                # The IP of the VM may be reused, the connections to it are closed
+                ssh_connection_manager.release(vm_resource.access_ip, vm_resource.username)
             self.logger.success(f"VM {vmid} destroyed")
 
     def final_cleanup(self):
@@ -478,19 +498,18 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
         return ips
 
     def __get_free_vmid(self) -> int:
-        nfvcl_vmid = list(range(10000, 11000))
-        for _id in nfvcl_vmid:
-            try:
-                response = self.__execute_proxmox_request(
-                    url="cluster/nextid",
-                    parameters={"vmid": _id},
-                    r_type=HttpRequestType.GET
-                )
-                if response == str(_id):
-                    return _id
-            except ResourceException as e:
-                pass
-        raise Exception(f"No free vmid available")
+        """
+        Reserve a free VMID, the reservation must be released when the VM is created. VMs may be created in parallel on the same VIM
+        """
+        return self.vim_client.vmid_allocator.allocate(self.__get_used_vmids)
+
+    def __get_used_vmids(self) -> List[int]:
+        resources = self.__execute_proxmox_request(
+            url="cluster/resources",
+            parameters={"type": "vm"},
+            r_type=HttpRequestType.GET
+        )
+        return [int(resource["vmid"]) for resource in resources]
 
     def __get_storage_path(self, storage_id: str):
         storages = self.__execute_proxmox_request(
@@ -516,8 +535,58 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
     def __load_cloud_init(self, cloud_init: str, cloud_init_path: str) -> None:
         self.__execute_ssh_command(f"echo '{cloud_init}' > {cloud_init_path}")
 
+    def __get_image_storage(self) -> str:
+        """
+        Get the identifier of the storage where the cloud images are imported, used as key of the image registry
+        """
+        if self.vim_client.version >= IMPORT_URL_VERSION:
+            return f"{self.data.proxmox_node_name}/{self.vim.proxmox_parameters().proxmox_images_volume}"
+        return f"{self.data.proxmox_node_name}/{self.path}/images/0"
+
     def __download_cloud_image(self, image_url, image_name):
         # TODO seems to be supported on 9.x: https://bugzilla.proxmox.com/show_bug.cgi?id=2424
+        # The registry is shared by every VM on the VIM, only the first VM using the image pays for the import
+        storage = self.__get_image_storage()
+        if not self.vim_client.image_registry.ensure_image(
+            storage,
+            image_name,
+            lambda: self.__import_cloud_image(image_url, image_name),
+            check_function=lambda checksum: self.__is_cloud_image_current(image_url, image_name, checksum)
+        ):
+            self.logger.debug(f"Image {image_name} already present on {storage}, skipping the download")
+
+    def __is_cloud_image_current(self, image_url, image_name, checksum: Optional[str]) -> bool:
+        """
+        Check that an image already imported is still on the storage and, if its checksum is known, that the remote
+        image has not changed. Only the storage content and the remote checksum file are read.
+        """
+        if self.vim_client.version >= IMPORT_URL_VERSION:
+            contents = self.__execute_proxmox_request(
+                url=f"nodes/{self.data.proxmox_node_name}/storage/{self.vim.proxmox_parameters().proxmox_images_volume}/content",
+                r_type=HttpRequestType.GET,
+                parameters={"content": "import"}
+            )
+            if not any(content["volid"].endswith(f"import/{image_name}.qcow2") for content in contents):
+                self.logger.info(f"Image {image_name} not found on the storage anymore, it will be imported again")
+                return False
+        else:
+            try:
+                self.__execute_ssh_command(f"test -f {self.path}/images/0/{image_name}.qcow2")
+            except VirtualizationProviderProxmoxException:
+                self.logger.info(f"Image {image_name} not found on the storage anymore, it will be imported again")
+                return False
+        if checksum is not None:
+            try:
+                remote_checksum = httpx.get(f"{image_url}.SHA256SUM").content.split()[0].decode()
+            except (httpx.HTTPError, IndexError) as e:
+                self.logger.warning(f"Unable to check if the image {image_name} has changed: {str(e)}")
+                return True
+            if remote_checksum != checksum:
+                self.logger.info(f"Image {image_name} has changed on {image_url}, it will be imported again")
+                return False
+        return True
+
+    def __import_cloud_image(self, image_url, image_name) -> Optional[str]:
         if self.vim_client.version >= IMPORT_URL_VERSION:
             response = httpx.get(f"{image_url}.SHA256SUM")
             checksum = response.content.split()[0]
@@ -528,27 +597,30 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
                 node_name=self.data.proxmox_node_name,
                 parameters=download_args
             )
+            return checksum.decode()
         else:
             self.__execute_ssh_command(f'/root/scripts/image_script.sh {image_url} {self.path}/images/0/{image_name}.qcow2')
+            return None
 
     def __get_macs(self, vmid: int):
         config = self.__execute_proxmox_request(
             url=f"nodes/{self.data.proxmox_node_name}/qemu/{vmid}/config",
             r_type=HttpRequestType.GET
         )
-        for key in config.keys():
-            if re.match("^net[0-9]+$", key):
-                tmp = config[key].split(",")
-                mac = ProxmoxMac(
-                    mac=tmp[0].split("virtio=")[1].strip().lower(),
-                    net_name=tmp[1].split("bridge=")[1].strip(),
-                    hw_interface_name=key,
-                    interface_name=f"eth{key.split('net')[1]}"
-                )
-                if not str(vmid) in self.data.proxmox_macs.keys():
-                    self.data.proxmox_macs[str(vmid)] = []
-                if mac not in self.data.proxmox_macs[str(vmid)]:
-                    self.data.proxmox_macs[str(vmid)].append(mac)
+        with self.data_lock:
+            for key in config.keys():
+                if re.match("^net[0-9]+$", key):
+                    tmp = config[key].split(",")
+                    mac = ProxmoxMac(
+                        mac=tmp[0].split("virtio=")[1].strip().lower(),
+                        net_name=tmp[1].split("bridge=")[1].strip(),
+                        hw_interface_name=key,
+                        interface_name=f"eth{key.split('net')[1]}"
+                    )
+                    if not str(vmid) in self.data.proxmox_macs.keys():
+                        self.data.proxmox_macs[str(vmid)] = []
+                    if mac not in self.data.proxmox_macs[str(vmid)]:
+                        self.data.proxmox_macs[str(vmid)].append(mac)
 
     def __parse_proxmox_addresses(self, vm_resource: VmResource, vmid):
         net_informations = self.__execute_proxmox_request(
@@ -556,32 +628,33 @@ class VirtualizationProviderProxmox(VirtualizationProviderInterface):
             r_type=HttpRequestType.GET
         )
         self.__get_macs(vmid)
-        for interface in net_informations["result"]:
-            mac = interface["hardware-address"]
-            for p_mac in self.data.proxmox_macs[str(vmid)]:
-                if mac == p_mac.mac:
-                    interface_name = interface['name']
-                    ip = None
-                    cidr = None
-                    if "ip-addresses" in interface.keys():
-                        ip = interface["ip-addresses"][0]["ip-address"]
-                        prefix = interface["ip-addresses"][0]["prefix"]
-                        base_network = ipaddress.IPv4Network(f'{ip}/{prefix}', strict=False).network_address
-                        cidr = f'{base_network}/{prefix}'
-                    fixed = VmResourceNetworkInterfaceAddress(interface_name=interface_name, ip=ip, mac=mac, cidr=cidr)
-                    key = next((key for key, value in self.data.proxmox_vnet.items() if value == p_mac.net_name), None)
-
-                    if key and key not in vm_resource.network_interfaces.keys():
-                        vm_resource.network_interfaces[key] = []
-                    elif p_mac.net_name not in vm_resource.network_interfaces.keys():
-                        vm_resource.network_interfaces[p_mac.net_name] = []
-
-                    ni = VmResourceNetworkInterface(fixed=fixed)
-                    if key and ni not in vm_resource.network_interfaces[key]:
-                        vm_resource.network_interfaces[key].append(ni)
-                    elif ni not in vm_resource.network_interfaces[p_mac.net_name]:
-                        vm_resource.network_interfaces[p_mac.net_name].append(ni)
-                    continue
+        with self.data_lock:
+            for interface in net_informations["result"]:
+                mac = interface["hardware-address"]
+                for p_mac in self.data.proxmox_macs[str(vmid)]:
+                    if mac == p_mac.mac:
+                        interface_name = interface['name']
+                        ip = None
+                        cidr = None
+                        if "ip-addresses" in interface.keys():
+                            ip = interface["ip-addresses"][0]["ip-address"]
+                            prefix = interface["ip-addresses"][0]["prefix"]
+                            base_network = ipaddress.IPv4Network(f'{ip}/{prefix}', strict=False).network_address
+                            cidr = f'{base_network}/{prefix}'
+                        fixed = VmResourceNetworkInterfaceAddress(interface_name=interface_name, ip=ip, mac=mac, cidr=cidr)
+                        key = next((key for key, value in self.data.proxmox_vnet.items() if value == p_mac.net_name), None)
+
+                        if key and key not in vm_resource.network_interfaces.keys():
+                            vm_resource.network_interfaces[key] = []
+                        elif p_mac.net_name not in vm_resource.network_interfaces.keys():
+                            vm_resource.network_interfaces[p_mac.net_name] = []
+
+                        ni = VmResourceNetworkInterface(fixed=fixed)
+                        if key and ni not in vm_resource.network_interfaces[key]:
+                            vm_resource.network_interfaces[key].append(ni)
+                        elif ni not in vm_resource.network_interfaces[p_mac.net_name]:
+                            vm_resource.network_interfaces[p_mac.net_name].append(ni)
+                        continue
 
     def __get_disks_memory(self, vmid: int):
         """
@@ -1,7 +1,8 @@
 import abc
-from typing import List, Tuple, Set, Optional, Callable
+from typing import List, Tuple, Set, Optional, Callable, Sequence
 
-from nfvcl_core_models.resources import VmResource, VmResourceConfiguration, NetResource, VmStatus
+from nfvcl_core_models.resources import VmResource, VmResourceConfiguration, NetResource, VmStatus, \
+    VmResourceAnsibleConfiguration
 from nfvcl_core_models.vim.vim_models import VimModel
 from nfvcl_providers.blueprint_ng_provider_interface import BlueprintNGProviderInterface, BlueprintNGProviderData
 from nfvcl_providers.vim_clients.vim_client import VimClient
@@ -19,6 +20,8 @@ class VirtualizationProviderInterface(BlueprintNGProviderInterface):
     data: VirtualizationProviderData
     vim_client: VimClient
     vim: VimModel
+    # The Ansible configurations of multiple VMs are applied together by 'configure_vms'
+    ansible_batch_configuration: bool = False
 
     def __init__(self, area: int, blueprint_id: str, vim_client: VimClient, persistence_function: Optional[Callable] = None):
         self.vim_client = vim_client
@@ -38,6 +41,60 @@ class VirtualizationProviderInterface(BlueprintNGProviderInterface):
             raise VirtualizationProviderException("VM Resource not created")
         return {}
 
+    def can_configure_together(self, vm_resource_configuration: VmResourceConfiguration) -> bool:
+        """
+        Check if the configuration can be applied together with others by 'configure_vms'
+
+        Returns:
+            True for the Ansible configurations if the provider enabled 'ansible_batch_configuration', False otherwise
+        """
+        return self.ansible_batch_configuration and isinstance(vm_resource_configuration, VmResourceAnsibleConfiguration)
+
+    def configure_vms(self, vm_resource_configurations: Sequence[VmResourceConfiguration]) -> List[dict]:
+        """
+        Apply multiple configurations. If every configuration can be applied together (see 'can_configure_together')
+        they are applied with a single Ansible run, otherwise they are applied one at a time.
+
+        Args:
+            vm_resource_configurations: The configurations to be applied
+
+        Returns:
+            The results of the configurations, in the same order as the configurations
+        """
+        ansible_configurations = [configuration for configuration in vm_resource_configurations if self.can_configure_together(configuration) and isinstance(configuration, VmResourceAnsibleConfiguration)]
+        if len(vm_resource_configurations) > 1 and len(ansible_configurations) == len(vm_resource_configurations):
+            return self._configure_vms_ansible(ansible_configurations)
+        return [self.configure_vm(vm_resource_configuration) for vm_resource_configuration in vm_resource_configurations]
+
+    def _configure_vms_ansible(self, vm_resource_configurations: Sequence[VmResourceAnsibleConfiguration]) -> List[dict]:
+        """
+        Apply Ansible configurations to VMs created by this provider, the configurations sharing the same playbook are run together
+
+        Args:
+            vm_resource_configurations: The configurations to be applied
+
+        Returns:
+            The facts of the configurations, in the same order as the configurations
+        """
+        # The configuration utils depend on this module
+        from nfvcl_providers.virtualization.common.utils import configure_vms_ansible, VirtualizationConfiguratorException
+
+        for vm_resource_configuration in vm_resource_configurations:
+            if not vm_resource_configuration.vm_resource.created:
+                raise VirtualizationProviderException("VM Resource not created")
+        vm_names = ", ".join(configuration.vm_resource.name for configuration in vm_resource_configurations)
+        self.logger.info(f"Configuring VMs {vm_names}")
+
+        results = configure_vms_ansible(vm_resource_configurations, self.blueprint_id, logger_override=self.logger)
+        self.save_to_db()
+
+        failed = [configuration.vm_resource.name for configuration, result in zip(vm_resource_configurations, results) if result.failed]
+        if len(failed) > 0:
+            raise VirtualizationConfiguratorException(f"Error running ansible configurator on VMs {', '.join(failed)}")
+
+        self.logger.success(f"Configuring VMs {vm_names} finished")
+        return [result.fact_cache for result in results]
+
     @abc.abstractmethod
     def check_networks(self, networks_to_check: set[str]) -> Tuple[bool, Set[str]]:
         pass
@@ -54,13 +54,14 @@ def dummy_callback(result: NFVCLTaskResult):
     pass
 
 
-def generate_function_signature(function: Callable, sync=False, override_name=None, override_args=None, override_args_type: Dict[str, Any] = None, override_return_type=None, override_doc=None):
+def generate_function_signature(function: Callable, sync=False, read_only=False, override_name=None, override_args=None, override_args_type: Dict[str, Any] = None, override_return_type=None, override_doc=None):
     """
     This function it's used to generate a new function with the correct signature for FastAPI.
 
     Args:
         function: The original function that will be called by the new function.
         sync: True if the function is sync, False if it is async.
+        read_only: True if the function only reads the in-memory snapshots of the managers, it is served by the event loop.
         override_name: Override the name of the function.
         override_args: Override the arguments of the function.
         override_args_type: Override the type of the arguments of the function.
@@ -80,7 +81,7 @@ def generate_function_signature(function: Callable, sync=False, override_name=No
                 del args[arg]
 
     # This is the actual function that will be called by FastAPI
-    def new_fn(request: Request, response: Response, **kwargs):
+    def sync_fn(request: Request, response: Response, **kwargs):
         # Override the arguments value if needed
         if override_args:
             for override_arg in override_args:
@@ -106,6 +107,29 @@ def generate_function_signature(function: Callable, sync=False, override_name=No
                     response.status_code = status.HTTP_400_BAD_REQUEST
             return function_return
 
+    new_fn: Callable[..., Any]
+    # Coroutine methods (e.g. long polling) are awaited by the event loop instead of holding a thread of the pool
+    if inspect.iscoroutinefunction(function):
+        async def coroutine_fn(request: Request, response: Response, **kwargs):
+            if override_args:
+                for override_arg in override_args:
+                    kwargs[override_arg] = override_args[override_arg]
+            response.status_code = status.HTTP_200_OK
+            try:
+                return await function(**kwargs)
+            except NFVCLCoreException as caught_except:
+                raise HTTPException(status_code=caught_except.http_equivalent_code, detail=caught_except.message)
+
+        new_fn = coroutine_fn
+    # Read-only methods never block, they are executed directly by the event loop without the thread pool hop of sync routes
+    elif read_only:
+        async def inline_fn(request: Request, response: Response, **kwargs):
+            return sync_fn(request, response, **kwargs)
+
+        new_fn = inline_fn
+    else:
+        new_fn = sync_fn
+
     # Since we need to manipulate the function signature we need to create a new one
     params = []
 
@@ -245,7 +269,7 @@ if __name__ == "__main__":
                 routers_dict[nfvcl_public.section.name] = router
             router.add_api_route(
                 nfvcl_public.path,
-                generate_function_signature(method_callable, sync=nfvcl_public.sync),
+                generate_function_signature(method_callable, sync=nfvcl_public.sync, read_only=nfvcl_public.read_only),
                 methods=[nfvcl_public.method],
                 summary=nfvcl_public.summary,
                 status_code=status.HTTP_200_OK if nfvcl_public.sync else status.HTTP_202_ACCEPTED,
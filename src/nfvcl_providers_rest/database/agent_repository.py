@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional
 
 from nfvcl_core.database.database_repository import DatabaseRepository
 from nfvcl_core.managers.persistence_manager import PersistenceManager
@@ -18,6 +18,14 @@ class NFVCLProviderAgentRepository(DatabaseRepository[NFVCLProviderAgent]):
             return agent_data.resource_groups.get(rg_id)
         return None
 
-    def update_all(self, agent_data_list: List[NFVCLProviderAgent]):
-        for agent_data in agent_data_list:
-            self.collection.update_one({'uuid': agent_data.uuid}, {'$set': agent_data.model_dump()})
+    def save_resource_group(self, agent_uuid: str, resource_group: NFVCLProviderResourceGroup):
+        """
+        Save a single resource group of an agent, the agent document is created if missing
+        Args:
+            agent_uuid: The UUID of the agent
+            resource_group: The resource group to be saved
+        """
+        self.collection.update_one({'uuid': agent_uuid}, {'$set': {f'resource_groups.{resource_group.id}': resource_group.model_dump()}}, upsert=True)
+
+    def delete_resource_group(self, agent_uuid: str, rg_id: str):
+        self.collection.update_one({'uuid': agent_uuid}, {'$unset': {f'resource_groups.{rg_id}': ""}})
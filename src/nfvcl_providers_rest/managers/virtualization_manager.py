@@ -1,5 +1,5 @@
 import threading
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from nfvcl_core.managers.generic_manager import GenericManager
 from nfvcl_core.managers.task_manager import TaskManager
@@ -29,14 +29,23 @@ class VirtualizationManager(GenericManager):
         # We keep a copy of the data here to avoid multiple db calls and race conditions
         self.agent_data_lock: threading.Lock = threading.Lock()
         self.agents_data: Dict[str, NFVCLProviderAgent] = {}
+        # Locks of the single resource groups, (agent uuid, resource group id) -> lock
+        self._resource_group_locks: Dict[Tuple[str, str], threading.RLock] = {}
         # Load the agent data from the db
         for agent in self._agent_repository.get_all():
             self.agents_data[agent.uuid] = agent
 
-    def update_agent_data_db(self):
-        self.logger.debug("Updating agent data in db")
+    def _resource_group_lock(self, rg_id: str, agent_uuid: str) -> threading.RLock:
         with self.agent_data_lock:
-            self._agent_repository.update_all(list(self.agents_data.values()))
+            return self._resource_group_locks.setdefault((agent_uuid, rg_id), threading.RLock())
+
+    def update_resource_group_db(self, rg_id: str, agent_uuid: str):
+        """
+        Save a resource group of an agent in the db, the other resource groups are not written
+        """
+        self.logger.debug(f"Updating resource group {rg_id} of agent {agent_uuid} in db")
+        with self._resource_group_lock(rg_id, agent_uuid):
+            self._agent_repository.save_resource_group(agent_uuid, self._get_or_create_resource_group(rg_id, agent_uuid))
 
     def _get_or_create_resource_group(self, rg_id: str, agent_uuid: str) -> Optional[NFVCLProviderResourceGroup]:
         with self.agent_data_lock:
@@ -68,9 +77,10 @@ class VirtualizationManager(GenericManager):
             def persistence_function():
                 provider = self.loaded_providers[vim.name][resource_group_id]
 
-                current_rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
-                current_rg.provider_data[vim.name] = provider.data
-                self.update_agent_data_db()
+                with self._resource_group_lock(resource_group_id, agent_uuid):
+                    current_rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
+                    current_rg.provider_data[vim.name] = provider.data
+                    self.update_resource_group_db(resource_group_id, agent_uuid)
 
             vim_client = self._get_vim_client(vim)
             ProviderClass: type[VirtualizationProviderInterface] = vim_type_to_provider_mapping[vim.vim_type]
@@ -100,9 +110,10 @@ class VirtualizationManager(GenericManager):
 
     def create_vm(self, vim_name: str, resource_group_id: str, vm_resource: VmResource, agent_uuid: str) -> VmResource:
         provider = self.get_virtualization_provider(vim_name, resource_group_id, agent_uuid)
-        rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
-        rg.vm_resources[vm_resource.id] = vm_resource
-        self.update_agent_data_db()
+        with self._resource_group_lock(resource_group_id, agent_uuid):
+            rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
+            rg.vm_resources[vm_resource.id] = vm_resource
+            self.update_resource_group_db(resource_group_id, agent_uuid)
         provider.create_vm(vm_resource)
         return vm_resource
 
@@ -121,11 +132,12 @@ class VirtualizationManager(GenericManager):
     def destroy_vm(self, vim_name: str, resource_group_id: str, vm_id: str, agent_uuid: str):
         rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
         provider = self.get_virtualization_provider(vim_name, resource_group_id, agent_uuid)
-        ret = rg.vm_resources.pop(vm_id, None)
+        with self._resource_group_lock(resource_group_id, agent_uuid):
+            ret = rg.vm_resources.pop(vm_id, None)
         if not ret:
             raise NFVCLCoreException(f"VM {vm_id} not found in resource group {resource_group_id}", http_equivalent_code=404)
         provider.destroy_vm(ret)
-        self.update_agent_data_db()
+        self.update_resource_group_db(resource_group_id, agent_uuid)
         return ret
 
     def configure_vm(self, vim_name: str, resource_group_id: str, vm_id: str, vm_resource_configuration: VmResourceAnsibleConfigurationSerialized, agent_uuid: str) -> dict:
@@ -179,9 +191,10 @@ class VirtualizationManager(GenericManager):
         provider.create_net(net_resource)
 
         # Store the network resource in the resource group
-        rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
-        rg.net_resources[net_resource.id] = net_resource
-        self.update_agent_data_db()
+        with self._resource_group_lock(resource_group_id, agent_uuid):
+            rg = self._get_or_create_resource_group(resource_group_id, agent_uuid)
+            rg.net_resources[net_resource.id] = net_resource
+            self.update_resource_group_db(resource_group_id, agent_uuid)
 
         self.logger.info(f"Network {net_resource.name} created")
 
@@ -206,9 +219,13 @@ class VirtualizationManager(GenericManager):
         provider = self.get_virtualization_provider(vim_name, resource_group_id, agent_uuid)
         provider.final_cleanup()
 
-        with self.agent_data_lock:
-            self.agents_data[agent_uuid].resource_groups.pop(resource_group_id, None)
-        self.update_agent_data_db()
+        with self._resource_group_lock(resource_group_id, agent_uuid):
+            with self.agent_data_lock:
+                self.agents_data[agent_uuid].resource_groups.pop(resource_group_id, None)
+            self._agent_repository.delete_resource_group(agent_uuid, resource_group_id)
+            with self.agent_data_lock:
+                # The lock is dropped together with the resource group
+                self._resource_group_locks.pop((agent_uuid, resource_group_id), None)
 
     def check_networks(self, vim_name: str, resource_group_id: str, network_check_payload: NetworkCheckPayload ,agent_uuid: str) -> NetworkCheckResponse:
         provider = self.get_virtualization_provider(vim_name, resource_group_id, agent_uuid)
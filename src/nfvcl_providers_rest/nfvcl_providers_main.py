@@ -9,7 +9,7 @@ from dependency_injector.wiring import Provide
 from nfvcl_common.utils.api_utils import HttpRequestType
 from nfvcl_common.utils.log import create_logger
 from nfvcl_common.utils.nfvcl_public_utils import NFVCLPublicSectionModel, NFVCLPublic
-from nfvcl_core.managers.task_manager import TaskManager
+from nfvcl_core.managers.task_manager import TaskManager, TaskHistoryElement
 from nfvcl_core_models.custom_types import NFVCLCoreException
 from nfvcl_core_models.pre_work import PreWorkCallbackResponse
 from nfvcl_core_models.resources import VmResource, NetResource
@@ -24,6 +24,10 @@ from nfvcl_providers_rest.managers.virtualization_manager import VirtualizationM
 from nfvcl_providers_rest.models.virtualization import VmResourceAnsibleConfigurationSerialized, AttachNetPayload, NetworkCheckPayload
 from nfvcl_providers_rest.nfvcl_providers_container import NFVCLProvidersContainer
 
+# Maximum number of seconds a request to the wait endpoint is kept open
+TASK_WAIT_MAX_TIMEOUT = 60.0
+
+
 def callback_function(event: threading.Event, namespace: Dict, msg: NFVCLTaskResult):
     namespace["msg"] = msg
     event.set()
@@ -114,7 +118,7 @@ class NFVCLProviders:
         else:
             return self._add_task_async(function, *args, **kwargs, callback=callback)
 
-    @NFVCLPublic(path="/{task_id}", section=TASK_SECTION, method=HttpRequestType.GET, sync=True)
+    @NFVCLPublic(path="/{task_id}", section=TASK_SECTION, method=HttpRequestType.GET, sync=True, read_only=True)
     def get_task_status(self, task_id: str) -> NFVCLTaskStatus:
         """
         Get the status of a task given its task_id
@@ -124,16 +128,38 @@ class NFVCLProviders:
         Args:
             task_id: ID of the task to get the status of
 
-        Returns: NFVCLTaskStatus, the "status" field can be "running" or "done"
+        Returns: NFVCLTaskStatus, the "status" field can be "queued", "running" or "done"
         """
         if task_id not in self.task_manager.task_history:
             raise NFVCLCoreException(message="Task id not found", http_equivalent_code=404)
+        return self._task_status(self.task_manager.task_history[task_id])
+
+    @NFVCLPublic(path="/{task_id}/wait", section=TASK_SECTION, method=HttpRequestType.GET, sync=True)
+    async def wait_task(self, task_id: str, timeout: float = TASK_WAIT_MAX_TIMEOUT) -> NFVCLTaskStatus:
+        """
+        Wait for the completion of a task (long polling), the status is returned as soon as the task is done or when the timeout expires
+
+        Warnings:
+            If NFVCL is restarted the task_id will be lost and the task will not be found
+        Args:
+            task_id: ID of the task to wait for
+            timeout: Maximum number of seconds to wait, limited to TASK_WAIT_MAX_TIMEOUT
+
+        Returns: NFVCLTaskStatus, the "status" field is "done" if the task completed before the timeout
+        """
+        # Awaited on the event loop, the long polls do not hold the threads serving the sync endpoints
+        task = await self.task_manager.wait_task_async(task_id, min(max(timeout, 0), TASK_WAIT_MAX_TIMEOUT))
+        if task is None:
+            raise NFVCLCoreException(message="Task id not found", http_equivalent_code=404)
+        return self._task_status(task)
+
+    def _task_status(self, task: TaskHistoryElement) -> NFVCLTaskStatus:
+        if not task.started:
+            return NFVCLTaskStatus(task_id=task.task_id, status=NFVCLTaskStatusType.QUEUED)
+        elif task.result is None:
+            return NFVCLTaskStatus(task_id=task.task_id, status=NFVCLTaskStatusType.RUNNING)
         else:
-            task = self.task_manager.task_history[task_id]
-            if task.result is None:
-                return NFVCLTaskStatus(task_id=task_id, status=NFVCLTaskStatusType.RUNNING)
-            else:
-                return NFVCLTaskStatus(task_id=task_id, status=NFVCLTaskStatusType.DONE, result=task.result.result, error=task.result.error, exception=str(task.result.exception) if task.result.exception else None)
+            return NFVCLTaskStatus(task_id=task.task_id, status=NFVCLTaskStatusType.DONE, result=task.result.result, error=task.result.error, exception=str(task.result.exception) if task.result.exception else None)
 
     @NFVCLPublic(path="/", section=VIM_SECTION, method=HttpRequestType.POST, sync=True)
     def add_vim(self, vim: VimModel, agent_uuid: Annotated[str, "header/X-NFVCL-Agent-ID"], callback=None):
@@ -12,7 +12,6 @@ from inspect import Parameter
 from pathlib import Path
 from typing import Callable, Dict
 
-import httpx
 import uvicorn
 from fastapi import APIRouter, FastAPI, Request, Depends, Body, HTTPException
 from file_read_backwards import FileReadBackwards
@@ -55,10 +54,12 @@ from nfvcl_rest.middleware.authentication_middleware import token, control_token
 from nfvcl_rest.middleware.exception_middleware import ExceptionMiddleware # Order 2 (After logger modding)
 from nfvcl_rest.models.auth import Oauth2CustomException, Oauth2Errors, OAuth2Response # Order 2 (After logger modding)
 from nfvcl_rest.models.rest import RestAnswer202, CallbackModel # Order 2 (After logger modding)
+from nfvcl_rest.callback_dispatcher import CallbackDispatcher, CallbackDispatcherMetrics # Order 2 (After logger modding)
 
 ########### VARS ############
 nfvcl: NFVCL
 app: FastAPI
+callback_dispatcher: CallbackDispatcher
 logger: VerboseLogger = create_logger("NFVCL_REST")
 PY_MIN_MAJOR = 3
 PY_MIN_MINOR = 11
@@ -70,6 +71,7 @@ DEFAULT_USER = "admin"
 def call_callback_url(callback_url: str, result: NFVCLTaskResult):
     """
     This is the function that will be called by the async function to call the callback url.
+    The callback is delivered by the CallbackDispatcher, the calling worker is not blocked by the HTTP request.
     Args:
         callback_url: Callback url to call
         result: Result of the operation to send to the callback
@@ -83,7 +85,7 @@ def call_callback_url(callback_url: str, result: NFVCLTaskResult):
             result=result.result if not result.error and result.result else ""
         )
 
-        httpx.post(callback_url, json=callback_model.model_dump(exclude_none=True))
+        callback_dispatcher.dispatch(callback_url, callback_model.model_dump(exclude_none=True))
     except Exception as e:
         logger.error(f"Error calling callback: {str(e)}")
 
@@ -95,13 +97,14 @@ def dummy_callback(result: NFVCLTaskResult):
     pass
 
 
-def generate_function_signature(function: Callable, sync=False, override_name=None, override_args=None, override_args_type: Dict[str, typing.Any] = None, override_return_type=None, override_doc=None):
+def generate_function_signature(function: Callable, sync=False, read_only=False, override_name=None, override_args=None, override_args_type: Dict[str, typing.Any] = None, override_return_type=None, override_doc=None):
     """
     This function it's used to generate a new function with the correct signature for FastAPI.
 
     Args:
         function: The original function that will be called by the new function.
         sync: True if the function is sync, False if it is async.
+        read_only: True if the function only reads the in-memory snapshots of the managers, it is served by the event loop.
         override_name: Override the name of the function.
         override_args: Override the arguments of the function.
         override_args_type: Override the type of the arguments of the function.
@@ -121,7 +124,7 @@ def generate_function_signature(function: Callable, sync=False, override_name=No
                 del args[arg]
 
     # This is the actual function that will be called by FastAPI
-    def new_fn(request: Request, response: Response, logged_user: str = DEFAULT_USER, **kwargs):
+    def sync_fn(request: Request, response: Response, logged_user: str = DEFAULT_USER, **kwargs):
         # Override the arguments value if needed
         if override_args:
             for override_arg in override_args:
@@ -153,6 +156,16 @@ def generate_function_signature(function: Callable, sync=False, override_name=No
                     response.status_code = status.HTTP_400_BAD_REQUEST
             return function_return
 
+    new_fn: Callable[..., typing.Any]
+    # Read-only methods never block, they are executed directly by the event loop without the thread pool hop of sync routes
+    if read_only:
+        async def inline_fn(request: Request, response: Response, **kwargs):
+            return sync_fn(request, response, **kwargs)
+
+        new_fn = inline_fn
+    else:
+        new_fn = sync_fn
+
     # Since we need to manipulate the function signature we need to create a new one
     params = []
 
@@ -286,6 +299,7 @@ async def lifespan(fastapp: FastAPI):
     mod_logger(logging.getLogger('fastapi'), remove_handlers=True, disable_propagate=True)
     yield
     # If something need to be done after shutdown of the app, it can be done here.
+    callback_dispatcher.stop()
 
 
 def check_py_version():
@@ -300,6 +314,13 @@ def check_py_version():
         exit(-1)
 
 
+def callback_metrics(logged_user: str = DEFAULT_USER) -> CallbackDispatcherMetrics:
+    """
+    Get the delivery metrics of the callbacks
+    """
+    return callback_dispatcher.get_metrics()
+
+
 def readiness():
     """
     Readiness check for the NFVCL
@@ -321,6 +342,7 @@ def setup_main_routes():
     app.add_api_route("/close", set_auth_on_api_function(close_nfvcl), methods=["POST"], status_code=status.HTTP_202_ACCEPTED)
     app.add_api_route("/logs", set_auth_on_api_function(logs), methods=["GET"], response_class=PlainTextResponse)
     app.add_api_route("/ready", readiness, methods=["GET"])
+    app.add_api_route("/callback_metrics", set_auth_on_api_function(callback_metrics), methods=["GET"])
 
 
 if __name__ == "__main__":
@@ -330,6 +352,7 @@ if __name__ == "__main__":
     configure_injection(nfvcl_rest_config)
 
     nfvcl = NFVCL()
+    callback_dispatcher = CallbackDispatcher()
 
     app = FastAPI(
         title="NFVCL",
@@ -385,7 +408,7 @@ if __name__ == "__main__":
                 routers_dict[nfvcl_public.section.name] = router
             router.add_api_route(
                 nfvcl_public.path,
-                generate_function_signature(method_callable, sync=nfvcl_public.sync),
+                generate_function_signature(method_callable, sync=nfvcl_public.sync, read_only=nfvcl_public.read_only),
                 methods=[nfvcl_public.method],
                 summary=nfvcl_public.summary,
                 status_code=status.HTTP_200_OK if nfvcl_public.sync else status.HTTP_202_ACCEPTED,
@@ -0,0 +1,165 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import httpx
+from pydantic import Field
+from verboselogs import VerboseLogger
+
+from nfvcl_common.base_model import NFVCLBaseModel
+from nfvcl_common.utils.log import create_logger
+
+
+class CallbackDispatcherMetrics(NFVCLBaseModel):
+    queued: int = Field(default=0, description="Callbacks waiting for the first delivery attempt")
+    retrying: int = Field(default=0, description="Callbacks waiting for a new delivery attempt")
+    delivered: int = Field(default=0, description="Callbacks delivered successfully")
+    failed: int = Field(default=0, description="Callbacks discarded after the last failed attempt")
+    dropped: int = Field(default=0, description="Callbacks discarded because the queue was full")
+    retries: int = Field(default=0, description="Delivery attempts after the first one")
+    latency_avg_ms: float = Field(default=0.0, description="Average time between the dispatch and the successful delivery")
+    latency_max_ms: float = Field(default=0.0, description="Maximum time between the dispatch and the successful delivery")
+
+
+class _CallbackDelivery:
+    def __init__(self, url: str, payload: dict):
+        self.url = url
+        self.payload = payload
+        self.attempts = 0
+        self.dispatch_time = time.perf_counter()
+
+
+class CallbackDispatcher:
+    """
+    Deliver the callback of the completed tasks to the OSS using a pool of threads sharing a single HTTP client.
+
+    The tasks workers only enqueue the callback and are released immediately. Failed deliveries (network errors and
+    5xx responses) are retried with exponential backoff, the queue is bounded and new callbacks are dropped when full.
+    """
+
+    def __init__(self, worker_count: int = 2, queue_size: int = 1000, max_attempts: int = 4, backoff_base: float = 1.0, backoff_max: float = 30.0, timeout: float = 10.0):
+        self.logger: VerboseLogger = create_logger(self.__class__.__name__)
+        self.queue_size = queue_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            limits=httpx.Limits(max_connections=worker_count * 2, max_keepalive_connections=worker_count * 2)
+        )
+        self._condition = threading.Condition()
+        self._queue: Deque[_CallbackDelivery] = deque()
+        # Deliveries to be retried, ordered by time of the next attempt
+        self._retries: List[Tuple[float, int, _CallbackDelivery]] = []
+        self._retry_counter = itertools.count()
+        self._running = True
+        self._metrics = CallbackDispatcherMetrics()
+        self._latency_total = 0.0
+
+        self._workers: List[threading.Thread] = []
+        for i in range(worker_count):
+            thread = threading.Thread(target=self._worker, daemon=True, name=f"CallbackWorker-{i}")
+            self._workers.append(thread)
+            thread.start()
+
+    def dispatch(self, url: str, payload: dict) -> bool:
+        """
+        Enqueue a callback to be delivered
+        Args:
+            url: The callback url
+            payload: The JSON body of the POST request
+
+        Returns:
+            True if the callback has been enqueued, False if it has been dropped because the queue is full
+        """
+        with self._condition:
+            if len(self._queue) + len(self._retries) >= self.queue_size:
+                self._metrics.dropped += 1
+                self.logger.error(f"Callback queue is full, dropping callback to {url}")
+                return False
+            self._queue.append(_CallbackDelivery(url, payload))
+            self._condition.notify()
+        return True
+
+    def get_metrics(self) -> CallbackDispatcherMetrics:
+        with self._condition:
+            metrics = self._metrics.model_copy()
+            metrics.queued = len(self._queue)
+            metrics.retrying = len(self._retries)
+        return metrics
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the dispatcher, the callbacks already queued are delivered (a single attempt) if the timeout allows it
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            # Pending retries get their last attempt now
+            while self._retries:
+                _, _, delivery = heapq.heappop(self._retries)
+                delivery.attempts = self.max_attempts - 1
+                self._queue.append(delivery)
+            self._running = False
+            self._condition.notify_all()
+        for thread in self._workers:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._client.close()
+
+    def _next_delivery(self) -> Optional[_CallbackDelivery]:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._retries and self._retries[0][0] <= now:
+                    return heapq.heappop(self._retries)[2]
+                if self._queue:
+                    return self._queue.popleft()
+                if not self._running:
+                    return None
+                self._condition.wait(self._retries[0][0] - now if self._retries else None)
+
+    def _worker(self):
+        while True:
+            delivery = self._next_delivery()
+            if delivery is None:
+                return
+            self._deliver(delivery)
+
+    def _deliver(self, delivery: _CallbackDelivery):
+        delivery.attempts += 1
+        delivered = False
+        retry = False
+        try:
+            response = self._client.post(delivery.url, json=delivery.payload)
+            if response.is_server_error:
+                retry = True
+                self.logger.warning(f"Callback to {delivery.url} failed with status {response.status_code} (attempt {delivery.attempts}/{self.max_attempts})")
+            elif response.is_client_error:
+                self.logger.error(f"Callback to {delivery.url} rejected with status {response.status_code}")
+            else:
+                delivered = True
+        except httpx.HTTPError as e:
+            retry = True
+            self.logger.warning(f"Error calling callback {delivery.url}: {str(e)} (attempt {delivery.attempts}/{self.max_attempts})")
+        except Exception as e:
+            self.logger.error(f"Error calling callback {delivery.url}: {str(e)}")
+
+        with self._condition:
+            if delivered:
+                latency = time.perf_counter() - delivery.dispatch_time
+                self._metrics.delivered += 1
+                self._latency_total += latency
+                self._metrics.latency_avg_ms = (self._latency_total / self._metrics.delivered) * 1000
+                self._metrics.latency_max_ms = max(self._metrics.latency_max_ms, latency * 1000)
+            elif not retry or delivery.attempts >= self.max_attempts or not self._running:
+                self._metrics.failed += 1
+                self.logger.error(f"Callback to {delivery.url} discarded after {delivery.attempts} attempts")
+            else:
+                self._metrics.retries += 1
+                delay = min(self.backoff_max, self.backoff_base * (2 ** (delivery.attempts - 1)))
+                heapq.heappush(self._retries, (time.monotonic() + delay, next(self._retry_counter), delivery))
+                self._condition.notify()
@@ -0,0 +1,55 @@
+import threading
+from types import SimpleNamespace
+
+from nfvcl_common.ansible_utils import AnsibleHostResult
+from nfvcl_providers.virtualization.common import utils
+
+
+def _configuration(host: str, playbook: str):
+    vm_resource = SimpleNamespace(access_ip=host, username="ubuntu", password="ubuntu", name=host)
+    return SimpleNamespace(vm_resource=vm_resource, playbook=playbook)
+
+
+def test_groups_by_playbook_and_runs_them_concurrently(monkeypatch):
+    runs = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run_batch(hosts, playbook, logger):
+        runs.append((playbook, sorted(host.host for host in hosts)))
+        if playbook in ("a", "b"):
+            # Both groups must be running at the same time to pass the barrier
+            barrier.wait()
+        return {host.host: AnsibleHostResult(host=host.host, failed=False, unreachable=False, fact_cache={"playbook": playbook}) for host in hosts}
+
+    monkeypatch.setattr(utils, "_dump_vm_playbook", lambda configuration, blueprint_id: configuration.playbook)
+    monkeypatch.setattr(utils, "wait_for_ssh_to_be_ready", lambda *args, **kwargs: True)
+    monkeypatch.setattr(utils, "run_ansible_playbook_batch", run_batch)
+
+    configurations = [_configuration("10.0.0.1", "a"), _configuration("10.0.0.2", "b"), _configuration("10.0.0.3", "a"), _configuration("10.0.0.1", "c")]
+    results = utils.configure_vms_ansible(configurations, "blue")
+
+    assert [result.fact_cache["playbook"] for result in results] == ["a", "b", "a", "c"]
+    assert sorted(runs[:2]) == [("a", ["10.0.0.1", "10.0.0.3"]), ("b", ["10.0.0.2"])]
+    # The second configuration of 10.0.0.1 runs after the first one
+    assert runs[2] == ("c", ["10.0.0.1"])
+
+
+def test_joined_group_delays_the_following_groups(monkeypatch):
+    runs = []
+    runs_lock = threading.Lock()
+
+    def run_batch(hosts, playbook, logger):
+        with runs_lock:
+            runs.append((playbook, sorted(host.host for host in hosts)))
+        return {host.host: AnsibleHostResult(host=host.host, failed=False, unreachable=False, fact_cache={"playbook": playbook}) for host in hosts}
+
+    monkeypatch.setattr(utils, "_dump_vm_playbook", lambda configuration, blueprint_id: configuration.playbook)
+    monkeypatch.setattr(utils, "wait_for_ssh_to_be_ready", lambda *args, **kwargs: True)
+    monkeypatch.setattr(utils, "run_ansible_playbook_batch", run_batch)
+
+    # The P4 group is joined by y after x:P5 has been grouped, x:P5 must still run after it
+    configurations = [_configuration("y", "P1"), _configuration("y", "P2"), _configuration("y", "P3"), _configuration("x", "P4"), _configuration("x", "P5"), _configuration("y", "P4")]
+    results = utils.configure_vms_ansible(configurations, "blue")
+
+    assert [result.fact_cache["playbook"] for result in results] == ["P1", "P2", "P3", "P4", "P5", "P4"]
+    assert runs == [("P1", ["y"]), ("P2", ["y"]), ("P3", ["y"]), ("P4", ["x", "y"]), ("P5", ["x"])]
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+from pymongo import ReplaceOne, UpdateOne
+
+from nfvcl_core.database.database_repository import DatabaseRepository
+
+
+class FakeCollection:
+    """
+    Minimal in memory collection, supporting only the operations used by incremental saves
+    """
+    def __init__(self):
+        self.documents = {}
+        self.bulk_writes = []
+
+    def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append(operations)
+        matched = upserted = 0
+        for operation in operations:
+            (field, key), = operation._filter.items()
+            if isinstance(operation, ReplaceOne):
+                if key in self.documents:
+                    matched += 1
+                else:
+                    upserted += 1
+                self.documents[key] = dict(operation._doc)
+            elif isinstance(operation, UpdateOne) and key in self.documents:
+                matched += 1
+                self.documents[key].update(operation._doc.get("$set", {}))
+        return SimpleNamespace(matched_count=matched, upserted_count=upserted)
+
+    def find(self, query, projection=None):
+        (field, condition), = query.items()
+        return [{field: key} for key in condition["$in"] if key in self.documents]
+
+
+class FakePersistenceManager:
+    write_behind_window = 0
+
+    def __init__(self):
+        self.collection = FakeCollection()
+
+    def get_collection(self, collection_name):
+        return self.collection
+
+    def register_repository(self, repository):
+        pass
+
+
+class Element(BaseModel):
+    id: str
+    value: int
+
+
+def _repository():
+    persistence_manager = FakePersistenceManager()
+    return DatabaseRepository(persistence_manager, "elements", Element), persistence_manager.collection
+
+
+class TestSaveIncremental:
+    def test_first_save_replaces_then_updates(self):
+        repository, collection = _repository()
+        repository.save_incremental('id', {"id": "a", "value": 1})
+        repository.save_incremental('id', {"id": "a", "value": 2})
+        assert isinstance(collection.bulk_writes[0][0], ReplaceOne)
+        assert isinstance(collection.bulk_writes[1][0], UpdateOne)
+        assert collection.documents["a"] == {"id": "a", "value": 2}
+
+    def test_only_missing_documents_are_rewritten(self):
+        repository, collection = _repository()
+        repository._write_behind_window = 60
+        for key in ("a", "b", "c"):
+            repository.save_incremental('id', {"id": key, "value": 1})
+        repository.flush()
+        del collection.documents["b"]
+
+        for key in ("a", "b", "c"):
+            repository.save_incremental('id', {"id": key, "value": 2})
+        repository.flush()
+
+        rewrite = collection.bulk_writes[-1]
+        assert len(rewrite) == 1
+        assert isinstance(rewrite[0], ReplaceOne) and rewrite[0]._filter == {"id": "b"}
+        assert all(document["value"] == 2 for document in collection.documents.values())
+        assert set(collection.documents.keys()) == {"a", "b", "c"}
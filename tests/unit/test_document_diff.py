@@ -0,0 +1,95 @@
+import copy
+
+from nfvcl_core.database.document_diff import compute_document_update
+
+
+def _apply(document: dict, update: dict) -> dict:
+    """
+    Apply the MongoDB update operators produced by compute_document_update to a document
+    """
+    document = copy.deepcopy(document)
+
+    def resolve(path: str):
+        parts = path.split(".")
+        container = document
+        for part in parts[:-1]:
+            container = container[int(part)] if isinstance(container, list) else container[part]
+        return container, parts[-1]
+
+    for path, value in update.get("$set", {}).items():
+        container, key = resolve(path)
+        if isinstance(container, list):
+            container[int(key)] = copy.deepcopy(value)
+        else:
+            container[key] = copy.deepcopy(value)
+    for path in update.get("$unset", {}).keys():
+        container, key = resolve(path)
+        del container[key]
+    for path, value in update.get("$push", {}).items():
+        container, key = resolve(path)
+        container[key].extend(copy.deepcopy(value["$each"]))
+    return document
+
+
+OLD = {
+    "id": "blue1",
+    "status": {"current": "deploying", "detail": "creating VMs"},
+    "state": {"vms": [{"name": "vm1", "ip": "10.0.0.1"}, {"name": "vm2", "ip": None}], "removed": 1},
+    "history": [{"op": "create"}],
+}
+
+
+class TestComputeDocumentUpdate:
+    def test_equal_documents(self):
+        assert compute_document_update(OLD, copy.deepcopy(OLD)) == {}
+
+    def test_only_changed_paths_are_set(self):
+        new = copy.deepcopy(OLD)
+        new["status"]["current"] = "idle"
+        new["state"]["vms"][1]["ip"] = "10.0.0.2"
+        update = compute_document_update(OLD, new)
+        assert update == {"$set": {"status.current": "idle", "state.vms.1.ip": "10.0.0.2"}}
+        assert _apply(OLD, update) == new
+
+    def test_removed_keys_are_unset(self):
+        new = copy.deepcopy(OLD)
+        del new["state"]["removed"]
+        update = compute_document_update(OLD, new)
+        assert update == {"$unset": {"state.removed": ""}}
+        assert _apply(OLD, update) == new
+
+    def test_appended_list_elements_are_pushed(self):
+        new = copy.deepcopy(OLD)
+        new["history"].append({"op": "day2"})
+        update = compute_document_update(OLD, new)
+        assert update == {"$push": {"history": {"$each": [{"op": "day2"}]}}}
+        assert _apply(OLD, update) == new
+
+    def test_shrunk_list_is_replaced(self):
+        new = copy.deepcopy(OLD)
+        new["state"]["vms"].pop(0)
+        update = compute_document_update(OLD, new)
+        assert update == {"$set": {"state.vms": new["state"]["vms"]}}
+        assert _apply(OLD, update) == new
+
+    def test_unsafe_keys_replace_the_whole_dict(self):
+        old = {"id": "blue1", "ips": {"10.0.0.1": "vm1"}}
+        new = {"id": "blue1", "ips": {"10.0.0.1": "vm1", "10.0.0.2": "vm2"}}
+        # Keys containing dots cannot be used in a dotted path
+        assert compute_document_update(old, new) == {"$set": {"ips": new["ips"]}}
+
+    def test_removed_unsafe_keys_replace_the_whole_dict(self):
+        old = {"id": "blue1", "ips": {"10.0.0.1": "vm1", "$ref": "vm2"}}
+        new = {"id": "blue1", "ips": {}}
+        # Unsetting "ips.10.0.0.1" would target a nested field and leave the entry in the database
+        update = compute_document_update(old, new)
+        assert update == {"$set": {"ips": {}}}
+        assert _apply(old, update) == new
+
+    def test_replaced_fields_are_not_compared(self):
+        new = copy.deepcopy(OLD)
+        update = compute_document_update(OLD, new, replaced_fields=["state"])
+        assert update == {"$set": {"state": new["state"]}}
+        del new["history"]
+        update = compute_document_update(OLD, new, replaced_fields=["history"])
+        assert update == {"$unset": {"history": ""}}
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+import pytest
+
+from nfvcl_common.utils.file_utils import get_nfvcl_tmp_folder, set_nfvcl_tmp_folder
+from nfvcl_core.utils.k8s import helm_executor
+from nfvcl_core.utils.k8s.helm_executor import get_helm_executor, close_helm_executors
+
+
+class FakeClient:
+    def __init__(self, kubeconfig):
+        self.kubeconfig = kubeconfig
+
+
+@pytest.fixture(autouse=True)
+def isolated_executors(tmp_path, monkeypatch):
+    previous_tmp_folder = get_nfvcl_tmp_folder()
+    set_nfvcl_tmp_folder(str(tmp_path))
+    # The helm executable is not needed, no operation reaches the client
+    monkeypatch.setattr(helm_executor, "Client", FakeClient)
+    monkeypatch.setattr(helm_executor, "_helm_executors", {})
+    yield
+    for executor in helm_executor._helm_executors.values():
+        executor.close()
+    set_nfvcl_tmp_folder(previous_tmp_folder)
+
+
+class TestHelmExecutorCache:
+    def test_executor_is_shared_by_the_cluster(self):
+        assert get_helm_executor("config-a", "k8s1") is get_helm_executor("config-a", "k8s1")
+        assert get_helm_executor("config-a", "k8s1") is not get_helm_executor("config-a", "k8s2")
+
+    def test_changed_credentials_close_the_old_executor(self):
+        old = get_helm_executor("config-a", "k8s1")
+        assert old.kubeconfig_path.exists()
+        new = get_helm_executor("config-b", "k8s1")
+        assert new is not old
+        old._thread.join(timeout=5)
+        assert not old._thread.is_alive()
+        assert not old.kubeconfig_path.exists()
+        assert new.kubeconfig_path.read_text() == "config-b"
+        with pytest.raises(RuntimeError):
+            old.run(asyncio.sleep(0))
+
+    def test_running_operation_completes_before_close(self):
+        executor = get_helm_executor("config-a", "k8s1")
+        started = threading.Event()
+        release = asyncio.Event()
+
+        async def operation():
+            started.set()
+            await release.wait()
+            return "done"
+
+        results = []
+        caller = threading.Thread(target=lambda: results.append(executor.run(operation())))
+        caller.start()
+        assert started.wait(timeout=5)
+        close_helm_executors("k8s1")
+        assert executor._thread.is_alive()
+        executor._loop.call_soon_threadsafe(release.set)
+        caller.join(timeout=5)
+        executor._thread.join(timeout=5)
+        assert results == ["done"]
+        assert not executor._thread.is_alive()
+        assert not executor.kubeconfig_path.exists()
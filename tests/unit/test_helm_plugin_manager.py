@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+
+from nfvcl_common.utils.log import create_logger
+from nfvcl_core.utils.k8s.helm_plugin_manager import HelmPluginManager, K8sPluginStep
+from nfvcl_core.utils.k8s.readiness_waiter import KubeReadinessKind
+from nfvcl_core_models.custom_types import NFVCLCoreException
+from nfvcl_core_models.plugin_k8s_model import K8sPluginName, K8sPluginAdditionalData, K8sPluginInstallStatus
+
+
+class FakeKubeUtils:
+    def __init__(self, ready: bool = True):
+        self.ready = ready
+        self.waited = []
+
+    def wait_for_resources_to_be_ready(self, namespace, targets):
+        self.waited.append((namespace, targets))
+        return {(target.kind, target.name): self.ready for target in targets}
+
+
+class FakeHelmPluginManager(HelmPluginManager):
+    """
+    Plugin manager that records the installation order instead of reaching a cluster
+    """
+
+    def __init__(self, installed=(), failing=(), ready: bool = True):
+        self.context_name = "test"
+        self.logger = create_logger(self.__class__.__name__)
+        self.kube_utils = FakeKubeUtils(ready)
+        self.installed = list(installed)
+        self.failing = set(failing)
+        self.install_order = []
+        self._order_lock = threading.Lock()
+
+    def get_installed_plugins(self):
+        return list(self.installed)
+
+    def _fake_install(self, name: K8sPluginName):
+        with self._order_lock:
+            self.install_order.append(name)
+        if name in self.failing:
+            raise RuntimeError(f"{name.value} exploded")
+
+    def _install_flannel(self, plugin_data):
+        self._fake_install(K8sPluginName.FLANNEL)
+
+    def _install_calico(self, plugin_data):
+        self._fake_install(K8sPluginName.CALICO)
+
+    def _install_openebs(self):
+        self._fake_install(K8sPluginName.OPEN_EBS)
+
+    def _install_multus(self, plugin_data):
+        self._fake_install(K8sPluginName.MULTUS)
+
+    def _install_metallb(self, plugin_data):
+        self._fake_install(K8sPluginName.METALLB)
+
+    def _install_cert_manager(self, plugin_data):
+        self._fake_install(K8sPluginName.CERT_MANAGER)
+
+    def _install_nfvcl_webhook(self, plugin_data):
+        self._fake_install(K8sPluginName.NFVCL_WEBHOOK)
+
+
+class TestPluginSteps:
+    def test_dependencies(self):
+        steps = FakeHelmPluginManager()._get_plugin_steps()
+        assert steps[K8sPluginName.FLANNEL].requires == []
+        assert steps[K8sPluginName.CALICO].requires == []
+        for name in [K8sPluginName.OPEN_EBS, K8sPluginName.MULTUS, K8sPluginName.METALLB, K8sPluginName.CERT_MANAGER]:
+            assert set(steps[name].requires) == {K8sPluginName.FLANNEL, K8sPluginName.CALICO}
+        assert set(steps[K8sPluginName.NFVCL_WEBHOOK].requires) == {K8sPluginName.FLANNEL, K8sPluginName.CALICO, K8sPluginName.CERT_MANAGER}
+
+    def test_calico_waits_for_its_daemon_set(self):
+        calico = FakeHelmPluginManager()._get_plugin_steps()[K8sPluginName.CALICO]
+        assert calico.readiness_namespace == "calico-system"
+        assert [(target.kind, target.name) for target in calico.readiness] == [(KubeReadinessKind.DAEMON_SET, "calico-node")]
+
+    def test_steps_call_the_install_methods(self):
+        manager = FakeHelmPluginManager()
+        for name, step in manager._get_plugin_steps().items():
+            step.install(K8sPluginAdditionalData())
+            assert manager.install_order[-1] == name
+
+
+class TestInstallPluginStep:
+    def test_installed(self):
+        manager = FakeHelmPluginManager()
+        step = manager._get_plugin_steps()[K8sPluginName.CALICO]
+        result = manager._install_plugin_step(step, [], K8sPluginAdditionalData(), 0)
+        assert result.status == K8sPluginInstallStatus.INSTALLED
+        assert result.duration is not None
+        assert manager.kube_utils.waited[0][0] == "calico-system"
+
+    def test_install_error_is_returned(self):
+        manager = FakeHelmPluginManager(failing=[K8sPluginName.FLANNEL])
+        step = manager._get_plugin_steps()[K8sPluginName.FLANNEL]
+        result = manager._install_plugin_step(step, [], K8sPluginAdditionalData(), 0)
+        assert result.status == K8sPluginInstallStatus.FAILED
+        assert "flannel exploded" in result.error.lower()
+
+    def test_resources_not_ready(self):
+        manager = FakeHelmPluginManager(ready=False)
+        step = manager._get_plugin_steps()[K8sPluginName.CALICO]
+        result = manager._install_plugin_step(step, [], K8sPluginAdditionalData(), 0)
+        assert result.status == K8sPluginInstallStatus.FAILED
+        assert "calico-node" in result.error
+
+    def test_step_without_readiness_does_not_wait(self):
+        manager = FakeHelmPluginManager()
+        step = K8sPluginStep(K8sPluginName.MULTUS, manager._install_multus)
+        assert manager._install_plugin_step(step, [], K8sPluginAdditionalData(), 0).status == K8sPluginInstallStatus.INSTALLED
+        assert manager.kube_utils.waited == []
+
+
+class TestInstallPlugins:
+    def test_required_plugins_are_installed_first(self):
+        manager = FakeHelmPluginManager()
+        report = manager.install_plugins([K8sPluginName.NFVCL_WEBHOOK, K8sPluginName.METALLB, K8sPluginName.CERT_MANAGER, K8sPluginName.FLANNEL], K8sPluginAdditionalData())
+        assert [result.name for result in report.plugins] == [K8sPluginName.NFVCL_WEBHOOK, K8sPluginName.METALLB, K8sPluginName.CERT_MANAGER, K8sPluginName.FLANNEL]
+        assert all(result.status == K8sPluginInstallStatus.INSTALLED for result in report.plugins)
+        order = manager.install_order
+        assert order[0] == K8sPluginName.FLANNEL
+        assert order.index(K8sPluginName.CERT_MANAGER) < order.index(K8sPluginName.NFVCL_WEBHOOK)
+        webhook = next(result for result in report.plugins if result.name == K8sPluginName.NFVCL_WEBHOOK)
+        assert set(webhook.requires) == {K8sPluginName.FLANNEL, K8sPluginName.CERT_MANAGER}
+
+    def test_already_installed_requirements_are_not_waited(self):
+        manager = FakeHelmPluginManager(installed=[K8sPluginName.FLANNEL])
+        report = manager.install_plugins([K8sPluginName.FLANNEL, K8sPluginName.MULTUS], K8sPluginAdditionalData())
+        assert [result.status for result in report.plugins] == [K8sPluginInstallStatus.ALREADY_INSTALLED, K8sPluginInstallStatus.INSTALLED]
+        assert report.plugins[1].requires == []
+        assert manager.install_order == [K8sPluginName.MULTUS]
+
+    def test_unsupported_plugin(self):
+        manager = FakeHelmPluginManager()
+        report = manager.install_plugins([K8sPluginName.K8S_MONITORING], K8sPluginAdditionalData())
+        assert report.plugins[0].status == K8sPluginInstallStatus.UNSUPPORTED
+        assert manager.install_order == []
+
+    def test_failure_skips_the_dependent_plugins(self):
+        manager = FakeHelmPluginManager(failing=[K8sPluginName.CERT_MANAGER])
+        with pytest.raises(NFVCLCoreException) as exception:
+            manager.install_plugins([K8sPluginName.FLANNEL, K8sPluginName.CERT_MANAGER, K8sPluginName.NFVCL_WEBHOOK, K8sPluginName.MULTUS], K8sPluginAdditionalData())
+        assert K8sPluginName.NFVCL_WEBHOOK not in manager.install_order
+        # Plugins not depending on the failed one are installed anyway
+        assert K8sPluginName.MULTUS in manager.install_order
+        message = str(exception.value)
+        assert f"{K8sPluginName.NFVCL_WEBHOOK.value} (Required plugins not installed: {K8sPluginName.CERT_MANAGER.value})" in message
+        assert K8sPluginName.NFVCL_WEBHOOK.value in message
+        assert K8sPluginName.MULTUS.value not in message
+
+    def test_failed_network_plugin_skips_every_other_plugin(self):
+        manager = FakeHelmPluginManager(failing=[K8sPluginName.CALICO])
+        with pytest.raises(NFVCLCoreException) as exception:
+            manager.install_plugins([K8sPluginName.CALICO, K8sPluginName.CERT_MANAGER, K8sPluginName.NFVCL_WEBHOOK, K8sPluginName.OPEN_EBS], K8sPluginAdditionalData())
+        assert manager.install_order == [K8sPluginName.CALICO]
+        for name in [K8sPluginName.CERT_MANAGER, K8sPluginName.NFVCL_WEBHOOK, K8sPluginName.OPEN_EBS]:
+            assert name.value in str(exception.value)
+
+    def test_calico_and_flannel_together_are_refused(self):
+        manager = FakeHelmPluginManager(installed=[K8sPluginName.FLANNEL])
+        with pytest.raises(Exception):
+            manager.install_plugins([K8sPluginName.CALICO], K8sPluginAdditionalData())
+        assert manager.install_order == []
@@ -0,0 +1,39 @@
+import pytest
+
+from nfvcl_providers.vim_clients.vim_client import ImageRegistry
+
+
+class TestImageRegistry:
+    def test_image_is_imported_once(self):
+        registry = ImageRegistry()
+        imports = []
+        assert registry.ensure_image("node/local", "ubuntu", lambda: imports.append(1) or "abc")
+        assert not registry.ensure_image("node/local", "ubuntu", lambda: imports.append(1) or "abc")
+        assert len(imports) == 1
+
+    def test_failed_check_imports_again(self):
+        registry = ImageRegistry()
+        registry.ensure_image("node/local", "ubuntu", lambda: "abc")
+        checked = []
+        assert registry.ensure_image("node/local", "ubuntu", lambda: "def", check_function=lambda checksum: checked.append(checksum) and False)
+        assert checked == ["abc"]
+        assert not registry.ensure_image("node/local", "ubuntu", lambda: "ghi", check_function=lambda checksum: checksum == "def")
+
+    def test_failed_import_is_not_registered(self):
+        registry = ImageRegistry()
+        registry.ensure_image("node/local", "ubuntu", lambda: "abc")
+
+        def failing_import():
+            raise RuntimeError("download failed")
+
+        with pytest.raises(RuntimeError):
+            registry.ensure_image("node/local", "ubuntu", failing_import, check_function=lambda checksum: False)
+        assert registry.ensure_image("node/local", "ubuntu", lambda: "abc")
+
+    def test_invalidate(self):
+        registry = ImageRegistry()
+        registry.ensure_image("node/local", "ubuntu", lambda: "abc")
+        registry.ensure_image("node/local", "debian", lambda: "def")
+        registry.invalidate("node/local", "ubuntu")
+        assert registry.ensure_image("node/local", "ubuntu", lambda: "abc")
+        assert not registry.ensure_image("node/local", "debian", lambda: "def")
@@ -0,0 +1,110 @@
+import pytest
+
+from nfvcl_core_models.network.ipam_index import IntervalSet, RangeIndex, IPUsageBitmap
+from nfvcl_core_models.network.network_models import NetworkModel, IPv4ReservedRange, IPv4Pool, NetworkTypeEnum, SerializableIPv4Network, SerializableIPv4Address
+
+
+class TestIntervalSet:
+    def test_add_merges_overlapping_and_adjacent(self):
+        intervals = IntervalSet([(10, 20), (30, 40)])
+        intervals.add(21, 25)
+        assert list(intervals) == [(10, 25), (30, 40)]
+        intervals.add(26, 29)
+        assert list(intervals) == [(10, 40)]
+        assert intervals.size() == 31
+
+    def test_remove_splits(self):
+        intervals = IntervalSet([(10, 40)])
+        intervals.remove(20, 25)
+        assert list(intervals) == [(10, 19), (26, 40)]
+        assert intervals.find(22) is None
+        assert intervals.find(30) == (26, 40)
+
+    def test_overlaps(self):
+        intervals = IntervalSet([(10, 20)])
+        assert intervals.overlaps(5, 10)
+        assert intervals.overlaps(0, 100)
+        assert not intervals.overlaps(21, 30)
+        assert not intervals.overlaps(0, 9)
+
+    def test_gaps(self):
+        intervals = IntervalSet([(10, 20), (30, 40)])
+        assert list(intervals.gaps(0, 50)) == [(0, 9), (21, 29), (41, 50)]
+        assert list(intervals.gaps(12, 18)) == []
+
+
+class TestRangeIndex:
+    def test_add_find_remove(self):
+        index = RangeIndex[str]()
+        index.add(10, 20, "a", "A")
+        index.add(30, 40, "b", "B")
+        assert index.find_by_address(15) == "A"
+        assert index.find_by_address(25) is None
+        assert index.remove("a") == "A"
+        assert index.find_by_address(15) is None
+        assert not index.used.contains(15)
+        assert index.used.contains(35)
+
+    def test_remove_keeps_addresses_of_overlapping_range(self):
+        index = RangeIndex[str]()
+        index.add(10, 20, "inner", "inner")
+        index.add(5, 30, "outer", "outer")
+        index.remove("inner")
+        assert list(index.used) == [(5, 30)]
+        assert index.find_by_address(15) == "outer"
+
+
+class TestIPUsageBitmap:
+    def test_assign_and_release(self):
+        bitmap = IPUsageBitmap(10)
+        bitmap.set_used(0)
+        bitmap.set_used(1)
+        assert bitmap.first_free() == 2
+        bitmap.set_free(0)
+        assert bitmap.first_free() == 0
+        assert bitmap.used_count() == 1
+
+    def test_encoded_round_trip(self):
+        values = [True, False, True, True] + [False] * 9 + [True] * 8
+        bitmap = IPUsageBitmap.from_bool_list(values)
+        decoded = IPUsageBitmap.from_encoded(bitmap.to_encoded())
+        assert decoded == bitmap
+        assert decoded.to_bool_list() == values
+        assert decoded.first_free() == 1
+        assert decoded.used_count() == sum(values)
+
+    def test_extend(self):
+        bitmap = IPUsageBitmap.from_bool_list([True] * 8)
+        assert bitmap.first_free() is None
+        bitmap.extend(3)
+        assert len(bitmap) == 11
+        assert bitmap.first_free() == 8
+
+
+def _reserved_range(start: str, end: str) -> IPv4ReservedRange:
+    return IPv4ReservedRange(start=SerializableIPv4Address(start), end=SerializableIPv4Address(end), owner="test")
+
+
+class TestNetworkModelReservations:
+    def _network(self) -> NetworkModel:
+        network = NetworkModel(name="net", type=NetworkTypeEnum.vxlan, cidr=SerializableIPv4Network("10.0.0.0/24"))
+        network.allocation_pool.append(IPv4Pool(start=SerializableIPv4Address("10.0.0.10"), end=SerializableIPv4Address("10.0.0.100")))
+        return network
+
+    def test_containing_range_is_rejected(self):
+        network = self._network()
+        network.add_reserved_range(_reserved_range("10.0.0.20", "10.0.0.30"))
+        with pytest.raises(ValueError):
+            network.add_reserved_range(_reserved_range("10.0.0.10", "10.0.0.40"))
+        released = network.release_range(network.reserved_ranges[0].name)
+        assert int(released.start) == int(SerializableIPv4Address("10.0.0.20"))
+        assert not network.is_ip_reserved(SerializableIPv4Address("10.0.0.25"))
+
+    def test_reserve_range_skips_reserved_addresses(self):
+        network = self._network()
+        network.add_reserved_range(_reserved_range("10.0.0.10", "10.0.0.19"))
+        reserved = network.reserve_range("cluster", 5, "cluster")
+        assert [(str(r.start), str(r.end)) for r in reserved] == [("10.0.0.20", "10.0.0.24")]
+        network.release_range(reserved[0].name)
+        assert network.is_ip_reserved(SerializableIPv4Address("10.0.0.15"))
+        assert not network.is_ip_reserved(SerializableIPv4Address("10.0.0.20"))
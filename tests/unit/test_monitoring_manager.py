@@ -0,0 +1,106 @@
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from nfvcl_core.managers import monitoring_manager as monitoring_module
+from nfvcl_core.managers.monitoring_manager import MonitoringManager
+from nfvcl_core_models.monitoring.prometheus_model import PrometheusServerModel
+
+
+class FakeTopologyManager:
+    def __init__(self, prometheus_server: PrometheusServerModel):
+        self.prometheus_server = prometheus_server
+
+    def get_prometheus(self, prometheus_id):
+        return self.prometheus_server if prometheus_id == self.prometheus_server.id else None
+
+    def get_topology_snapshot(self):
+        return SimpleNamespace(find_prom_srv=self.get_prometheus)
+
+
+class FakeSFTP:
+    def __init__(self, writable: bool):
+        self.writable = writable
+        self.files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self, path, mode):
+        if not self.writable and path.startswith("/etc/"):
+            raise PermissionError(13, "Permission denied")
+        self.files[path] = io.StringIO()
+        return _Writer(self.files, path)
+
+    def chmod(self, path, mode):
+        pass
+
+    def posix_rename(self, source, destination):
+        self.files[destination] = self.files.pop(source)
+
+
+class _Writer:
+    def __init__(self, files, path):
+        self.files = files
+        self.path = path
+
+    def __enter__(self):
+        return self.files[self.path]
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeSSHClient:
+    def __init__(self, writable: bool, exit_status: int = 0):
+        self.sftp = FakeSFTP(writable)
+        self.exit_status = exit_status
+        self.commands = []
+        self.stdin = io.StringIO()
+
+    def open_sftp(self):
+        return self.sftp
+
+    def exec_command(self, command, timeout=None):
+        self.commands.append(command)
+        channel = SimpleNamespace(recv_exit_status=lambda: self.exit_status, shutdown_write=lambda: None)
+        stdin = SimpleNamespace(write=self.stdin.write, flush=lambda: None, channel=channel)
+        return stdin, SimpleNamespace(channel=channel), io.BytesIO(b"sudo: a password is required")
+
+
+def _manager(monkeypatch, ssh_client: FakeSSHClient, sd_file_location: str):
+    prometheus_server = PrometheusServerModel(id="prom", sd_file_location=sd_file_location)
+    monkeypatch.setattr(monitoring_module.ssh_connection_manager, "get_client", lambda *args, **kwargs: ssh_client)
+    return MonitoringManager(FakeTopologyManager(prometheus_server)), prometheus_server
+
+
+class TestPrometheusSdFileUpload:
+    def test_writable_location_uses_sftp(self, monkeypatch):
+        ssh_client = FakeSSHClient(writable=True)
+        manager, prometheus_server = _manager(monkeypatch, ssh_client, "sd_targets.yml")
+        manager.sync_prometheus_targets_to_server("prom")
+        assert "sd_targets.yml" in ssh_client.sftp.files
+        assert ssh_client.commands == []
+
+    def test_protected_location_is_written_with_sudo(self, monkeypatch):
+        ssh_client = FakeSSHClient(writable=False)
+        manager, prometheus_server = _manager(monkeypatch, ssh_client, "/etc/prometheus/sd_targets.yml")
+        manager.sync_prometheus_targets_to_server("prom")
+        assert len(ssh_client.commands) == 1
+        assert ssh_client.commands[0].startswith("sudo -S")
+        assert "/etc/prometheus/sd_targets.yml" in ssh_client.commands[0]
+        assert ssh_client.stdin.getvalue() == f"{prometheus_server.password}\n"
+
+    def test_debounced_upload_failure_reaches_the_callers(self, monkeypatch):
+        monkeypatch.setattr(monitoring_module, "PROMETHEUS_SYNC_DEBOUNCE", 0.01)
+        ssh_client = FakeSSHClient(writable=False, exit_status=1)
+        manager, prometheus_server = _manager(monkeypatch, ssh_client, "/etc/prometheus/sd_targets.yml")
+        first = manager.schedule_prometheus_targets_sync("prom")
+        second = manager.schedule_prometheus_targets_sync("prom")
+        assert first is second
+        with pytest.raises(Exception, match="password is required"):
+            first.result(timeout=5)
@@ -0,0 +1,57 @@
+from nfvcl_core.managers.performance_manager import PerformanceManager
+from nfvcl_core_models.performance import BlueprintPerformanceType
+
+
+class FakePerformanceRepository:
+    def __init__(self):
+        self.saved = []
+        self.archived = []
+
+    def update_blueprint_performance(self, blueprint_performance):
+        self.saved.append(blueprint_performance.model_copy(deep=True))
+
+    def archive_operations(self, blueprint_id, operations):
+        self.archived.extend(operations)
+
+    def flush(self, blueprint_id):
+        pass
+
+
+def performance_manager(max_operations=100):
+    manager = PerformanceManager(FakePerformanceRepository(), None, max_operations=max_operations)
+    manager.add_blueprint("bp1", "vyos")
+    return manager
+
+
+class TestEndOperation:
+    def test_completed_operation_is_persisted(self):
+        manager = performance_manager()
+        operation_id = manager.start_operation("bp1", BlueprintPerformanceType.DAY0, "create")
+        assert manager.end_operation(operation_id) >= 0
+        saved = manager._performance_repository.saved[-1]
+        assert saved.operations[0].end is not None
+        assert not saved.error
+
+    def test_failed_operation_is_persisted_with_the_error_flag(self):
+        manager = performance_manager()
+        operation_id = manager.start_operation("bp1", BlueprintPerformanceType.DAY2, "add_node")
+        manager.end_operation(operation_id, error=True)
+        saved = manager._performance_repository.saved[-1]
+        assert saved.error
+        assert saved.operations[0].end is not None
+        assert manager.operations == {}
+        assert manager.operations_blueprint == {}
+        assert manager.get_pending_operation_id("bp1") is None
+
+    def test_unknown_operation(self):
+        manager = performance_manager()
+        assert manager.end_operation(None, error=True) == 0
+        assert manager.end_operation("missing") == 0
+        assert manager._performance_repository.saved == []
+
+    def test_oldest_completed_operations_are_archived(self):
+        manager = performance_manager(max_operations=2)
+        for idx in range(3):
+            manager.end_operation(manager.start_operation("bp1", BlueprintPerformanceType.DAY2, f"op{idx}"))
+        assert [operation.op_name for operation in manager._performance_repository.archived] == ["op0"]
+        assert [operation.op_name for operation in manager.performance_dict["bp1"].operations] == ["op1", "op2"]
@@ -0,0 +1,80 @@
+import threading
+from typing import Dict, Set
+
+from nfvcl_providers.vim_clients.proxmox_vmid_allocator import ProxmoxVmidAllocator
+
+
+class FakeReservationRepository:
+    def __init__(self, reserved: Dict[str, Set[int]] = None):
+        self.reserved = reserved or {}
+
+    def get_reserved_vmids(self, vim_name: str) -> Set[int]:
+        return set(self.reserved.get(vim_name, set()))
+
+    def reserve_vmid(self, vim_name: str, vmid: int):
+        self.reserved.setdefault(vim_name, set()).add(vmid)
+
+    def release_vmid(self, vim_name: str, vmid: int):
+        self.reserved.get(vim_name, set()).discard(vmid)
+
+
+class TestProxmoxVmidAllocator:
+    def test_skips_used_vmids(self):
+        allocator = ProxmoxVmidAllocator("vim", first=100, last=105)
+        assert allocator.allocate(lambda: [100, 101, 103]) == 102
+        assert allocator.allocate(lambda: [100, 101, 103]) == 104
+
+    def test_cluster_is_loaded_once(self):
+        calls = []
+        allocator = ProxmoxVmidAllocator("vim", first=100, last=199)
+
+        def get_used_vmids():
+            calls.append(1)
+            return []
+
+        for _ in range(10):
+            allocator.allocate(get_used_vmids)
+        assert len(calls) == 1
+
+    def test_failed_creation_returns_the_vmid(self):
+        calls = []
+        allocator = ProxmoxVmidAllocator("vim", first=100, last=199)
+        vmid = allocator.allocate(lambda: calls.append(1) or [])
+        allocator.release(vmid, created=False)
+        # The VMIDs are loaded again, the failure may be caused by a VM created outside NFVCL
+        assert allocator.allocate(lambda: calls.append(1) or []) == vmid
+        assert len(calls) == 2
+
+    def test_created_vmid_is_not_reused(self):
+        allocator = ProxmoxVmidAllocator("vim", first=100, last=101, refresh_interval=0)
+        vmid = allocator.allocate(lambda: [])
+        allocator.release(vmid)
+        assert allocator.allocate(lambda: [vmid]) != vmid
+
+    def test_concurrent_allocations_are_distinct(self):
+        allocator = ProxmoxVmidAllocator("vim", first=100, last=199)
+        vmids = []
+        lock = threading.Lock()
+
+        def allocate():
+            vmid = allocator.allocate(lambda: [])
+            with lock:
+                vmids.append(vmid)
+
+        threads = [threading.Thread(target=allocate) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(vmids)) == 50
+
+    def test_reservations_survive_a_restart(self):
+        repository = FakeReservationRepository()
+        allocator = ProxmoxVmidAllocator("vim", reservation_repository=repository, first=100, last=105)
+        vmid = allocator.allocate(lambda: [])
+        assert repository.reserved["vim"] == {vmid}
+
+        # The reservation of the previous run is not handed out until the cluster has been loaded
+        restarted = ProxmoxVmidAllocator("vim", reservation_repository=repository, first=100, last=105)
+        assert restarted.allocate(lambda: [vmid]) != vmid
+        assert vmid not in repository.reserved["vim"]
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+from nfvcl_core.utils.k8s.readiness_waiter import _deployment_ready, _stateful_set_ready, _daemon_set_ready, _job_ready
+
+
+def workload(status=None, **spec):
+    """
+    Object with the spec and status fields read by the readiness predicates, the missing status fields are None
+    """
+    fields = ["observed_generation", "replicas", "updated_replicas", "ready_replicas", "desired_number_scheduled",
+              "number_ready", "updated_number_scheduled", "succeeded", "conditions"]
+    if status is not None:
+        status = SimpleNamespace(**{field: status.get(field) for field in fields})
+    return SimpleNamespace(spec=SimpleNamespace(**spec), status=status)
+
+
+class TestDeploymentReady:
+    def test_ready(self):
+        deployment = workload({"observed_generation": 3, "replicas": 2, "updated_replicas": 2, "ready_replicas": 2}, replicas=2)
+        assert _deployment_ready(deployment, 3) is True
+
+    def test_without_status(self):
+        assert _deployment_ready(workload(replicas=2), None) is None
+
+    def test_old_generation(self):
+        deployment = workload({"observed_generation": 2, "replicas": 2, "updated_replicas": 2, "ready_replicas": 2}, replicas=2)
+        assert _deployment_ready(deployment, 3) is None
+
+    def test_rolling_update_with_old_pods(self):
+        deployment = workload({"observed_generation": 3, "replicas": 3, "updated_replicas": 2, "ready_replicas": 2}, replicas=2)
+        assert _deployment_ready(deployment, 3) is None
+
+    def test_default_replicas(self):
+        deployment = workload({"replicas": 1, "updated_replicas": 1, "ready_replicas": 1}, replicas=None)
+        assert _deployment_ready(deployment, None) is True
+
+
+class TestStatefulSetReady:
+    def test_ready(self):
+        stateful_set = workload({"observed_generation": 1, "updated_replicas": 2, "ready_replicas": 2}, replicas=2)
+        assert _stateful_set_ready(stateful_set, 1) is True
+
+    def test_not_all_ready(self):
+        stateful_set = workload({"observed_generation": 1, "updated_replicas": 2, "ready_replicas": 1}, replicas=2)
+        assert _stateful_set_ready(stateful_set, 1) is None
+
+    def test_not_all_updated(self):
+        stateful_set = workload({"observed_generation": 1, "updated_replicas": 1, "ready_replicas": 2}, replicas=2)
+        assert _stateful_set_ready(stateful_set, None) is None
+
+    def test_status_not_observed(self):
+        stateful_set = workload({"updated_replicas": 2, "ready_replicas": 2}, replicas=2)
+        assert _stateful_set_ready(stateful_set, 1) is None
+
+
+class TestDaemonSetReady:
+    def test_ready(self):
+        daemon_set = workload({"observed_generation": 1, "desired_number_scheduled": 3, "number_ready": 3, "updated_number_scheduled": 3})
+        assert _daemon_set_ready(daemon_set, 1) is True
+
+    def test_pods_not_scheduled_yet(self):
+        daemon_set = workload({"observed_generation": 1, "desired_number_scheduled": 0, "number_ready": 0, "updated_number_scheduled": 0})
+        assert _daemon_set_ready(daemon_set, 1) is None
+
+    def test_not_all_updated(self):
+        daemon_set = workload({"observed_generation": 1, "desired_number_scheduled": 3, "number_ready": 3, "updated_number_scheduled": 2})
+        assert _daemon_set_ready(daemon_set, 1) is None
+
+    def test_old_generation(self):
+        daemon_set = workload({"observed_generation": 1, "desired_number_scheduled": 3, "number_ready": 3, "updated_number_scheduled": 3})
+        assert _daemon_set_ready(daemon_set, 2) is None
+
+
+class TestJobReady:
+    def test_succeeded(self):
+        assert _job_ready(workload({"succeeded": 1}, completions=None), None) is True
+
+    def test_running(self):
+        assert _job_ready(workload({}, completions=None), None) is None
+
+    def test_not_enough_completions(self):
+        assert _job_ready(workload({"succeeded": 2}, completions=3), None) is None
+
+    def test_failed(self):
+        conditions = [SimpleNamespace(type="Complete", status="False"), SimpleNamespace(type="Failed", status="True")]
+        assert _job_ready(workload({"conditions": conditions}, completions=None), None) is False
+
+    def test_without_status(self):
+        assert _job_ready(workload(completions=None), None) is None
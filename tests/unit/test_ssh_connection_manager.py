@@ -0,0 +1,65 @@
+import time
+
+import paramiko
+
+from nfvcl_common.utils.ssh_utils import SSHConnectionManager
+
+
+class FakeChannel:
+    def close(self):
+        pass
+
+
+class FakeTransport:
+    def __init__(self, answering: bool):
+        self.answering = answering
+
+    def is_active(self):
+        return True
+
+    def send_ignore(self):
+        pass
+
+    def open_session(self, timeout=None):
+        if not self.answering:
+            raise paramiko.SSHException("Timeout opening channel.")
+        return FakeChannel()
+
+
+class FakeClient:
+    def __init__(self, answering: bool = True):
+        self.transport = FakeTransport(answering)
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+
+
+class TestSSHConnectionManager:
+    def test_round_trip_detects_dead_host(self):
+        manager = SSHConnectionManager()
+        client = FakeClient(answering=False)
+        # Queuing a message on the transport does not notice that the host is not answering
+        assert manager._is_alive(client)
+        assert not manager._is_alive(client, round_trip_timeout=1)
+        assert manager._is_alive(FakeClient(), round_trip_timeout=1)
+
+    def test_idle_connections_are_evicted_periodically(self):
+        manager = SSHConnectionManager(persist=0.05)
+        client = FakeClient()
+        with manager._lock:
+            manager._clients[("10.0.0.1", 22, "ubuntu")] = (client, time.monotonic())
+            manager._schedule_eviction()
+        deadline = time.monotonic() + 5
+        while not client.closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.closed
+        assert len(manager._clients) == 0
+        # The timer stops when there are no more connections
+        deadline = time.monotonic() + 5
+        while manager._eviction_timer is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager._eviction_timer is None
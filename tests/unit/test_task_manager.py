@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+
+from nfvcl_core.managers.task_manager import TaskManager
+from nfvcl_core_models.task import NFVCLTask, NFVCLTaskLane
+
+
+def _noop():
+    return None
+
+
+def _task(lane: NFVCLTaskLane = NFVCLTaskLane.DAY2, key: str = None) -> NFVCLTask:
+    return NFVCLTask(_noop, None, lane=lane, serialization_key=key)
+
+
+def _scheduler(worker_count: int = 2) -> TaskManager:
+    """
+    A TaskManager without worker threads, the tasks are picked by the test
+    """
+    manager = TaskManager.__new__(TaskManager)
+    manager.start_workers = lambda: None
+    manager.__init__(worker_count, 0)
+    return manager
+
+
+class TestTaskScheduling:
+    def test_lane_priority(self):
+        manager = _scheduler()
+        day0 = _task(NFVCLTaskLane.DAY0)
+        day2 = _task(NFVCLTaskLane.DAY2)
+        read = _task(NFVCLTaskLane.READ)
+        for task in (day0, day2, read):
+            manager.add_task(task)
+        with manager._condition:
+            assert manager._next_task(manager.LANE_PRIORITY) is read
+            assert manager._next_task(manager.LANE_PRIORITY) is day2
+            assert manager._next_task(manager.LANE_PRIORITY) is day0
+            assert manager._next_task(manager.LANE_PRIORITY) is None
+
+    def test_read_worker_only_serves_read_lane(self):
+        manager = _scheduler()
+        manager.add_task(_task(NFVCLTaskLane.DAY2))
+        with manager._condition:
+            assert manager._next_task([NFVCLTaskLane.READ]) is None
+
+    def test_day0_never_takes_every_worker(self):
+        manager = _scheduler(worker_count=2)
+        first = _task(NFVCLTaskLane.DAY0)
+        second = _task(NFVCLTaskLane.DAY0)
+        manager.add_task(first)
+        manager.add_task(second)
+        with manager._condition:
+            task = manager._next_task(manager.LANE_PRIORITY)
+            assert task is first
+            manager._start_task(task)
+            # max_day0_running is worker_count - 1
+            assert manager._next_task(manager.LANE_PRIORITY) is None
+        manager._end_task(first)
+        with manager._condition:
+            assert manager._next_task(manager.LANE_PRIORITY) is second
+
+    def test_same_key_is_serialized_in_submission_order(self):
+        manager = _scheduler(worker_count=4)
+        # The day-0 task was submitted first, the day-2 one must wait for it even if its lane has a higher priority
+        deploy = _task(NFVCLTaskLane.DAY0, key="blue1")
+        day2 = _task(NFVCLTaskLane.DAY2, key="blue1")
+        other = _task(NFVCLTaskLane.DAY2, key="blue2")
+        for task in (deploy, day2, other):
+            manager.add_task(task)
+        with manager._condition:
+            assert manager._next_task(manager.LANE_PRIORITY) is other
+            manager._start_task(other)
+            assert manager._next_task(manager.LANE_PRIORITY) is deploy
+            manager._start_task(deploy)
+            # Key blue1 is running
+            assert manager._next_task(manager.LANE_PRIORITY) is None
+        manager._end_task(deploy)
+        with manager._condition:
+            assert manager._next_task(manager.LANE_PRIORITY) is day2
+            manager._start_task(day2)
+        manager._end_task(day2)
+        manager._end_task(other)
+        assert manager._pending_keys == {}
+        assert manager._running_keys == set()
+
+    def test_metrics(self):
+        manager = _scheduler()
+        manager.add_task(_task(NFVCLTaskLane.READ))
+        manager.add_task(_task(NFVCLTaskLane.DAY0, key="blue1"))
+        metrics = manager.get_metrics()
+        assert metrics.lanes[NFVCLTaskLane.READ].queued == 1
+        assert metrics.lanes[NFVCLTaskLane.DAY0].queued == 1
+        assert metrics.busy_workers == 0
+
+
+class TestTaskExecution:
+    def test_tasks_with_same_key_never_overlap(self):
+        manager = TaskManager(worker_count=4, read_worker_count=1)
+        running = set()
+        overlaps = []
+        lock = threading.Lock()
+
+        def work(key: str):
+            with lock:
+                if key in running:
+                    overlaps.append(key)
+                running.add(key)
+            threading.Event().wait(0.01)
+            with lock:
+                running.discard(key)
+
+        task_ids = []
+        for i in range(20):
+            key = f"blue{i % 2}"
+            task_ids.append(manager.add_task(NFVCLTask(work, None, key, serialization_key=key)))
+        for task_id in task_ids:
+            assert manager.task_history[task_id].completed.wait(10)
+        manager.stop_workers()
+        assert overlaps == []
+
+    def test_next_task_with_same_key_starts_after_the_callback(self):
+        manager = TaskManager(worker_count=2, read_worker_count=0)
+        events = []
+        lock = threading.Lock()
+
+        def record(event: str):
+            with lock:
+                events.append(event)
+
+        def first_callback(result):
+            # The second task would start during this wait if the key was already released
+            threading.Event().wait(0.1)
+            record("first callback")
+
+        manager.add_task(NFVCLTask(record, first_callback, "first", serialization_key="blue"))
+        second_id = manager.add_task(NFVCLTask(record, None, "second", serialization_key="blue"))
+        assert manager.task_history[second_id].completed.wait(10)
+        manager.stop_workers()
+        assert events == ["first", "first callback", "second"]
+
+    def test_key_is_released_when_the_callback_fails(self):
+        manager = TaskManager(worker_count=2, read_worker_count=0)
+
+        def failing_callback(result):
+            raise RuntimeError("callback failed")
+
+        manager.add_task(NFVCLTask(_noop, failing_callback, serialization_key="blue"))
+        second_id = manager.add_task(NFVCLTask(_noop, None, serialization_key="blue"))
+        assert manager.task_history[second_id].completed.wait(10)
+        manager.stop_workers()
+
+    def test_wait_async(self):
+        manager = TaskManager(worker_count=1, read_worker_count=0)
+        release = threading.Event()
+        task_id = manager.add_task(NFVCLTask(release.wait, None, 10))
+
+        async def wait(timeout: float):
+            return await manager.wait_task_async(task_id, timeout)
+
+        # The task is blocked, the wait returns at the timeout
+        assert not asyncio.run(wait(0.1)).completed.is_set()
+        threading.Timer(0.1, release.set).start()
+        started = time.monotonic()
+        assert asyncio.run(wait(10)).result.result is True
+        assert time.monotonic() - started < 5
+        assert asyncio.run(manager.wait_task_async("missing", 0.1)) is None
+        manager.stop_workers()
@@ -0,0 +1,38 @@
+import pytest
+
+from nfvcl_core.managers.topology_manager import TopologyManager
+from nfvcl_core_models.topology_k8s_model import TopologyK8sModel
+from nfvcl_core_models.topology_models import TopologyModel, TopoK8SHasBlueprintException
+
+
+class FakeTopologyRepository:
+    def __init__(self, topology: TopologyModel):
+        self.topology = topology
+        self.saved_deployed_blueprints = []
+
+    def get_topology(self):
+        return self.topology
+
+    def save_k8s_deployed_blueprints(self, topology: TopologyModel, cluster_name: str):
+        self.saved_deployed_blueprints.append(list(topology.get_k8s_cluster(cluster_name).deployed_blueprints))
+
+
+@pytest.fixture
+def topology_manager():
+    topology = TopologyModel(kubernetes=[TopologyK8sModel(name="k8s1", credentials="config", areas=[1])])
+    return TopologyManager(FakeTopologyRepository(topology))
+
+
+class TestK8sDeployedBlueprints:
+    def test_blueprint_stays_until_its_last_chart_is_removed(self, topology_manager):
+        topology_manager.add_k8s_deployed_blueprint("k8s1", "bp1")
+        topology_manager.add_k8s_deployed_blueprint("k8s1", "bp1")
+
+        assert topology_manager.remove_k8s_deployed_blueprint("k8s1", "bp1")
+        assert topology_manager._topology.get_k8s_cluster("k8s1").deployed_blueprints == ["bp1"]
+        with pytest.raises(TopoK8SHasBlueprintException):
+            topology_manager._topology.del_k8s_cluster("k8s1")
+
+        assert topology_manager.remove_k8s_deployed_blueprint("k8s1", "bp1")
+        assert not topology_manager.remove_k8s_deployed_blueprint("k8s1", "bp1")
+        assert topology_manager._topology_repository.saved_deployed_blueprints == [["bp1"], ["bp1", "bp1"], ["bp1"], []]